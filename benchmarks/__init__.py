@@ -0,0 +1,8 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Performance benchmarks for pyvider-hcl."""
+
+# 📄⚙️🔚
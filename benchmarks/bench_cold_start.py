@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Cold-start benchmark: time to the first parse in a fresh process.
+
+Each scenario runs in a new interpreter, as a provider plugin would:
+
+- ``no artifact``: the serialized parser does not exist yet, so the first parse
+  constructs the grammar from scratch.
+- ``artifact``: the serialized parser exists and is loaded on first parse.
+- ``artifact + warmup``: `warmup()` runs at start-up (outside the timed region)
+  and the first request is timed on its own.
+
+Run with ``python -m benchmarks.bench_cold_start``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPEATS = 5
+
+_CHILD = """
+import json, time
+start = time.perf_counter()
+import pyvider.hcl
+imported = time.perf_counter()
+if {warm}:
+    pyvider.hcl.warmup()
+ready = time.perf_counter()
+pyvider.hcl.parse_hcl_to_cty('name = "example"\\nport = 8080\\n')
+done = time.perf_counter()
+print(json.dumps({{"import": imported - start, "warmup": ready - imported, "first_parse": done - ready}}))
+"""
+
+
+def _run(env: dict[str, str], warm: bool) -> dict[str, float]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(warm=warm)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result: dict[str, float] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+def _median_ms(samples: list[dict[str, float]], key: str) -> float:
+    return statistics.median(sample[key] for sample in samples) * 1000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        artifact = Path(tmp) / "hcl2.lark_cache"
+        env = dict(os.environ, PYVIDER_HCL_GRAMMAR_CACHE=str(artifact))
+
+        cold = []
+        for _ in range(REPEATS):
+            artifact.unlink(missing_ok=True)
+            cold.append(_run(env, warm=False))
+
+        warm_artifact = [_run(env, warm=False) for _ in range(REPEATS)]
+        warmed_up = [_run(env, warm=True) for _ in range(REPEATS)]
+
+    print(f"{'scenario':<22}{'import ms':>12}{'warmup ms':>12}{'first parse ms':>16}")
+    for name, samples in (
+        ("no artifact", cold),
+        ("artifact", warm_artifact),
+        ("artifact + warmup", warmed_up),
+    ):
+        print(
+            f"{name:<22}{_median_ms(samples, 'import'):>12.1f}"
+            f"{_median_ms(samples, 'warmup'):>12.1f}{_median_ms(samples, 'first_parse'):>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
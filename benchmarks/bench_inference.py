@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Single-pass value building against inference followed by validation.
+
+Times `auto_infer_cty_type` on the raw parse of a large nested configuration
+from `benchmarks.corpus` against pyvider-cty's two walks -- infer the type,
+then validate the data against it -- that it replaces.
+
+Run with ``python -m benchmarks.bench_inference [BLOCK_COUNT]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from benchmarks.corpus import CorpusSpec, generate_file
+from benchmarks.measure import best_time
+from pyvider.cty import CtyValue
+from pyvider.cty.conversion import infer_cty_type_from_raw
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.loader import load_raw
+
+
+def _two_pass(raw: Any) -> CtyValue[Any]:
+    return infer_cty_type_from_raw(raw).validate(raw)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    raw = load_raw(generate_file(CorpusSpec(blocks_per_file=count)))
+    assert auto_infer_cty_type(raw) == _two_pass(raw)
+
+    two_pass = best_time(lambda: _two_pass(raw))
+    single = best_time(lambda: auto_infer_cty_type(raw))
+    print(f"{count} blocks")
+    print(f"infer + validate  {two_pass * 1000:9.3f} ms")
+    print(f"single pass       {single * 1000:9.3f} ms")
+    print(f"speed-up          {two_pass / single:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
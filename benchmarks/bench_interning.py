@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Memory retained by many parsed documents, with and without key interning.
+
+Parses every file of a synthetic Terraform tree from `benchmarks.corpus`,
+whose modules share attribute names, block types and resource types,
+keeping every raw result and its CtyValue alive as a batch job would. The
+baseline goes through the loader's un-interned internals; the interned run
+through `load_raw`. Reports the memory each retains and the time each takes.
+
+Run with ``python -m benchmarks.bench_interning [MODULE_COUNT]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import sys
+from typing import Any
+
+from benchmarks.corpus import CorpusSpec, generate_corpus
+from benchmarks.measure import trace_memory
+from pyvider.hcl import warmup
+from pyvider.hcl.parser.inference import auto_infer_cty_type, clear_type_cache
+from pyvider.hcl.parser.loader import _load, load_raw
+
+
+def _retain(corpus: list[str], load: Callable[[str], Any]) -> tuple[float, int]:
+    # Each run builds its own shape-interned CtyTypes instead of reusing those
+    # an earlier run was charged for.
+    clear_type_cache()
+    traced = trace_memory(lambda: [(raw, auto_infer_cty_type(raw)) for raw in map(load, corpus)])
+    return traced.seconds, traced.retained
+
+
+def main() -> None:
+    modules = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    corpus = list(generate_corpus(CorpusSpec(modules=modules)).values())
+    warmup()
+
+    # The baseline runs first so that no key is already in the string intern
+    # table; the results of neither run are kept alive into the other.
+    plain_time, plain_retained = _retain(corpus, lambda content: _load(content, None, True, None))
+    interned_time, interned_retained = _retain(corpus, load_raw)
+    saved = plain_retained - interned_retained
+    print(f"{len(corpus)} files, {sum(map(len, corpus)) / 1024:.0f} KiB of HCL, raw data and CtyValues kept")
+    print(f"plain     {plain_time:8.2f} s  {plain_retained / 1024:10.1f} KiB")
+    print(f"interned  {interned_time:8.2f} s  {interned_retained / 1024:10.1f} KiB")
+    print(f"saved {saved / 1024:.1f} KiB ({saved / plain_retained:.1%})")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Lazy against eager CtyValue construction when only a slice is read.
+
+Builds the value for a large generated configuration from
+`benchmarks.corpus` both ways and reads two attributes of its first
+resource, reporting time and the memory the value retains. Parsing is done
+once up front, so only the conversion is measured.
+
+Run with ``python -m benchmarks.bench_lazy [BLOCK_COUNT]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import functools
+import sys
+from typing import Any
+
+from benchmarks.corpus import CorpusSpec, generate_file
+from benchmarks.measure import best_time, trace_memory
+from pyvider.hcl import LazyCtyValue, warmup
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.loader import load_raw
+
+
+def _paths(raw: dict[str, Any]) -> list[tuple[Any, ...]]:
+    """Paths to the first two attributes of the first resource."""
+    (resource_type, resources), *_ = raw["resource"][0].items()
+    (name, body), *_ = resources.items()
+    return [("resource", 0, resource_type, name, attribute) for attribute in list(body)[:2]]
+
+
+def _read(value: Any, paths: list[tuple[Any, ...]]) -> Any:
+    for path in paths:
+        functools.reduce(lambda node, key: node[key], path, value)
+    return value
+
+
+def _measure(build: Callable[[], Any], paths: list[tuple[Any, ...]]) -> tuple[float, int]:
+    seconds = best_time(lambda: _read(build(), paths))
+    return seconds, trace_memory(lambda: _read(build(), paths)).retained
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    raw = load_raw(generate_file(CorpusSpec(blocks_per_file=count)))
+    paths = _paths(raw)
+    warmup()
+    assert LazyCtyValue(raw) == auto_infer_cty_type(raw)
+
+    eager_time, eager_retained = _measure(lambda: auto_infer_cty_type(raw), paths)
+    lazy_time, lazy_retained = _measure(lambda: LazyCtyValue(raw), paths)
+    print(f"{count} blocks, reading 2 attributes")
+    print(f"eager  {eager_time * 1000:9.3f} ms  {eager_retained / 1024:9.1f} KiB")
+    print(f"lazy   {lazy_time * 1000:9.3f} ms  {lazy_retained / 1024:9.1f} KiB")
+    print(f"speed-up {eager_time / lazy_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
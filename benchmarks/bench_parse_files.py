@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Scaling benchmark for `parse_files` across worker counts.
+
+Writes a Terraform tree from `benchmarks.corpus` with modules of four small
+files and parses it with 1, 2, 4, ... workers up to the CPU count,
+reporting wall time and speed-up over serial.
+
+Run with ``python -m benchmarks.bench_parse_files [FILE_COUNT]``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import CorpusSpec, write_corpus
+from pyvider.hcl import parse_files
+
+
+def main() -> None:
+    modules = max(1, (int(sys.argv[1]) if len(sys.argv) > 1 else 1000) // 4)
+    cpus = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= cpus:
+        worker_counts.append(worker_counts[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(CorpusSpec(modules=modules, files_per_module=4, blocks_per_file=2), Path(tmp))
+        file_count = len(paths)
+
+        print(f"{file_count} files, {cpus} CPUs")
+        print(f"{'workers':>8}{'seconds':>10}{'files/s':>10}{'speed-up':>10}")
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            parse_files(paths, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8}{elapsed:>10.2f}{file_count / elapsed:>10.0f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
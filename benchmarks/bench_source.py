@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Peak memory of reading and parsing a large file, by path and as text.
+
+Writes a variables file of the requested size (100 MB by default) and runs
+each scenario in a fresh interpreter, reporting wall time, peak RSS and, for
+the reads, the peak of the Python heap. Mapped file pages count towards RSS
+but are clean page cache the kernel can drop, not heap:
+
+- ``read_text``: ``Path.read_text()``, which reads the bytes and then
+  decodes them, so both are alive at once.
+- ``read_source``: the file is memory-mapped and decoded from the mapping.
+- ``read_text + parse`` / ``parse_file``: the same, followed by parsing into
+  CtyValues through the attribute-only fast path.
+
+Run with ``python -m benchmarks.bench_source [MEGABYTES]``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+# Name, statement, and whether to trace the heap (too slow for parsing).
+_SCENARIOS = [
+    ("read_text", "Path(path).read_text(encoding='utf-8')", True),
+    ("read_source", "read_source(path)", True),
+    ("read_text + parse", "parse_hcl_to_cty(Path(path).read_text(encoding='utf-8'))", False),
+    ("parse_file", "parse_file(path)", False),
+]
+
+_CHILD = """
+import json, resource, sys, time, tracemalloc
+from pathlib import Path
+from pyvider.hcl import parse_file, parse_hcl_to_cty
+from pyvider.hcl.parser.source import read_source
+path = sys.argv[1]
+start = time.perf_counter()
+result = {statement}
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+heap = None
+if {trace}:
+    del result
+    tracemalloc.start()
+    result = {statement}
+    heap = tracemalloc.get_traced_memory()[1]
+print(json.dumps({{"seconds": elapsed, "peak": peak, "heap": heap}}))
+"""
+
+
+def write_variables(path: Path, megabytes: int) -> None:
+    """Write an attribute-only file of about `megabytes` MB."""
+    line = 'attribute_name_{i} = "some value for line {i} of the variables file"\n'
+    target = megabytes * 1_000_000
+    with path.open("w", encoding="utf-8") as handle:
+        written = i = 0
+        while written < target:
+            written += handle.write(line.format(i=i))
+            i += 1
+
+
+def _run(statement: str, trace: bool, path: Path) -> dict[str, float | None]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(statement=statement, trace=trace), str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result: dict[str, float | None] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large.tfvars"
+        write_variables(path, megabytes)
+        print(f"{path.stat().st_size / 1e6:.0f} MB variables file")
+        print(f"{'scenario':<20}{'seconds':>10}{'peak RSS MB':>14}{'peak heap MB':>14}")
+        for name, statement, trace in _SCENARIOS:
+            result = _run(statement, trace, path)
+            heap = "-" if result["heap"] is None else f"{result['heap'] / 1e6:.0f}"
+            print(f"{name:<20}{result['seconds']:>10.2f}{result['peak'] / 1e6:>14.0f}{heap:>14}")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Peak memory and time-to-first-block of `iter_blocks` against a full parse.
+
+Writes one large Terraform file from `benchmarks.corpus` and parses it both
+ways, reporting the tracemalloc peak and how long the first block took to
+arrive.
+
+Run with ``python -m benchmarks.bench_streaming [BLOCK_COUNT]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import CorpusSpec, generate_file
+from benchmarks.measure import trace_memory
+from pyvider.hcl import iter_blocks, parse_with_context, warmup
+
+
+def _measure(label: str, run: Callable[[], float]) -> None:
+    traced = trace_memory(run)
+    print(f"{label:<14}{traced.seconds:>10.2f}{traced.result:>14.3f}{traced.peak / 1024 / 1024:>12.2f}")
+
+
+def main() -> None:
+    block_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    warmup()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "generated.tf"
+        path.write_text(generate_file(CorpusSpec(blocks_per_file=block_count)), encoding="utf-8")
+        size_mb = path.stat().st_size / 1024 / 1024
+
+        def full() -> float:
+            start = time.perf_counter()
+            parse_with_context(path.read_text(encoding="utf-8"))
+            return time.perf_counter() - start
+
+        def streamed() -> float:
+            start = time.perf_counter()
+            first = None
+            with path.open(encoding="utf-8") as handle:
+                for _ in iter_blocks(handle):
+                    first = first if first is not None else time.perf_counter() - start
+            return first or 0.0
+
+        print(f"{block_count} blocks, {size_mb:.1f} MB")
+        print(f"{'mode':<14}{'seconds':>10}{'first (s)':>14}{'peak MB':>12}")
+        _measure("full parse", full)
+        _measure("iter_blocks", streamed)
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Attribute-only fast path against the full parser on typical ``.tfvars``.
+
+Times `parse_hcl_to_cty` on a variable file from `benchmarks.corpus` both
+ways: with the scanner fast path, and with the Lark parser plus type
+inference it replaces.
+
+Run with ``python -m benchmarks.bench_tfvars [ATTRIBUTE_COUNT]``.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from benchmarks.corpus import CorpusSpec, generate_tfvars
+from benchmarks.measure import best_time
+from pyvider.hcl import ParseStats, parse_hcl_to_cty, warmup
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.loader import load_raw
+
+
+def _full(content: str) -> object:
+    return auto_infer_cty_type(load_raw(content, fast_path=False))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    content = generate_tfvars(CorpusSpec(blocks_per_file=count))
+    warmup()
+    stats = ParseStats()
+    assert parse_hcl_to_cty(content, stats=stats) == _full(content)
+    assert stats.fast_path == 1
+
+    full = best_time(lambda: _full(content), number=20)
+    fast = best_time(lambda: parse_hcl_to_cty(content), number=20)
+    print(f"{count} attributes, {len(content)} bytes")
+    print(f"full parser  {full * 1000:8.3f} ms")
+    print(f"fast path    {fast * 1000:8.3f} ms")
+    print(f"speed-up     {full / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
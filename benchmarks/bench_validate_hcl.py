@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Validation-only checks against building validated values.
+
+Checks the raw parse of a large configuration from `benchmarks.corpus`
+against its inferred type with `find_violations`, and validates it into a
+value tree with the compiled validator `parse_hcl_to_cty` uses, reporting
+time and peak memory. Parsing is done once up front, so only the schema
+work is measured.
+
+Run with ``python -m benchmarks.bench_validate_hcl [BLOCK_COUNT]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import sys
+from typing import Any
+
+from benchmarks.bench_validators import make_document
+from benchmarks.measure import best_time, trace_memory
+from pyvider.hcl.parser.validators import compile_validator
+from pyvider.hcl.parser.violations import find_violations
+
+
+def _measure(run: Callable[[], Any]) -> tuple[float, int]:
+    return best_time(run), trace_memory(run).peak
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    raw, schema = make_document(count)
+    validate = compile_validator(schema)
+    assert find_violations(raw, schema) == []
+
+    build_time, build_peak = _measure(lambda: validate(raw))
+    check_time, check_peak = _measure(lambda: find_violations(raw, schema))
+    print(f"{count} blocks")
+    print(f"validate  {build_time * 1000:9.3f} ms  {build_peak / 1024:9.1f} KiB peak")
+    print(f"check     {check_time * 1000:9.3f} ms  {check_peak / 1024:9.1f} KiB peak")
+    print(f"speed-up  {build_time / check_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Compiled schema validators against generic `CtyType.validate`.
+
+Validates the raw parse of a large configuration from `benchmarks.corpus`
+against its own inferred type both ways. Parsing is done once up front, so
+only validation is measured.
+
+Run with ``python -m benchmarks.bench_validators [BLOCK_COUNT]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from benchmarks.corpus import CorpusSpec, generate_file
+from benchmarks.measure import best_time
+from pyvider.cty import CtyType
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.validators import compile_validator
+
+
+def make_document(count: int) -> tuple[Any, CtyType[Any]]:
+    """Return the raw parse of a `count`-block corpus file and the schema it conforms to."""
+    raw = load_raw(generate_file(CorpusSpec(blocks_per_file=count)))
+    return raw, auto_infer_cty_type(raw).type
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    raw, schema = make_document(count)
+    validate = compile_validator(schema)
+    assert validate(raw) == schema.validate(raw)
+
+    generic = best_time(lambda: schema.validate(raw))
+    compiled = best_time(lambda: validate(raw))
+    print(f"{count} blocks")
+    print(f"schema.validate   {generic * 1000:9.3f} ms")
+    print(f"compiled          {compiled * 1000:9.3f} ms")
+    print(f"speed-up          {generic / compiled:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+# 📄⚙️🔚
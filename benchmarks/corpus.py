@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Deterministic synthetic Terraform trees for load and scaling tests.
+
+A `CorpusSpec` describes a tree: a root module that calls ``modules`` child
+modules, each with ``files_per_module`` files of ``blocks_per_file`` blocks.
+Files named ``variables.tf`` and ``outputs.tf`` hold variable and output
+blocks; the others mix resources, data sources and locals, with nested blocks
+and object values down to ``nesting_depth`` levels. Each resource gets a
+heredoc of ``heredoc_lines`` lines, and ``expression_density`` is the share of
+attribute values written as expressions (references, function calls,
+conditionals, templates, ``for`` expressions) rather than literals.
+
+Every file is drawn from its own generator seeded with the spec's seed and
+the file's path, so the same spec always yields byte-identical files, and
+changing one count does not reshuffle files it does not touch.
+
+Run with ``python -m benchmarks.corpus OUT_DIR [--modules N] [--seed N] ...``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+
+from attrs import define, evolve, field, validators
+
+_RESOURCE_TYPES = (
+    "aws_instance",
+    "aws_s3_bucket",
+    "aws_security_group",
+    "aws_iam_role",
+    "aws_lambda_function",
+    "google_compute_instance",
+    "azurerm_storage_account",
+)
+_DATA_TYPES = ("aws_ami", "aws_vpc", "aws_subnet", "aws_caller_identity", "aws_iam_policy_document")
+_ATTRIBUTES = (
+    "name",
+    "description",
+    "instance_type",
+    "ami",
+    "bucket",
+    "region",
+    "cidr_block",
+    "enabled",
+    "retention_days",
+    "owner",
+    "environment",
+    "subnet_id",
+    "vpc_id",
+    "priority",
+    "protocol",
+    "port",
+    "tags",
+    "labels",
+    "zones",
+    "timeout",
+)
+_NESTED_BLOCKS = (
+    "ingress",
+    "egress",
+    "lifecycle_rule",
+    "network_interface",
+    "ebs_block_device",
+    "rule",
+    "condition",
+)
+_VARIABLE_TYPES = (
+    "string",
+    "number",
+    "bool",
+    "list(string)",
+    "map(string)",
+    "object({ id = string, size = number })",
+)
+_WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet")
+_MODULE_NAMES = (
+    "network",
+    "storage",
+    "compute",
+    "identity",
+    "database",
+    "queue",
+    "cache",
+    "dns",
+    "monitoring",
+)
+_FILE_NAMES = ("main.tf", "variables.tf", "outputs.tf", "network.tf", "storage.tf", "compute.tf", "iam.tf")
+_EXPRESSIONS = (
+    "var.{var}",
+    "local.{local}",
+    "{resource}.id",
+    '"${{var.{var}}}-{word}"',
+    '"{word}-${{upper(var.{var})}}-${{count.index}}"',
+    'lookup(var.{var}, "{word}", "{other}")',
+    "var.{var} ? {number} : {other_number}",
+    "[for item in var.{var} : upper(item)]",
+    "{{ for key, value in var.{var} : key => value }}",
+    "length(var.{var}) > {number}",
+    "count.index + {number}",
+    "var.{var} * {number}",
+    'merge(var.{var}, {{ Name = "{word}" }})',
+    'join(",", [var.{var}, local.{local}])',
+    "element(var.{var}, count.index)",
+    'format("%s-%d", var.{var}, {number})',
+    "try(var.{var}.{word}, null)",
+    'var.{var} == "{word}" && !var.{other_var}',
+)
+
+
+@define(frozen=True)
+class CorpusSpec:
+    """Shape of a synthetic Terraform tree."""
+
+    modules: int = field(default=3, validator=validators.ge(0))
+    files_per_module: int = field(default=4, validator=validators.ge(1))
+    blocks_per_file: int = field(default=10, validator=validators.ge(0))
+    nesting_depth: int = field(default=2, validator=validators.ge(0))
+    heredoc_lines: int = field(default=0, validator=validators.ge(0))
+    expression_density: float = field(default=0.3, validator=[validators.ge(0.0), validators.le(1.0)])
+    seed: int = 0
+
+
+def module_names(spec: CorpusSpec) -> list[str]:
+    """Directory names of the child modules, in order."""
+    return [f"{_MODULE_NAMES[i % len(_MODULE_NAMES)]}_{i}" for i in range(spec.modules)]
+
+
+def module_file_names(spec: CorpusSpec) -> list[str]:
+    """File names inside each child module, in order."""
+    names = list(_FILE_NAMES[: spec.files_per_module])
+    names.extend(f"extra_{i}.tf" for i in range(len(names), spec.files_per_module))
+    return names
+
+
+class _FileWriter:
+    """Writes one file's blocks from a generator seeded by the spec and path."""
+
+    def __init__(self, spec: CorpusSpec, path: str) -> None:
+        self.spec = spec
+        self.rng = random.Random(f"{spec.seed}/{path}")  # noqa: S311 - reproducible, not secret
+        self.lines: list[str] = []
+
+    def word(self) -> str:
+        return self.rng.choice(_WORDS)
+
+    def literal(self, depth: int) -> str:
+        kind = self.rng.randrange(6 if depth > 0 else 4)
+        if kind == 0:
+            return f'"{self.word()}-{self.rng.randrange(1000)}"'
+        if kind == 1:
+            return str(self.rng.randrange(65536))
+        if kind == 2:
+            return self.rng.choice(("true", "false"))
+        if kind == 3:
+            return "[" + ", ".join(f'"{self.word()}"' for _ in range(self.rng.randrange(1, 4))) + "]"
+        if kind == 4:
+            return "[" + ", ".join(self.value(depth - 1) for _ in range(self.rng.randrange(1, 4))) + "]"
+        keys = self.rng.sample(_WORDS, self.rng.randrange(1, 4))
+        return "{ " + ", ".join(f"{key} = {self.value(depth - 1)}" for key in keys) + " }"
+
+    def expression(self) -> str:
+        var, other_var = self.rng.sample(_WORDS, 2)
+        return self.rng.choice(_EXPRESSIONS).format(
+            var=var,
+            other_var=other_var,
+            local=self.word(),
+            resource=f"{self.rng.choice(_RESOURCE_TYPES)}.{self.word()}_{self.rng.randrange(100)}",
+            word=self.word(),
+            other=self.word(),
+            number=self.rng.randrange(1, 100),
+            other_number=self.rng.randrange(1, 100),
+        )
+
+    def value(self, depth: int) -> str:
+        if self.rng.random() < self.spec.expression_density:
+            return self.expression()
+        return self.literal(depth)
+
+    def heredoc(self, indent: str) -> str:
+        body = "".join(
+            f"{indent}  {self.word()} ${{var.{self.word()}}} line {i}\n"
+            for i in range(self.spec.heredoc_lines)
+        )
+        return f"<<-EOT\n{body}{indent}EOT"
+
+    def body(self, indent: str, depth: int, heredoc: bool = False) -> None:
+        for name in self.rng.sample(_ATTRIBUTES, self.rng.randrange(2, 7)):
+            self.lines.append(f"{indent}{name} = {self.value(depth)}")
+        if heredoc and self.spec.heredoc_lines:
+            self.lines.append(f"{indent}user_data = {self.heredoc(indent)}")
+        if depth > 0:
+            for kind in self.rng.sample(_NESTED_BLOCKS, self.rng.randrange(1, 3)):
+                self.lines.append(f"{indent}{kind} {{")
+                self.body(indent + "  ", depth - 1)
+                self.lines.append(f"{indent}}}")
+
+    def block(self, kind: str, index: int) -> None:
+        depth = self.spec.nesting_depth
+        if kind == "variable":
+            self.lines.append(f'variable "{self.word()}_{index}" {{')
+            self.lines.append(f"  type        = {self.rng.choice(_VARIABLE_TYPES)}")
+            self.lines.append(f'  description = "The {self.word()} setting"')
+            self.lines.append(f"  default     = {self.literal(depth)}")
+        elif kind == "output":
+            self.lines.append(f'output "{self.word()}_{index}" {{')
+            self.lines.append(f"  value = {self.expression()}")
+            self.lines.append(f"  sensitive = {self.rng.choice(('true', 'false'))}")
+        elif kind == "locals":
+            self.lines.append("locals {")
+            for name in self.rng.sample(_WORDS, self.rng.randrange(2, 6)):
+                self.lines.append(f"  {name}_{index} = {self.value(depth)}")
+        elif kind == "data":
+            self.lines.append(f'data "{self.rng.choice(_DATA_TYPES)}" "{self.word()}_{index}" {{')
+            self.body("  ", min(depth, 1))
+        else:
+            self.lines.append(f'resource "{self.rng.choice(_RESOURCE_TYPES)}" "{self.word()}_{index}" {{')
+            self.body("  ", depth, heredoc=True)
+        self.lines.append("}")
+        self.lines.append("")
+
+    def render(self, kinds: list[str]) -> str:
+        for index, kind in enumerate(kinds):
+            self.block(kind, index)
+        return "\n".join(self.lines)
+
+
+def _block_kinds(rng: random.Random, file_name: str, count: int) -> list[str]:
+    if file_name == "variables.tf":
+        return ["variable"] * count
+    if file_name == "outputs.tf":
+        return ["output"] * count
+    return rng.choices(("resource", "data", "locals"), weights=(7, 2, 1), k=count)
+
+
+def generate_file(spec: CorpusSpec, path: str = "main.tf") -> str:
+    """Render one file of `spec.blocks_per_file` blocks.
+
+    The block kinds follow the file name, as in a child module; `path` also
+    seeds the file's generator.
+    """
+    writer = _FileWriter(spec, path)
+    return writer.render(_block_kinds(writer.rng, Path(path).name, spec.blocks_per_file))
+
+
+def _root_main(spec: CorpusSpec) -> str:
+    writer = _FileWriter(spec, "main.tf")
+    writer.lines.extend(
+        ['terraform {\n  required_version = ">= 1.5"\n}\n', 'provider "aws" {\n  region = var.region\n}\n']
+    )
+    for name in module_names(spec):
+        writer.lines.append(f'module "{name}" {{')
+        writer.lines.append(f'  source = "./modules/{name}"')
+        for key in writer.rng.sample(_WORDS, 3):
+            writer.lines.append(f"  {key} = {writer.value(1)}")
+        writer.lines.append("}")
+        writer.lines.append("")
+    return "\n".join(writer.lines)
+
+
+def generate_tfvars(spec: CorpusSpec) -> str:
+    """Render a variable file of `spec.blocks_per_file` attributes, all literal values."""
+    writer = _FileWriter(evolve(spec, expression_density=0.0), "terraform.tfvars")
+    writer.lines.append('region = "us-east-1"')
+    for index in range(spec.blocks_per_file):
+        writer.lines.append(f"{writer.word()}_{index} = {writer.literal(spec.nesting_depth)}")
+    return "\n".join(writer.lines) + "\n"
+
+
+def generate_corpus(spec: CorpusSpec) -> dict[str, str]:
+    """Render the whole tree as relative POSIX path to file content, in a fixed order."""
+    files = {
+        "main.tf": _root_main(spec),
+        "variables.tf": generate_file(spec, "variables.tf"),
+        "terraform.tfvars": generate_tfvars(spec),
+    }
+    for module in module_names(spec):
+        for name in module_file_names(spec):
+            path = f"modules/{module}/{name}"
+            files[path] = generate_file(spec, path)
+    return files
+
+
+def write_corpus(spec: CorpusSpec, root: Path) -> list[Path]:
+    """Write the tree under `root`, overwriting existing files, and return the paths written."""
+    written = []
+    for relative, content in generate_corpus(spec).items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("out", type=Path, help="directory to write the tree into")
+    parser.add_argument("--modules", type=int, default=defaults.modules, help="child modules")
+    parser.add_argument("--files", type=int, default=defaults.files_per_module, help="files per module")
+    parser.add_argument("--blocks", type=int, default=defaults.blocks_per_file, help="blocks per file")
+    parser.add_argument(
+        "--depth", type=int, default=defaults.nesting_depth, help="nested block and value depth"
+    )
+    parser.add_argument("--heredoc-lines", type=int, default=defaults.heredoc_lines, help="lines per heredoc")
+    parser.add_argument(
+        "--expressions",
+        type=float,
+        default=defaults.expression_density,
+        help="share of values that are expressions",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="random seed")
+    args = parser.parse_args(argv)
+
+    try:
+        spec = CorpusSpec(
+            modules=args.modules,
+            files_per_module=args.files,
+            blocks_per_file=args.blocks,
+            nesting_depth=args.depth,
+            heredoc_lines=args.heredoc_lines,
+            expression_density=args.expressions,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    paths = write_corpus(spec, args.out)
+    size = sum(path.stat().st_size for path in paths)
+    print(f"wrote {len(paths)} files, {size / 1024:.1f} KiB, to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# 📄⚙️🔚
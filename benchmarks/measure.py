@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Timing and memory measurements shared by the benchmarks.
+
+`best_time` times a call with `timeit`, keeping the fastest of a few rounds.
+`trace_memory` runs a call once under `tracemalloc`; benchmarks time with
+the former and measure memory with the latter, so tracing does not skew
+their timings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import gc
+import time
+import timeit
+import tracemalloc
+from typing import Any
+
+from attrs import define
+
+
+@define(frozen=True)
+class Traced:
+    """One call made under `tracemalloc`.
+
+    Attributes:
+        result: What the call returned
+        seconds: Wall time of the call, tracing included
+        retained: Bytes still allocated when the call returned, its result
+            included
+        peak: Most bytes allocated at once during the call
+    """
+
+    result: Any
+    seconds: float
+    retained: int
+    peak: int
+
+
+def best_time(call: Callable[[], object], number: int = 5, repeat: int = 3) -> float:
+    """Seconds per call: the fastest of `repeat` rounds of `number` calls."""
+    return min(timeit.repeat(call, number=number, repeat=repeat)) / number
+
+
+def trace_memory(call: Callable[[], Any]) -> Traced:
+    """Call `call` once under `tracemalloc`, after collecting garbage."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = call()
+        seconds = time.perf_counter() - start
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Traced(result, seconds, retained, peak)
+
+
+# 📄⚙️🔚
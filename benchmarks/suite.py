@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Benchmark suite for the public entry points across corpus sizes.
+
+Each case calls one entry point on an input scaled to the corpus size: a
+document with that many blocks or list elements, a type with that many
+attributes, a variable default or resource body with that many entries.
+Module documents come from the synthetic corpus generator in
+`benchmarks.corpus`. Calls are timed one at a time until ``--min-time`` has
+passed (at least ``--min-runs`` calls), then one more call runs under
+`tracemalloc` to find its peak memory, so tracing does not skew the timings.
+Results are reported as calls and items per second, latency percentiles and
+peak memory, and can be written as JSON to compare runs.
+
+Everything is generated in-process, so the suite runs offline.
+
+Run with ``python -m benchmarks.suite [--sizes small,medium] [--cases parse]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import contextlib
+import json
+import os
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any
+
+from provide.foundation import LoggingConfig, TelemetryConfig, get_hub
+
+from benchmarks.corpus import CorpusSpec, generate_file
+from benchmarks.measure import trace_memory
+from pyvider.cty import CtyBool, CtyList, CtyMap, CtyNumber, CtyObject, CtyString
+from pyvider.hcl import (
+    auto_infer_cty_type,
+    create_resource_cty,
+    create_variable_cty,
+    parse_hcl_to_cty,
+    parse_with_context,
+    pretty_print_cty,
+    warmup,
+)
+from pyvider.hcl.factories import parse_hcl_type_string
+
+# Items (blocks, list elements, attributes) in each corpus.
+SIZES = {"small": 10, "medium": 200, "huge": 2000}
+
+SERVERS_SCHEMA = CtyObject(
+    {
+        "region": CtyString(),
+        "servers": CtyList(
+            element_type=CtyObject(
+                {
+                    "name": CtyString(),
+                    "port": CtyNumber(),
+                    "enabled": CtyBool(),
+                    "tags": CtyMap(element_type=CtyString()),
+                }
+            )
+        ),
+    }
+)
+
+_SERVER_TYPE = "list(object({name=string, port=number, enabled=bool, tags=map(string)}))"
+_ATTRIBUTE_TYPES = ("string", "number", "list(string)", "map(number)", "object({id=string, flags=list(bool)})")
+
+
+def module_document(count: int) -> str:
+    """A module file of `count` blocks, mostly resources with nested blocks, expressions and a heredoc."""
+    spec = CorpusSpec(blocks_per_file=count, nesting_depth=1, heredoc_lines=2, expression_density=0.3)
+    return generate_file(spec)
+
+
+def variables_document(count: int) -> str:
+    """A variables file with `count` servers, conforming to `SERVERS_SCHEMA`."""
+    servers = "".join(
+        f'  {{\n    name    = "server-{i}"\n    port    = {8000 + i}\n'
+        f"    enabled = {'true' if i % 2 else 'false'}\n"
+        f'    tags    = {{ team = "platform", index = "{i}" }}\n  }},\n'
+        for i in range(count)
+    )
+    return f'region = "us-east-1"\nservers = [\n{servers}]\n'
+
+
+def type_string(count: int) -> str:
+    """An object type expression with `count` attributes."""
+    attributes = ", ".join(f"attr_{i}={_ATTRIBUTE_TYPES[i % len(_ATTRIBUTE_TYPES)]}" for i in range(count))
+    return f"object({{{attributes}}})"
+
+
+def _servers(count: int) -> list[dict[str, Any]]:
+    return [
+        {"name": f"server-{i}", "port": 8000 + i, "enabled": bool(i % 2), "tags": {"team": "platform"}}
+        for i in range(count)
+    ]
+
+
+def _resource_body(count: int) -> tuple[dict[str, Any], dict[str, str]]:
+    attributes: dict[str, Any] = {}
+    schema: dict[str, str] = {}
+    for i in range(count):
+        kind = i % 3
+        attributes[f"attr_{i}"] = (f"value-{i}", i, [f"item-{i}"])[kind]
+        schema[f"attr_{i}"] = ("string", "number", "list(string)")[kind]
+    return attributes, schema
+
+
+def _pretty_print(value: Any) -> Callable[[], object]:
+    sink = Path(os.devnull).open("w")  # noqa: SIM115 - lives as long as the process
+
+    def call() -> None:
+        with contextlib.redirect_stdout(sink):
+            pretty_print_cty(value)
+
+    return call
+
+
+def _case_parse(count: int) -> Callable[[], object]:
+    document = module_document(count)
+    return lambda: parse_hcl_to_cty(document)
+
+
+def _case_parse_variables(count: int) -> Callable[[], object]:
+    document = variables_document(count)
+    return lambda: parse_hcl_to_cty(document)
+
+
+def _case_parse_variables_schema(count: int) -> Callable[[], object]:
+    document = variables_document(count)
+    return lambda: parse_hcl_to_cty(document, SERVERS_SCHEMA)
+
+
+def _case_parse_with_context(count: int) -> Callable[[], object]:
+    document = module_document(count)
+    return lambda: parse_with_context(document)
+
+
+def _case_infer(count: int) -> Callable[[], object]:
+    raw = parse_with_context(module_document(count))
+    return lambda: auto_infer_cty_type(raw)
+
+
+def _case_type_string(count: int) -> Callable[[], object]:
+    expression = type_string(count)
+    return lambda: parse_hcl_type_string(expression)
+
+
+def _case_variable(count: int) -> Callable[[], object]:
+    default = _servers(count)
+    return lambda: create_variable_cty("servers", _SERVER_TYPE, default, description="Fleet", nullable=False)
+
+
+def _case_resource(count: int) -> Callable[[], object]:
+    attributes, schema = _resource_body(count)
+    return lambda: create_resource_cty("aws_instance", "web", attributes, schema)
+
+
+def _case_pretty_print(count: int) -> Callable[[], object]:
+    return _pretty_print(parse_hcl_to_cty(module_document(count)))
+
+
+# Case name to a builder that prepares the input for a size and returns the call to time.
+CASES: dict[str, Callable[[int], Callable[[], object]]] = {
+    "parse_hcl_to_cty": _case_parse,
+    "parse_hcl_to_cty (variables)": _case_parse_variables,
+    "parse_hcl_to_cty (variables, schema)": _case_parse_variables_schema,
+    "parse_with_context": _case_parse_with_context,
+    "auto_infer_cty_type": _case_infer,
+    "parse_hcl_type_string": _case_type_string,
+    "create_variable_cty": _case_variable,
+    "create_resource_cty": _case_resource,
+    "pretty_print_cty": _case_pretty_print,
+}
+
+
+def measure(call: Callable[[], object], min_time: float, min_runs: int) -> dict[str, Any]:
+    """Time `call` repeatedly, then trace one more call for its peak memory."""
+    call()  # warm caches and imports
+    samples: list[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < min_runs or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+
+    peak = trace_memory(call).peak
+
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "runs": len(samples),
+        "mean": statistics.fmean(samples),
+        "p50": cuts[49],
+        "p90": cuts[89],
+        "p99": cuts[98],
+        "peak": peak,
+    }
+
+
+def _print_table(size: str, count: int, results: dict[str, dict[str, Any]]) -> None:
+    print(f"\n{size} ({count} items)")
+    print(
+        f"{'case':<38}{'runs':>6}{'calls/s':>10}{'items/s':>11}"
+        f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'peak KiB':>11}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<38}{result['runs']:>6}{1 / result['mean']:>10.1f}{count / result['mean']:>11.0f}"
+            f"{result['p50'] * 1000:>10.3f}{result['p90'] * 1000:>10.3f}{result['p99'] * 1000:>10.3f}"
+            f"{result['peak'] / 1024:>11.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", default=",".join(SIZES), help="comma-separated sizes to run")
+    parser.add_argument("--cases", default="", help="run only cases whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds to time each case for")
+    parser.add_argument("--min-runs", type=int, default=5, help="fewest timed calls per case")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    parser.add_argument("--log-level", default="WARNING", help="logging level while measuring")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes {unknown}; choose from {list(SIZES)}")
+    cases = {name: build for name, build in CASES.items() if args.cases in name}
+    if not cases:
+        parser.error(f"no case matches {args.cases!r}")
+
+    # Per-call debug logging would dominate the cheaper cases.
+    config = TelemetryConfig(logging=LoggingConfig(default_level=args.log_level))
+    get_hub().initialize_foundation(config, force=True)
+    warmup()
+    report: dict[str, dict[str, dict[str, Any]]] = {}
+    for size in sizes:
+        count = SIZES[size]
+        results = {name: measure(build(count), args.min_time, args.min_runs) for name, build in cases.items()}
+        report[size] = results
+        _print_table(size, count, results)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# 📄⚙️🔚
@@ -11,7 +11,7 @@ in a real-world project structure."""
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from pyvider.hcl import parse_with_context
+from pyvider.hcl import HclParsingError, parse_files, parse_with_context
 
 
 def create_sample_project(base_dir: Path) -> None:
@@ -115,14 +115,12 @@ def example_parse_all_files() -> None:
             rel_path = file.relative_to(base_dir)
             print(f"  - {rel_path}")
 
-        # Parse each file
-        for file in hcl_files:
+        # Parse all files at once; results come back in the same order
+        results = parse_files(hcl_files, workers=2, return_exceptions=True)
+        for file, result in zip(hcl_files, results, strict=True):
             rel_path = file.relative_to(base_dir)
-            try:
-                content = file.read_text()
-                parse_with_context(content, source_file=file)
-            except Exception as e:
-                print(f"  ❌ {rel_path}: {e}")
+            if isinstance(result, HclParsingError):
+                print(f"  ❌ {rel_path}: {result}")
 
 
 def example_parse_specific_files() -> None:
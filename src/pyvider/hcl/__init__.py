@@ -8,33 +8,155 @@
 This package provides HCL (HashiCorp Configuration Language) parsing capabilities
 with seamless integration into the pyvider ecosystem through the CTY type system."""
 
-from provide.foundation.utils.versioning import get_version
-
-__version__ = get_version("pyvider-hcl", caller_file=__file__)
-from pyvider.hcl.exceptions import HclError, HclParsingError
-from pyvider.hcl.factories import (
-    HclFactoryError,
-    HclTypeParsingError,
-    create_resource_cty,
-    create_variable_cty,
-)
-from pyvider.hcl.output import pretty_print_cty
-from pyvider.hcl.parser import auto_infer_cty_type, parse_hcl_to_cty, parse_with_context
-from pyvider.hcl.terraform import parse_terraform_config
+from typing import TYPE_CHECKING, Any
+
+from pyvider.hcl._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    __version__: str
+
+    from pyvider.hcl.exceptions import HclError, HclLimitError, HclParsingError, HclSchemaError
+    from pyvider.hcl.factories import (
+        HclFactoryError,
+        HclTypeParsingError,
+        create_resource_cty,
+        create_variable_cty,
+    )
+    from pyvider.hcl.output import pretty_print_cty
+    from pyvider.hcl.parser import (
+        CacheStats,
+        DiskParseCache,
+        HclBlock,
+        LazyCtyValue,
+        ParseCache,
+        ParseLimits,
+        ParseSession,
+        ParseStats,
+        RecoveredParse,
+        ReparseResult,
+        SchemaViolation,
+        aparse_directory,
+        aparse_file,
+        aparse_hcl_to_cty,
+        auto_infer_cty_type,
+        compile_validator,
+        configure_async_parsing,
+        find_violations,
+        iter_blocks,
+        parse_file,
+        parse_files,
+        parse_hcl_to_cty,
+        parse_json_to_cty,
+        parse_json_with_context,
+        parse_with_context,
+        parse_with_recovery,
+        validate_hcl,
+        warmup,
+    )
+    from pyvider.hcl.terraform import parse_terraform_config
+    from pyvider.hcl.tracing import configure_tracing
+
+_EXPORTS = {
+    "CacheStats": "pyvider.hcl.parser.cache",
+    "DiskParseCache": "pyvider.hcl.parser.disk_cache",
+    "HclBlock": "pyvider.hcl.parser.streaming",
+    "HclError": "pyvider.hcl.exceptions",
+    "HclFactoryError": "pyvider.hcl.factories.variables",
+    "HclLimitError": "pyvider.hcl.exceptions",
+    "HclParsingError": "pyvider.hcl.exceptions",
+    "HclSchemaError": "pyvider.hcl.exceptions",
+    "HclTypeParsingError": "pyvider.hcl.factories.types",
+    "LazyCtyValue": "pyvider.hcl.parser.lazy",
+    "ParseCache": "pyvider.hcl.parser.cache",
+    "ParseLimits": "pyvider.hcl.parser.limits",
+    "ParseSession": "pyvider.hcl.parser.incremental",
+    "ParseStats": "pyvider.hcl.parser.stats",
+    "RecoveredParse": "pyvider.hcl.parser.recovery",
+    "ReparseResult": "pyvider.hcl.parser.incremental",
+    "SchemaViolation": "pyvider.hcl.parser.violations",
+    "aparse_directory": "pyvider.hcl.parser.aio",
+    "aparse_file": "pyvider.hcl.parser.aio",
+    "aparse_hcl_to_cty": "pyvider.hcl.parser.aio",
+    "auto_infer_cty_type": "pyvider.hcl.parser.inference",
+    "compile_validator": "pyvider.hcl.parser.validators",
+    "configure_async_parsing": "pyvider.hcl.parser.aio",
+    "configure_tracing": "pyvider.hcl.tracing",
+    "create_resource_cty": "pyvider.hcl.factories.resources",
+    "create_variable_cty": "pyvider.hcl.factories.variables",
+    "find_violations": "pyvider.hcl.parser.violations",
+    "iter_blocks": "pyvider.hcl.parser.streaming",
+    "parse_file": "pyvider.hcl.parser.base",
+    "parse_files": "pyvider.hcl.parser.batch",
+    "parse_hcl_to_cty": "pyvider.hcl.parser.base",
+    "parse_json_to_cty": "pyvider.hcl.parser.json_syntax",
+    "parse_json_with_context": "pyvider.hcl.parser.json_syntax",
+    "parse_terraform_config": "pyvider.hcl.terraform.config",
+    "parse_with_context": "pyvider.hcl.parser.context",
+    "parse_with_recovery": "pyvider.hcl.parser.recovery",
+    "pretty_print_cty": "pyvider.hcl.output.formatting",
+    "validate_hcl": "pyvider.hcl.parser.base",
+    "warmup": "pyvider.hcl.parser.grammar",
+}
+
+_lazy_getattr, _lazy_dir = lazy_exports(__name__, _EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    # The version is read from the installed package metadata, which costs
+    # as much as an import, so it waits for first use too.
+    if name == "__version__":
+        from provide.foundation.utils.versioning import get_version
+
+        version = globals()["__version__"] = get_version("pyvider-hcl", caller_file=__file__)
+        return version
+    return _lazy_getattr(name)
+
+
+def __dir__() -> list[str]:
+    return sorted({*_lazy_dir(), "__version__"})
+
 
 __all__ = [
+    "CacheStats",
+    "DiskParseCache",
+    "HclBlock",
     "HclError",
     "HclFactoryError",
+    "HclLimitError",
     "HclParsingError",
+    "HclSchemaError",
     "HclTypeParsingError",
+    "LazyCtyValue",
+    "ParseCache",
+    "ParseLimits",
+    "ParseSession",
+    "ParseStats",
+    "RecoveredParse",
+    "ReparseResult",
+    "SchemaViolation",
     "__version__",
+    "aparse_directory",
+    "aparse_file",
+    "aparse_hcl_to_cty",
     "auto_infer_cty_type",
+    "compile_validator",
+    "configure_async_parsing",
+    "configure_tracing",
     "create_resource_cty",
     "create_variable_cty",
+    "find_violations",
+    "iter_blocks",
+    "parse_file",
+    "parse_files",
     "parse_hcl_to_cty",
+    "parse_json_to_cty",
+    "parse_json_with_context",
     "parse_terraform_config",
     "parse_with_context",
+    "parse_with_recovery",
     "pretty_print_cty",
+    "validate_hcl",
+    "warmup",
 ]
 
 # 📄⚙️🔚
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Lazy module attributes for the package ``__init__`` modules (PEP 562).
+
+A package maps each public name to the module that defines it. The module is
+imported the first time the name is looked up, and the value is then stored
+in the package so later lookups are ordinary attribute reads. Importing a
+package therefore costs only what is used from it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import importlib
+import sys
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``__getattr__`` and ``__dir__`` for `package`.
+
+    Args:
+        package: Name of the package, usually ``__name__``
+        exports: Public name to the module it is imported from
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"warmup": "pyvider.hcl.parser.grammar"})
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
+
+
+# 📄⚙️🔚
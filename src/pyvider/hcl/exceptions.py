@@ -6,9 +6,14 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from attrs import define, field
 from provide.foundation.errors import FoundationError
 
+if TYPE_CHECKING:
+    from pyvider.hcl.parser.violations import SchemaViolation
+
 
 class HclError(FoundationError):
     """Base class for errors related to HCL processing in Pyvider."""
@@ -38,4 +43,29 @@ class HclParsingError(HclError):
         return self.message
 
 
+@define(frozen=True, slots=True, auto_exc=True)
+class HclSchemaError(HclParsingError):
+    """
+    Raised when a parsed document violates its schema in one or more places.
+
+    Carries every violation found, each with its attribute path and, where
+    it could be located, its source line. `line` is that of the first
+    violation that has one.
+    """
+
+    violations: tuple[SchemaViolation, ...] = field(factory=tuple)
+
+
+@define(frozen=True, slots=True, auto_exc=True)
+class HclLimitError(HclParsingError):
+    """
+    Raised when a document exceeds a `ParseLimits` bound.
+
+    `limit` names the bound: ``"max_bytes"``, ``"max_depth"``,
+    ``"max_nodes"`` or ``"timeout"``.
+    """
+
+    limit: str | None = field(default=None)
+
+
 # 📄⚙️🔚
@@ -5,9 +5,24 @@
 
 """Factory functions for creating Terraform CTY structures."""
 
-from pyvider.hcl.factories.resources import create_resource_cty
-from pyvider.hcl.factories.types import HclTypeParsingError, parse_hcl_type_string
-from pyvider.hcl.factories.variables import HclFactoryError, create_variable_cty
+from typing import TYPE_CHECKING
+
+from pyvider.hcl._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pyvider.hcl.factories.resources import create_resource_cty
+    from pyvider.hcl.factories.types import HclTypeParsingError, parse_hcl_type_string
+    from pyvider.hcl.factories.variables import HclFactoryError, create_variable_cty
+
+_EXPORTS = {
+    "HclFactoryError": "pyvider.hcl.factories.variables",
+    "HclTypeParsingError": "pyvider.hcl.factories.types",
+    "create_resource_cty": "pyvider.hcl.factories.resources",
+    "create_variable_cty": "pyvider.hcl.factories.variables",
+    "parse_hcl_type_string": "pyvider.hcl.factories.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "HclFactoryError",
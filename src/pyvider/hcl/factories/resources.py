@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from provide.foundation import logger
@@ -15,10 +16,58 @@ from pyvider.cty import CtyList, CtyObject, CtyType, CtyValue
 from pyvider.cty.exceptions import CtyError, CtyValidationError
 from pyvider.hcl.factories.types import HclTypeParsingError, parse_hcl_type_string
 from pyvider.hcl.factories.variables import HclFactoryError
-from pyvider.hcl.parser import auto_infer_cty_type
+from pyvider.hcl.parser import auto_infer_cty_type, compile_validator
+from pyvider.hcl.parser.cache import SchemaKey
+from pyvider.hcl.tracing import traced_call
 
 
-def create_resource_cty(  # noqa: C901
+def _root_schema(r_type: str, r_name: str, attributes_type: CtyType[Any]) -> CtyObject:
+    return CtyObject(
+        {
+            "resource": CtyList(
+                element_type=CtyObject({r_type: CtyList(element_type=CtyObject({r_name: attributes_type}))})
+            )
+        }
+    )
+
+
+# Validators are compiled per schema object, so calls for the same resource
+# reuse these schemas and share their compiled validators.
+@functools.lru_cache(maxsize=256)
+def _declared_schemas(
+    r_type: str, r_name: str, attributes_schema: tuple[tuple[str, str], ...]
+) -> tuple[CtyObject, CtyObject]:
+    attributes_cty_schema: dict[str, CtyType[Any]] = {}
+    for attr_name, attr_type_str in attributes_schema:
+        try:
+            attributes_cty_schema[attr_name] = parse_hcl_type_string(attr_type_str)
+        except HclTypeParsingError as e:
+            logger.error(
+                "🏭❌ Attribute type parsing failed",
+                r_type=r_type,
+                r_name=r_name,
+                attr_name=attr_name,
+                type_str=attr_type_str,
+                error=str(e),
+            )
+            raise HclFactoryError(
+                f"Invalid type string for attribute '{attr_name}' ('{attr_type_str}') "
+                f"in resource '{r_type}.{r_name}': {e}"
+            ) from e
+    attributes_type = CtyObject(attributes_cty_schema)
+    return attributes_type, _root_schema(r_type, r_name, attributes_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _inferred_schema(r_type: str, r_name: str, attributes_type: SchemaKey) -> CtyObject:
+    # Keyed on the interned inferred type itself: an equal type listing its
+    # attributes in another order must give results in its own order.
+    assert attributes_type.schema is not None
+    return _root_schema(r_type, r_name, attributes_type.schema)
+
+
+@traced_call(schema="r_type", resource="r_name")
+def create_resource_cty(
     r_type: str,
     r_name: str,
     attributes_py: dict[str, Any],
@@ -56,28 +105,13 @@ def create_resource_cty(  # noqa: C901
         logger.error("🏭❌ Empty resource name")
         raise HclFactoryError("Resource name 'r_name' cannot be empty.")
 
-    attributes_cty_schema: dict[str, CtyType[Any]] = {}
-
     if attributes_schema_py is not None:
-        for attr_name, attr_type_str in attributes_schema_py.items():
-            try:
-                attributes_cty_schema[attr_name] = parse_hcl_type_string(attr_type_str)
-            except HclTypeParsingError as e:
-                logger.error(
-                    "🏭❌ Attribute type parsing failed",
-                    r_type=r_type,
-                    r_name=r_name,
-                    attr_name=attr_name,
-                    type_str=attr_type_str,
-                    error=str(e),
-                )
-                raise HclFactoryError(
-                    f"Invalid type string for attribute '{attr_name}' ('{attr_type_str}') "
-                    f"in resource '{r_type}.{r_name}': {e}"
-                ) from e
+        resource_attributes_obj_type, root_schema = _declared_schemas(
+            r_type, r_name, tuple(attributes_schema_py.items())
+        )
 
         for attr_name in attributes_py:
-            if attr_name not in attributes_cty_schema:
+            if attr_name not in resource_attributes_obj_type.attribute_types:
                 logger.error(
                     "🏭❌ Missing type for attribute",
                     r_type=r_type,
@@ -89,9 +123,8 @@ def create_resource_cty(  # noqa: C901
                     f"of resource '{r_type}.{r_name}'."
                 )
 
-        resource_attributes_obj_type = CtyObject(attributes_cty_schema)
         try:
-            resource_attributes_obj_type.validate(attributes_py)
+            compile_validator(resource_attributes_obj_type)(attributes_py)
         except CtyValidationError as e:
             logger.error(
                 "🏭❌ Attribute validation failed",
@@ -107,25 +140,16 @@ def create_resource_cty(  # noqa: C901
         logger.debug("🏭⏳ Inferring attribute types", r_type=r_type, r_name=r_name)
         inferred_attributes_cty = auto_infer_cty_type(attributes_py)
         if isinstance(inferred_attributes_cty.type, CtyObject):
-            attributes_cty_schema = inferred_attributes_cty.type.attribute_types
+            root_schema = _inferred_schema(r_type, r_name, SchemaKey(inferred_attributes_cty.type))
         else:
             logger.error("🏭❌ Type inference failed", r_type=r_type, r_name=r_name)
             raise HclFactoryError("Could not infer object type from attributes.")
 
     root_py_struct = {"resource": [{r_type: [{r_name: attributes_py}]}]}
-    root_schema = CtyObject(
-        {
-            "resource": CtyList(
-                element_type=CtyObject(
-                    {r_type: CtyList(element_type=CtyObject({r_name: CtyObject(attributes_cty_schema)}))}
-                )
-            )
-        }
-    )
 
     try:
-        result = root_schema.validate(root_py_struct)
-        return result  # type: ignore[no-any-return]
+        result = compile_validator(root_schema)(root_py_struct)
+        return result
     except CtyError as e:
         logger.error("🏭❌ Resource creation failed", r_type=r_type, r_name=r_name, error=str(e))
         raise HclFactoryError(f"Internal error creating resource CtyValue: {e}") from e
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from provide.foundation import logger
@@ -14,13 +15,40 @@ from provide.foundation import logger
 from pyvider.cty import CtyBool, CtyList, CtyObject, CtyString, CtyType, CtyValue
 from pyvider.cty.exceptions import CtyError, CtyValidationError
 from pyvider.hcl.factories.types import HclTypeParsingError, parse_hcl_type_string
+from pyvider.hcl.parser.validators import compile_validator
+from pyvider.hcl.tracing import traced_call
 
 
 class HclFactoryError(ValueError):
     """Custom exception for errors during HCL factory operations."""
 
 
-def create_variable_cty(  # noqa: C901
+_OPTIONAL_ATTRIBUTE_TYPES: dict[str, CtyType[Any]] = {
+    "description": CtyString(),
+    "sensitive": CtyBool(),
+    "nullable": CtyBool(),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _variable_schemas(name: str, type_str: str, attributes: tuple[str, ...]) -> tuple[CtyType[Any], CtyObject]:
+    """The variable's type and the schema of the whole structure, for the attributes given.
+
+    Validators are compiled per schema object, so calls for the same variable
+    share these schemas and their compiled validators.
+    """
+    variable_type = parse_hcl_type_string(type_str)
+    variable_attrs_schema: dict[str, CtyType[Any]] = {"type": CtyString()}
+    for attribute in attributes[1:]:
+        variable_attrs_schema[attribute] = _OPTIONAL_ATTRIBUTE_TYPES.get(attribute, variable_type)
+    root_schema = CtyObject(
+        {"variable": CtyList(element_type=CtyObject({name: CtyObject(variable_attrs_schema)}))}
+    )
+    return variable_type, root_schema
+
+
+@traced_call(schema="type_str", variable="name")
+def create_variable_cty(
     name: str,
     type_str: str,
     default_py: Any | None = None,
@@ -57,12 +85,6 @@ def create_variable_cty(  # noqa: C901
         logger.error("🏭❌ Invalid variable name", name=name)
         raise HclFactoryError(f"Invalid variable name: '{name}'. Must be a valid identifier.")
 
-    try:
-        parsed_variable_type = parse_hcl_type_string(type_str)
-    except HclTypeParsingError as e:
-        logger.error("🏭❌ Type string parsing failed", name=name, type_str=type_str, error=str(e))
-        raise HclFactoryError(f"Invalid type string for variable '{name}': {e}") from e
-
     variable_attrs_py: dict[str, Any] = {"type": type_str}
 
     if description is not None:
@@ -72,9 +94,16 @@ def create_variable_cty(  # noqa: C901
     if nullable is not None:
         variable_attrs_py["nullable"] = nullable
 
+    attributes = (*variable_attrs_py, "default") if default_py is not None else tuple(variable_attrs_py)
+    try:
+        parsed_variable_type, root_schema = _variable_schemas(name, type_str, attributes)
+    except HclTypeParsingError as e:
+        logger.error("🏭❌ Type string parsing failed", name=name, type_str=type_str, error=str(e))
+        raise HclFactoryError(f"Invalid type string for variable '{name}': {e}") from e
+
     if default_py is not None:
         try:
-            parsed_variable_type.validate(default_py)
+            compile_validator(parsed_variable_type)(default_py)
         except CtyValidationError as e:
             logger.error(
                 "🏭❌ Default value validation failed",
@@ -87,24 +116,11 @@ def create_variable_cty(  # noqa: C901
             ) from e
         variable_attrs_py["default"] = default_py
 
-    variable_attrs_schema: dict[str, CtyType[Any]] = {"type": CtyString()}
-    if "description" in variable_attrs_py:
-        variable_attrs_schema["description"] = CtyString()
-    if "sensitive" in variable_attrs_py:
-        variable_attrs_schema["sensitive"] = CtyBool()
-    if "nullable" in variable_attrs_py:
-        variable_attrs_schema["nullable"] = CtyBool()
-    if "default" in variable_attrs_py:
-        variable_attrs_schema["default"] = parsed_variable_type
-
     root_py_struct = {"variable": [{name: variable_attrs_py}]}
-    root_schema = CtyObject(
-        {"variable": CtyList(element_type=CtyObject({name: CtyObject(variable_attrs_schema)}))}
-    )
 
     try:
-        result = root_schema.validate(root_py_struct)
-        return result  # type: ignore[no-any-return]
+        result = compile_validator(root_schema)(root_py_struct)
+        return result
     except CtyError as e:
         logger.error("🏭❌ Variable creation failed", name=name, error=str(e))
         raise HclFactoryError(f"Internal error creating variable CtyValue: {e}") from e
@@ -7,14 +7,96 @@
 
 This module provides HCL parsing functionality with CTY type integration."""
 
-from pyvider.hcl.parser.base import parse_hcl_to_cty
-from pyvider.hcl.parser.context import parse_with_context
-from pyvider.hcl.parser.inference import auto_infer_cty_type
+from typing import TYPE_CHECKING
+
+from pyvider.hcl._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pyvider.hcl.parser.aio import (
+        aparse_directory,
+        aparse_file,
+        aparse_hcl_to_cty,
+        configure_async_parsing,
+    )
+    from pyvider.hcl.parser.base import parse_file, parse_hcl_to_cty, validate_hcl
+    from pyvider.hcl.parser.batch import parse_files
+    from pyvider.hcl.parser.cache import CacheStats, ParseCache
+    from pyvider.hcl.parser.context import parse_with_context
+    from pyvider.hcl.parser.disk_cache import DiskParseCache
+    from pyvider.hcl.parser.grammar import warmup
+    from pyvider.hcl.parser.incremental import ParseSession, ReparseResult
+    from pyvider.hcl.parser.inference import auto_infer_cty_type
+    from pyvider.hcl.parser.json_syntax import parse_json_to_cty, parse_json_with_context
+    from pyvider.hcl.parser.lazy import LazyCtyValue
+    from pyvider.hcl.parser.limits import ParseLimits
+    from pyvider.hcl.parser.recovery import RecoveredParse, parse_with_recovery
+    from pyvider.hcl.parser.stats import ParseStats
+    from pyvider.hcl.parser.streaming import HclBlock, iter_blocks
+    from pyvider.hcl.parser.validators import compile_validator
+    from pyvider.hcl.parser.violations import SchemaViolation, find_violations
+
+_EXPORTS = {
+    "CacheStats": "pyvider.hcl.parser.cache",
+    "DiskParseCache": "pyvider.hcl.parser.disk_cache",
+    "HclBlock": "pyvider.hcl.parser.streaming",
+    "LazyCtyValue": "pyvider.hcl.parser.lazy",
+    "ParseCache": "pyvider.hcl.parser.cache",
+    "ParseLimits": "pyvider.hcl.parser.limits",
+    "ParseSession": "pyvider.hcl.parser.incremental",
+    "ParseStats": "pyvider.hcl.parser.stats",
+    "RecoveredParse": "pyvider.hcl.parser.recovery",
+    "ReparseResult": "pyvider.hcl.parser.incremental",
+    "SchemaViolation": "pyvider.hcl.parser.violations",
+    "aparse_directory": "pyvider.hcl.parser.aio",
+    "aparse_file": "pyvider.hcl.parser.aio",
+    "aparse_hcl_to_cty": "pyvider.hcl.parser.aio",
+    "auto_infer_cty_type": "pyvider.hcl.parser.inference",
+    "compile_validator": "pyvider.hcl.parser.validators",
+    "configure_async_parsing": "pyvider.hcl.parser.aio",
+    "find_violations": "pyvider.hcl.parser.violations",
+    "iter_blocks": "pyvider.hcl.parser.streaming",
+    "parse_file": "pyvider.hcl.parser.base",
+    "parse_files": "pyvider.hcl.parser.batch",
+    "parse_hcl_to_cty": "pyvider.hcl.parser.base",
+    "parse_json_to_cty": "pyvider.hcl.parser.json_syntax",
+    "parse_json_with_context": "pyvider.hcl.parser.json_syntax",
+    "parse_with_context": "pyvider.hcl.parser.context",
+    "parse_with_recovery": "pyvider.hcl.parser.recovery",
+    "validate_hcl": "pyvider.hcl.parser.base",
+    "warmup": "pyvider.hcl.parser.grammar",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "CacheStats",
+    "DiskParseCache",
+    "HclBlock",
+    "LazyCtyValue",
+    "ParseCache",
+    "ParseLimits",
+    "ParseSession",
+    "ParseStats",
+    "RecoveredParse",
+    "ReparseResult",
+    "SchemaViolation",
+    "aparse_directory",
+    "aparse_file",
+    "aparse_hcl_to_cty",
     "auto_infer_cty_type",
+    "compile_validator",
+    "configure_async_parsing",
+    "find_violations",
+    "iter_blocks",
+    "parse_file",
+    "parse_files",
     "parse_hcl_to_cty",
+    "parse_json_to_cty",
+    "parse_json_with_context",
     "parse_with_context",
+    "parse_with_recovery",
+    "validate_hcl",
+    "warmup",
 ]
 
 # 📄⚙️🔚
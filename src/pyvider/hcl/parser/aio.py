@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""asyncio-native parsing entry points.
+
+Parsing is CPU-bound and blocks whichever thread runs it, so these coroutines
+hand the work to an executor and await the result. A per-event-loop semaphore
+caps how many parses are in flight; a permit is returned only when the
+executor job has actually finished, so a caller that times out or is
+cancelled cannot leave more CPU work running than the cap allows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import contextlib
+import os
+from pathlib import Path
+import threading
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from pyvider.cty import CtyType, CtyValue
+from pyvider.hcl.parser.base import parse_file, parse_hcl_to_cty
+from pyvider.hcl.parser.cache import ParseCache
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.limits import ParseLimits
+from pyvider.hcl.parser.source import HclSource
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_FILE_PATTERNS = ("*.tf", "*.hcl", "*.tf.json")
+
+_config_lock = threading.Lock()
+_default_executor: Executor | None = None
+_max_concurrency = DEFAULT_MAX_CONCURRENCY
+_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
+
+def configure_async_parsing(
+    *,
+    executor: Executor | None = None,
+    max_concurrency: int | None = None,
+) -> None:
+    """Set the default executor and concurrency limit for the async API.
+
+    Args:
+        executor: Executor that runs parses; defaults to a dedicated thread pool
+        max_concurrency: Parses allowed in flight per event loop
+
+    Note:
+        A `ProcessPoolExecutor` gives true parallelism but requires picklable
+        arguments, which rules out `ParseCache`.
+    """
+    global _default_executor, _max_concurrency
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    with _config_lock:
+        if executor is not None:
+            _default_executor = executor
+        if max_concurrency is not None:
+            _max_concurrency = max_concurrency
+            _semaphores.clear()
+
+
+def _get_executor() -> Executor:
+    global _default_executor
+    with _config_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=_max_concurrency, thread_name_prefix="pyvider-hcl"
+            )
+        return _default_executor
+
+
+def _get_semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    with _config_lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _semaphores[loop] = asyncio.Semaphore(_max_concurrency)
+        return semaphore
+
+
+async def _run_limited(
+    func: Callable[..., T],
+    *args: Any,
+    executor: Executor | None,
+    timeout: float | None,
+    semaphore: asyncio.Semaphore | None,
+) -> T:
+    """Run `func(*args)` in an executor under the concurrency limit."""
+    loop = asyncio.get_running_loop()
+    limiter = semaphore if semaphore is not None else _get_semaphore(loop)
+    await limiter.acquire()
+
+    def _release(_: Future[T]) -> None:
+        # The loop may have closed while the job was still running, in which
+        # case nothing is waiting on this semaphore any more.
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(limiter.release)
+
+    try:
+        job = (executor or _get_executor()).submit(func, *args)
+    except BaseException:
+        limiter.release()
+        raise
+    job.add_done_callback(_release)
+
+    try:
+        async with asyncio.timeout(timeout):
+            return await asyncio.wrap_future(job)
+    finally:
+        # A no-op once the job has started; drops it from the queue otherwise.
+        job.cancel()
+
+
+def _parse_file(
+    path: Path,
+    schema: CtyType[Any] | None,
+    cache: ParseCache | None,
+    disk_cache: DiskParseCache | None,
+    limits: ParseLimits | None,
+) -> CtyValue[Any]:
+    return parse_file(path, schema, cache=cache, disk_cache=disk_cache, limits=limits)
+
+
+def _find_files(root: Path, patterns: tuple[str, ...]) -> list[Path]:
+    return sorted({path for pattern in patterns for path in root.rglob(pattern) if path.is_file()})
+
+
+def _parse_hcl(
+    hcl_content: HclSource,
+    schema: CtyType[Any] | None,
+    cache: ParseCache | None,
+    disk_cache: DiskParseCache | None,
+    limits: ParseLimits | None,
+) -> CtyValue[Any]:
+    return parse_hcl_to_cty(hcl_content, schema, cache=cache, disk_cache=disk_cache, limits=limits)
+
+
+async def aparse_hcl_to_cty(
+    hcl_content: HclSource,
+    schema: CtyType[Any] | None = None,
+    *,
+    cache: ParseCache | None = None,
+    disk_cache: DiskParseCache | None = None,
+    executor: Executor | None = None,
+    timeout: float | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    limits: ParseLimits | None = None,
+) -> CtyValue[Any]:
+    """Async counterpart of `parse_hcl_to_cty` that never blocks the event loop.
+
+    Args:
+        hcl_content: HCL string to parse, or a buffer of UTF-8 bytes
+        schema: Optional CTY type schema for validation
+        cache: Optional in-memory parse cache
+        disk_cache: Optional persistent parse cache
+        executor: Executor for this call; defaults to the configured one
+        timeout: Seconds to wait before raising `TimeoutError`
+        semaphore: Concurrency limiter for this call; defaults to the
+            per-loop limiter set by `configure_async_parsing`
+        limits: Optional bounds on size, nesting, value count and time.
+            Unlike `timeout`, these stop the worker thread too, so it is
+            free for the next parse
+
+    Returns:
+        Parsed and validated CTY value
+
+    Raises:
+        HclParsingError: If parsing or validation fails
+        HclLimitError: If the document exceeds `limits`
+        TimeoutError: If the parse does not finish within `timeout`
+
+    Example:
+        >>> value = await aparse_hcl_to_cty('name = "example"', timeout=5)
+    """
+    return await _run_limited(
+        _parse_hcl,
+        hcl_content,
+        schema,
+        cache,
+        disk_cache,
+        limits,
+        executor=executor,
+        timeout=timeout,
+        semaphore=semaphore,
+    )
+
+
+async def aparse_file(
+    path: Path | str,
+    schema: CtyType[Any] | None = None,
+    *,
+    cache: ParseCache | None = None,
+    disk_cache: DiskParseCache | None = None,
+    executor: Executor | None = None,
+    timeout: float | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    limits: ParseLimits | None = None,
+) -> CtyValue[Any]:
+    """Read and parse an HCL file without blocking the event loop.
+
+    Both the read and the parse run in the executor, through `parse_file`, so
+    the file is memory-mapped rather than read. JSON-syntax files
+    (``.tf.json`` and friends) are parsed with `parse_json_to_cty`. Arguments
+    are as for `aparse_hcl_to_cty`.
+
+    Raises:
+        HclParsingError: If the file cannot be read, parsed or validated,
+            with ``source_file`` set to `path`
+        TimeoutError: If the parse does not finish within `timeout`
+    """
+    return await _run_limited(
+        _parse_file,
+        Path(path),
+        schema,
+        cache,
+        disk_cache,
+        limits,
+        executor=executor,
+        timeout=timeout,
+        semaphore=semaphore,
+    )
+
+
+async def aparse_directory(
+    directory: Path | str,
+    schema: CtyType[Any] | None = None,
+    *,
+    patterns: Iterable[str] = DEFAULT_FILE_PATTERNS,
+    cache: ParseCache | None = None,
+    disk_cache: DiskParseCache | None = None,
+    executor: Executor | None = None,
+    timeout: float | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    limits: ParseLimits | None = None,
+) -> dict[Path, CtyValue[Any]]:
+    """Parse every matching file under `directory` concurrently.
+
+    Files are found recursively, in the executor so that walking a large
+    tree does not block the event loop, and parsed under the same
+    concurrency limit as every other async parse. If any file fails, the
+    remaining parses are cancelled and the error is raised.
+
+    Args:
+        directory: Root directory to search
+        schema: Optional CTY type schema applied to every file
+        patterns: Glob patterns matched recursively (default ``*.tf``,
+            ``*.hcl``, ``*.tf.json``)
+        timeout: Seconds allowed for the whole directory, finding the
+            files included
+        cache, disk_cache, executor, semaphore, limits: As for
+            `aparse_hcl_to_cty`; limits apply to each file
+
+    Returns:
+        Parsed values keyed by file path, in sorted path order
+    """
+    tasks: list[asyncio.Future[CtyValue[Any]]] = []
+    try:
+        async with asyncio.timeout(timeout):
+            paths = await _run_limited(
+                _find_files,
+                Path(directory),
+                tuple(patterns),
+                executor=executor,
+                timeout=None,
+                semaphore=semaphore,
+            )
+            tasks = [
+                asyncio.ensure_future(
+                    aparse_file(
+                        path,
+                        schema,
+                        cache=cache,
+                        disk_cache=disk_cache,
+                        executor=executor,
+                        semaphore=semaphore,
+                        limits=limits,
+                    )
+                )
+                for path in paths
+            ]
+            results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return dict(zip(paths, results, strict=True))
+
+
+# 📄⚙️🔚
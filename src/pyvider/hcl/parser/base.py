@@ -7,28 +7,111 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
-import hcl2
+import attrs
 
 from pyvider.cty import CtyType, CtyValue
 from pyvider.cty.exceptions import CtyError as CtySchemaError, CtyValidationError
-from pyvider.hcl.exceptions import HclParsingError
+from pyvider.hcl.exceptions import HclLimitError, HclParsingError, HclSchemaError
+from pyvider.hcl.parser.cache import ParseCache, SchemaKey, content_digest
+from pyvider.hcl.parser.disk_cache import DiskParseCache
 from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.json_syntax import is_json_path, parse_json_to_cty
+from pyvider.hcl.parser.lazy import lazy_cty_value
+from pyvider.hcl.parser.limits import Budget, ParseLimits, start_budget
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.positions import located_error
+from pyvider.hcl.parser.source import HclSource, decode_source, read_source
+from pyvider.hcl.parser.stats import ParseStats
+from pyvider.hcl.parser.validators import compile_validator
+from pyvider.hcl.parser.violations import SchemaViolation, find_violations, locate_violations
+from pyvider.hcl.tracing import traced
 
 
-def parse_hcl_to_cty(hcl_content: str, schema: CtyType[Any] | None = None) -> CtyValue[Any]:
+def _load(
+    hcl_content: str,
+    disk_cache: DiskParseCache | None,
+    budget: Budget | None = None,
+    stats: ParseStats | None = None,
+) -> Any:
+    """Return the raw data, wrapping parse failures with their location."""
+    try:
+        return load_raw(hcl_content, disk_cache=disk_cache, budget=budget, stats=stats)
+    except HclLimitError:
+        raise
+    except Exception as e:
+        raise located_error(f"Failed to parse HCL: {e}", e, hcl_content) from e
+
+
+def _schema_error(hcl_content: str, raw_data: Any, schema: CtyType[Any], cause: Exception) -> HclParsingError:
+    """Describe every schema violation in the document, or the first failure if none are found."""
+    violations = locate_violations(hcl_content, find_violations(raw_data, schema))
+    if not violations:
+        return HclParsingError(message=f"Schema validation failed after HCL parsing: {cause}")
+    details = "".join(f"\n  line {v.line}: {v}" if v.line is not None else f"\n  {v}" for v in violations)
+    return HclSchemaError(
+        message=f"Schema validation failed after HCL parsing with {len(violations)} violation(s):{details}",
+        line=next((v.line for v in violations if v.line is not None), None),
+        violations=tuple(violations),
+    )
+
+
+def _build(
+    hcl_content: str, raw_data: Any, schema: CtyType[Any] | None, lazy: bool, collect_violations: bool
+) -> CtyValue[Any]:
+    """Validate raw data against the schema, or infer its types."""
+    if schema:
+        try:
+            return compile_validator(schema)(raw_data)
+        except (CtySchemaError, CtyValidationError) as e:
+            if collect_violations:
+                raise _schema_error(hcl_content, raw_data, schema, e) from e
+            raise HclParsingError(message=f"Schema validation failed after HCL parsing: {e}") from e
+    if lazy:
+        return lazy_cty_value(raw_data)
+    return auto_infer_cty_type(raw_data)
+
+
+def parse_hcl_to_cty(  # noqa: C901
+    hcl_content: HclSource,
+    schema: CtyType[Any] | None = None,
+    *,
+    cache: ParseCache | None = None,
+    disk_cache: DiskParseCache | None = None,
+    lazy: bool = False,
+    collect_violations: bool = False,
+    limits: ParseLimits | None = None,
+    stats: ParseStats | None = None,
+) -> CtyValue[Any]:
     """Parse HCL directly into validated CtyValues using pyvider.cty types.
 
     Args:
-        hcl_content: HCL string to parse
+        hcl_content: HCL string to parse, or a buffer of UTF-8 bytes (`bytes`,
+            `bytearray`, `memoryview`, `mmap`), decoded once without a copy
         schema: Optional CTY type schema for validation
+        cache: Optional cache; identical content and the same schema object return
+            the cached value
+        disk_cache: Optional persistent cache of raw parse results
+        lazy: Return a `LazyCtyValue` that infers and builds each object's
+            attributes on first access; cannot be combined with a schema
+        collect_violations: When the document violates the schema, report
+            every violation with its path and source line in an
+            `HclSchemaError`, rather than only the first
+        limits: Optional bounds on size, nesting, value count and time for
+            untrusted input; a lazy value's later access is not covered
+        stats: Optional `ParseStats` to add this call's phase timings, size,
+            node count and cache hits to
 
     Returns:
         Parsed and validated CTY value
 
     Raises:
         HclParsingError: If parsing or validation fails
+        HclSchemaError: If validation fails and `collect_violations` is set
+        HclLimitError: If the document exceeds `limits`
+        ValueError: If `lazy` is combined with a schema
 
     Example:
         >>> hcl = 'name = "example"'
@@ -36,21 +119,149 @@ def parse_hcl_to_cty(hcl_content: str, schema: CtyType[Any] | None = None) -> Ct
         >>> result.value["name"].value
         'example'
     """
+    if lazy and schema:
+        raise ValueError("lazy=True cannot be combined with a schema; schemas validate eagerly")
 
-    try:
-        raw_data = hcl2.loads(hcl_content)  # type: ignore[attr-defined]
-    except Exception as e:
-        raise HclParsingError(message=f"Failed to parse HCL: {e}") from e
+    with traced("parse_hcl_to_cty", source=hcl_content, schema=schema) as span:
+        budget = start_budget(limits)
+        if budget is not None:
+            budget.check_size(hcl_content)
+        mark = 0.0
+        if stats is not None:
+            mark = stats.begin(hcl_content)
 
-    if schema:
+        cache_key = None
+        if cache is not None:
+            with traced("cache"):
+                cache_key = ("cty", content_digest(hcl_content), SchemaKey(schema), lazy)
+                cached: CtyValue[Any] | None = cache.get(cache_key)
+            if stats is not None:
+                stats.cache_hits += cached is not None
+                mark = stats.lap("cache", mark)
+            if cached is not None:
+                if span is not None:
+                    span.set_tag("hcl.outcome", "cache_hit")
+                return cached
+
+        with traced("decode"):
+            text = decode_source(hcl_content)
+        if stats is not None:
+            mark = stats.lap("decode", mark)
+        with traced("parse"):
+            raw_data = _load(text, disk_cache, budget, stats)
+        if stats is not None:
+            stats.count_nodes(raw_data)
+            mark = stats.lap("parse", mark)
+        with traced("validate" if schema else "infer"):
+            result = _build(text, raw_data, schema, lazy, collect_violations)
+        if budget is not None:
+            budget.check_deadline()
+        if stats is not None:
+            mark = stats.lap("validate" if schema else "infer", mark)
+
+        if cache is not None:
+            with traced("cache"):
+                cache.put(cache_key, result)
+            if stats is not None:
+                stats.lap("cache", mark)
+        return result
+
+
+def validate_hcl(
+    hcl_content: HclSource,
+    schema: CtyType[Any],
+    *,
+    disk_cache: DiskParseCache | None = None,
+    limits: ParseLimits | None = None,
+) -> list[SchemaViolation]:
+    """Check HCL against a schema without building CtyValues.
+
+    Every violation is reported, not only the first, with its source line
+    where it can be found. The document is parsed, but the checks only walk
+    the raw parse, so no value tree is built -- for linting, this is cheaper
+    than `parse_hcl_to_cty` with a schema.
+
+    Args:
+        hcl_content: HCL string to check, or a buffer of UTF-8 bytes
+        schema: CTY type the document should conform to
+        disk_cache: Optional persistent cache of raw parse results
+        limits: Optional bounds on size, nesting, value count and time
+
+    Returns:
+        The violations found; empty when `parse_hcl_to_cty` would accept
+        the document with this schema
+
+    Raises:
+        HclParsingError: If the content is not valid HCL
+        HclLimitError: If the document exceeds `limits`
+
+    Example:
+        >>> schema = CtyObject({"name": CtyString(), "count": CtyNumber()})
+        >>> [str(v) for v in validate_hcl('name = "web"\\ncount = "x"', schema)]
+        ["count: Number validation error: Cannot represent str value 'x' as Decimal"]
+    """
+    with traced("validate_hcl", source=hcl_content, schema=schema):
+        budget = start_budget(limits)
+        if budget is not None:
+            budget.check_size(hcl_content)
+        with traced("decode"):
+            text = decode_source(hcl_content)
+        with traced("parse"):
+            raw_data = _load(text, disk_cache, budget)
+        with traced("violations"):
+            violations = find_violations(raw_data, schema)
+            if budget is not None:
+                budget.check_deadline()
+            return locate_violations(text, violations)
+
+
+def parse_file(
+    path: Path | str,
+    schema: CtyType[Any] | None = None,
+    *,
+    cache: ParseCache | None = None,
+    disk_cache: DiskParseCache | None = None,
+    limits: ParseLimits | None = None,
+) -> CtyValue[Any]:
+    """Parse an HCL file into validated CtyValues.
+
+    The file is memory-mapped and decoded straight from the mapping, so its
+    contents are not first copied into `bytes`, and ``max_bytes`` is checked
+    against its size before anything is decoded. JSON-syntax files
+    (``.tf.json`` and friends) are parsed with `parse_json_to_cty`.
+
+    Args:
+        path: File to parse
+        schema: Optional CTY type schema for validation
+        cache: Optional cache; identical content and the same schema object return
+            the cached value
+        disk_cache: Optional persistent cache of raw parse results
+        limits: Optional bounds on size, nesting, value count and time
+
+    Returns:
+        Parsed and validated CTY value
+
+    Raises:
+        HclParsingError: If the file cannot be read, decoded, parsed or
+            validated, with ``source_file`` set to `path`
+        HclLimitError: If the file exceeds `limits`
+
+    Example:
+        >>> value = parse_file("terraform.tfvars")
+    """
+    with traced("parse_file", file=path, schema=schema):
+        budget = start_budget(limits, path)
+        with traced("read"):
+            text = read_source(path, budget)
+        if budget is not None:
+            # The timeout covers the read as well as the parse.
+            limits = budget.remaining()
+        if is_json_path(path):
+            return parse_json_to_cty(text, schema, source_file=path, cache=cache, limits=limits)
         try:
-            validated_value = schema.validate(raw_data)
-            return validated_value
-        except (CtySchemaError, CtyValidationError) as e:
-            raise HclParsingError(message=f"Schema validation failed after HCL parsing: {e}") from e
-    else:
-        inferred_value = auto_infer_cty_type(raw_data)
-        return inferred_value
+            return parse_hcl_to_cty(text, schema, cache=cache, disk_cache=disk_cache, limits=limits)
+        except HclParsingError as e:
+            raise attrs.evolve(e, source_file=str(path)) from e.__cause__
 
 
 # 📄⚙️🔚
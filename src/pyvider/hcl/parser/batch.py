@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Batch parsing of many HCL files across a process pool."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+from typing import Any
+
+from provide.foundation import logger
+
+from pyvider.hcl.exceptions import HclParsingError
+from pyvider.hcl.parser.context import parse_with_context
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.grammar import warmup
+from pyvider.hcl.parser.interning import intern_keys
+from pyvider.hcl.parser.json_syntax import is_json_path, parse_json_with_context
+from pyvider.hcl.parser.source import read_source
+
+# Enough chunks per worker to balance uneven file sizes, few enough that the
+# per-task pickling overhead stays small next to the parse itself.
+_CHUNKS_PER_WORKER = 4
+
+
+def _parse_path(path: str, disk_cache: DiskParseCache | None, return_exceptions: bool) -> Any:
+    """Read and parse one file. Runs in the worker process."""
+    try:
+        content = read_source(path)
+        if is_json_path(path):
+            return parse_json_with_context(content, source_file=Path(path))
+        return parse_with_context(content, source_file=Path(path), disk_cache=disk_cache)
+    except HclParsingError as e:
+        if return_exceptions:
+            return e
+        raise
+
+
+def _parse_path_args(args: tuple[str, DiskParseCache | None, bool]) -> Any:
+    return _parse_path(*args)
+
+
+def parse_files(
+    paths: Iterable[Path | str],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    return_exceptions: bool = False,
+    disk_cache: DiskParseCache | None = None,
+) -> list[Any]:
+    """Parse many HCL files in parallel, returning results in input order.
+
+    Each file is read and parsed with `parse_with_context` in a worker process;
+    the parser is warmed up once per worker rather than once per file.
+    Results are unpickled with fresh key strings, so their keys are interned
+    again here and every result shares them, as in a serial parse.
+    JSON-syntax files (``.tf.json`` and friends) go through
+    `parse_json_with_context` instead.
+
+    Args:
+        paths: Files to parse
+        workers: Worker processes; defaults to the CPU count. ``1`` parses
+            serially in the calling process with no pool at all.
+        chunksize: Files handed to a worker per task; derived from the number
+            of files and workers when omitted
+        return_exceptions: Put each file's `HclParsingError` in its result slot
+            instead of raising the first one
+        disk_cache: Optional persistent cache shared by all workers
+
+    Returns:
+        One raw parse result (or, with ``return_exceptions``, an
+        `HclParsingError`) per path, in the order the paths were given
+
+    Raises:
+        HclParsingError: For the first file, in input order, that fails to read
+            or parse, with ``source_file`` set to its path
+
+    Example:
+        >>> results = parse_files(sorted(root.rglob("*.tf")), workers=8)
+    """
+    path_strs = [str(path) for path in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    workers = min(workers, max(len(path_strs), 1))
+
+    logger.debug("📄⏳ Parsing files", count=len(path_strs), workers=workers)
+    tasks = [(path, disk_cache, return_exceptions) for path in path_strs]
+
+    if workers == 1:
+        return [_parse_path_args(task) for task in tasks]
+
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers, initializer=warmup) as pool:
+        results = list(pool.map(_parse_path_args, tasks, chunksize=chunksize))
+    for result in results:
+        if not isinstance(result, HclParsingError):
+            intern_keys(result)
+    return results
+
+
+# 📄⚙️🔚
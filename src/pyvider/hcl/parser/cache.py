@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Content-addressed in-memory cache for HCL parse results.
+
+Results are keyed by a digest of the HCL source (plus the schema object, for
+`parse_hcl_to_cty`), so the same document parsed twice costs one dictionary
+lookup the second time. Everything stored is immutable: `CtyValue` trees are
+frozen by pyvider-cty already, and raw `parse_with_context` results are frozen
+here on the way in, which is what makes handing one object to many callers safe.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import hashlib
+import sys
+import threading
+from typing import Any
+
+from attrs import define, field
+from attrs.validators import ge
+
+from pyvider.cty import CtyType, CtyValue
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.hcl.parser.lazy import LazyCtyValue
+from pyvider.hcl.parser.source import HclSource
+
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def content_digest(content: HclSource) -> str:
+    """Return a stable hex digest identifying an HCL source.
+
+    Text is digested as UTF-8 and a buffer as it is, without copying it, so
+    a document has the same digest either way.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class SchemaKey:
+    """A schema in a cache key, compared by identity.
+
+    A value validated against a schema is built with that schema's own type
+    objects, so an equal schema -- one listing its attributes in another
+    order, say -- must not be handed it. The key holds the schema, so its id
+    is not reused while the entry is cached, and hashing it does not walk
+    the type.
+    """
+
+    __slots__ = ("schema",)
+
+    def __init__(self, schema: CtyType[Any] | None) -> None:
+        self.schema = schema
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SchemaKey) and other.schema is self.schema
+
+    def __hash__(self) -> int:
+        return id(self.schema)
+
+
+def freeze_raw(data: Any) -> Any:
+    """Return a deeply immutable copy of raw parser output.
+
+    Dicts become `FrozenDict` (still a `dict` for read access) and lists become
+    tuples. Scalars are returned unchanged.
+    """
+    if isinstance(data, dict):
+        return FrozenDict({key: freeze_raw(value) for key, value in data.items()})
+    if isinstance(data, list | tuple):
+        return tuple(freeze_raw(item) for item in data)
+    return data
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate the memory retained by a parse result, in bytes.
+
+    Walks dicts, sequences and `CtyValue` payloads iteratively, counting each
+    distinct object once. Types are shared between values and are not counted.
+    A `LazyCtyValue` is sized by its raw data, so estimating does not build it.
+    """
+    total = 0
+    seen: set[int] = set()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, LazyCtyValue):
+            stack.append(current.raw_data)
+        elif isinstance(current, CtyValue):
+            stack.append(current.value)
+        elif isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, list | tuple | set | frozenset):
+            stack.extend(current)
+    return total
+
+
+@define(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters for a `ParseCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@define(frozen=True, slots=True)
+class _Entry:
+    value: Any
+    size: int
+
+
+@define(slots=True)
+class ParseCache:
+    """Thread-safe LRU cache of parse results bounded by an approximate byte budget.
+
+    Pass an instance as ``cache=`` to `parse_hcl_to_cty` or `parse_with_context`
+    to opt in. Entries larger than the whole budget are never stored.
+
+    Example:
+        >>> cache = ParseCache(max_bytes=8 * 1024 * 1024)
+        >>> first = parse_hcl_to_cty('name = "example"', cache=cache)
+        >>> parse_hcl_to_cty('name = "example"', cache=cache) is first
+        True
+    """
+
+    max_bytes: int = field(default=DEFAULT_CACHE_MAX_BYTES, validator=ge(0))
+    _entries: OrderedDict[Hashable, _Entry] = field(factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+    _current_bytes: int = field(default=0, init=False)
+    _hits: int = field(default=0, init=False)
+    _misses: int = field(default=0, init=False)
+    _evictions: int = field(default=0, init=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: Any, size: int | None = None) -> None:
+        """Store `value` under `key`, evicting least recently used entries to fit."""
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.size
+            while self._entries and self._current_bytes + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted.size
+                self._evictions += 1
+            self._entries[key] = _Entry(value=value, size=size)
+            self._current_bytes += size
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+
+# 📄⚙️🔚
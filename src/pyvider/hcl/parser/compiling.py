@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""What the schema compilers share.
+
+`validators` and `violations` both turn a schema into nested functions once
+and reuse them. Both dispatch on a type's exact class, keep their compiled
+forms in a `SchemaCache`, and leave data nested deeper than `MAX_DEPTH` to
+pyvider-cty, as type inference does.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any, Generic, TypeVar
+
+from pyvider.cty import CtyType
+
+MAX_DEPTH = 64
+"""Deepest nesting walked here. Deeper data, and reference cycles, are left
+to pyvider-cty, which walks iteratively and enforces its configured limits."""
+
+_T = TypeVar("_T")
+
+
+def compile_schema(
+    vtype: CtyType[Any],
+    compilers: Mapping[type, Callable[[Any], _T]],
+    generic: Callable[[Any], _T],
+) -> _T:
+    """Compile `vtype` with the compiler for its class, or `generic` if there is none."""
+    # Exact classes only: a subclass may validate differently.
+    return compilers.get(type(vtype), generic)(vtype)
+
+
+class SchemaCache(Generic[_T]):
+    """Compiled forms of schemas, keyed by schema identity.
+
+    A compiled form builds values with its schema's own type objects, so an
+    equal schema -- one listing its attributes in another order, say -- gets
+    its own rather than one that would give results of a different type.
+    Looking schemas up by identity also avoids hashing them, which walks the
+    whole type.
+    """
+
+    __slots__ = ("_compile_schema", "_entries", "_maxsize", "hits", "misses")
+
+    def __init__(self, compile_schema: Callable[[CtyType[Any]], _T], maxsize: int = 256) -> None:
+        self._compile_schema = compile_schema
+        self._entries: dict[int, tuple[CtyType[Any], _T]] = {}
+        self._maxsize = maxsize
+        self.hits = self.misses = 0
+
+    def __call__(self, schema: CtyType[Any]) -> _T:
+        entry = self._entries.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        compiled = self._compile_schema(schema)
+        if len(self._entries) >= self._maxsize:
+            self._entries.clear()
+        # The entry holds the schema, so its id is not reused while cached.
+        self._entries[id(schema)] = (schema, compiled)
+        return compiled
+
+    def cache_clear(self) -> None:
+        """Drop every compiled form and zero the counts."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+# 📄⚙️🔚
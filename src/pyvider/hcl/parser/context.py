@@ -10,27 +10,53 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import hcl2
 from provide.foundation import logger
 
-from pyvider.hcl.exceptions import HclParsingError
+from pyvider.hcl.exceptions import HclLimitError
+from pyvider.hcl.parser.cache import ParseCache, content_digest, freeze_raw
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.limits import ParseLimits, start_budget
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.positions import located_error
+from pyvider.hcl.parser.source import HclSource, decode_source
+from pyvider.hcl.parser.stats import ParseStats
+from pyvider.hcl.tracing import traced
 
 
-def parse_with_context(content: str, source_file: Path | None = None) -> Any:
+def parse_with_context(  # noqa: C901
+    content: HclSource,
+    source_file: Path | None = None,
+    *,
+    cache: ParseCache | None = None,
+    disk_cache: DiskParseCache | None = None,
+    limits: ParseLimits | None = None,
+    stats: ParseStats | None = None,
+) -> Any:
     """Parse HCL content with enhanced error context.
 
     This function parses HCL content and provides rich error context if parsing fails.
     It returns the raw parsed data (dict/list), not CTY values.
 
     Args:
-        content: HCL content string to parse
+        content: HCL content string to parse, or a buffer of UTF-8 bytes
+            (`bytes`, `bytearray`, `memoryview`, `mmap`), decoded once
+            without a copy
         source_file: Optional source file path for error reporting
+        cache: Optional cache; results are then returned deeply frozen
+            (dicts as `FrozenDict`, lists as tuples) so hits can be shared
+        disk_cache: Optional persistent cache of raw parse results
+        limits: Optional bounds on size, nesting, value count and time for
+            untrusted input
+        stats: Optional `ParseStats` to add this call's phase timings, size,
+            node count and cache hits to
 
     Returns:
         Raw parsed data (typically dict or list)
 
     Raises:
-        HclParsingError: If parsing fails, with source location information
+        HclParsingError: If parsing fails, with the source file and, when the
+            parser reports one, the line and column of the error
+        HclLimitError: If the content exceeds `limits`
 
     Example:
         >>> content = 'name = "example"'
@@ -39,20 +65,55 @@ def parse_with_context(content: str, source_file: Path | None = None) -> Any:
         'example'
     """
     source_str = str(source_file) if source_file else "string input"
+    with traced("parse_with_context", source=content, file=source_file) as span:
+        budget = start_budget(limits, source_file)
+        if budget is not None:
+            budget.check_size(content)
+        mark = 0.0
+        if stats is not None:
+            mark = stats.begin(content)
 
-    try:
-        return hcl2.loads(content)  # type: ignore[attr-defined]
-    except Exception as e:
-        logger.error(
-            "HCL parsing failed",
-            source=source_str,
-            error=str(e),
-            exc_info=True,
-        )
-        raise HclParsingError(
-            message=str(e),
-            source_file=str(source_file) if source_file else None,
-        ) from e
+        cache_key = None
+        if cache is not None:
+            with traced("cache"):
+                cache_key = ("raw", content_digest(content))
+                cached = cache.get(cache_key)
+            if stats is not None:
+                stats.cache_hits += cached is not None
+                mark = stats.lap("cache", mark)
+            if cached is not None:
+                if span is not None:
+                    span.set_tag("hcl.outcome", "cache_hit")
+                return cached
+
+        with traced("decode"):
+            text = decode_source(content, source_file)
+        if stats is not None:
+            mark = stats.lap("decode", mark)
+        try:
+            with traced("parse"):
+                raw_data = load_raw(text, disk_cache=disk_cache, budget=budget, stats=stats)
+        except HclLimitError:
+            raise
+        except Exception as e:
+            logger.error(
+                "HCL parsing failed",
+                source=source_str,
+                error=str(e),
+                exc_info=True,
+            )
+            raise located_error(str(e), e, text, source_file=source_file) from e
+        if stats is not None:
+            stats.count_nodes(raw_data)
+            mark = stats.lap("parse", mark)
+
+        if cache is not None:
+            with traced("cache"):
+                raw_data = freeze_raw(raw_data)
+                cache.put(cache_key, raw_data)
+            if stats is not None:
+                stats.lap("cache", mark)
+        return raw_data
 
 
 # 📄⚙️🔚
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Persistent on-disk cache for raw python-hcl2 parse results.
+
+Entries survive between processes, so a CI job or a freshly spawned provider
+plugin skips `hcl2.loads` for every file it has seen before. Keys combine the
+content digest with the python-hcl2 and pyvider-hcl versions, so upgrading
+either one invalidates everything written by the other.
+
+Entries are zlib-compressed JSON behind a short magic header. Writes go to a
+temporary file in the cache directory and are moved into place with
+`os.replace`, which is atomic, so a reader in a parallel job sees either the
+whole entry or none of it. Unreadable entries are treated as misses.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from functools import cache
+import hashlib
+import importlib.metadata
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any
+import zlib
+
+from attrs import define, field
+from attrs.validators import ge, in_
+from provide.foundation import logger
+from provide.foundation.utils.versioning import get_version
+
+DEFAULT_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_DIR_ENV_VAR = "PYVIDER_HCL_CACHE_DIR"
+
+_MAGIC = b"PHCL1\n"
+_ENTRY_SUFFIX = ".hclz"
+_PRUNE_TARGET_RATIO = 0.9
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory from the environment or the user cache location."""
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "pyvider-hcl"
+
+
+@cache
+def _version_salt() -> bytes:
+    """Identify the parser versions whose output an entry holds."""
+    try:
+        hcl2_version = importlib.metadata.version("python-hcl2")
+    except importlib.metadata.PackageNotFoundError:
+        hcl2_version = "unknown"
+    hcl_version = get_version("pyvider-hcl", caller_file=__file__)
+    return f"python-hcl2={hcl2_version};pyvider-hcl={hcl_version}\n".encode()
+
+
+@define(slots=True)
+class DiskParseCache:
+    """Size-capped directory of compressed raw parse results.
+
+    Safe to share between processes on the same machine. When the directory
+    grows past `max_bytes`, the least recently used entries (by modification
+    time, refreshed on every hit) are removed until it is back under 90% of
+    the cap.
+
+    Example:
+        >>> disk = DiskParseCache(Path(".cache/hcl"), max_bytes=64 * 1024 * 1024)
+        >>> data = parse_with_context(content, source_file=path, disk_cache=disk)
+    """
+
+    directory: Path = field(factory=default_cache_dir, converter=Path)
+    max_bytes: int = field(default=DEFAULT_DISK_CACHE_MAX_BYTES, validator=ge(0))
+    compression_level: int = field(default=6, validator=in_(range(10)))
+    _approx_bytes: int | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def __reduce__(self) -> tuple[type[DiskParseCache], tuple[Path, int, int]]:
+        # Sent to worker processes by `parse_files`; the lock and the size
+        # estimate are per-process state and are rebuilt on the other side.
+        return (DiskParseCache, (self.directory, self.max_bytes, self.compression_level))
+
+    def key_for(self, content: str) -> str:
+        """Return the cache key for an HCL source string."""
+        digest = hashlib.blake2b(_version_salt(), digest_size=20)
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """Return the raw parse result stored under `key`, or None on a miss."""
+        path = self._path_for(key)
+        try:
+            blob = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            if not blob.startswith(_MAGIC):
+                raise ValueError("unrecognised cache entry header")
+            data = json.loads(zlib.decompress(blob[len(_MAGIC) :]))
+        except (ValueError, zlib.error) as e:
+            logger.debug("📄⚠️ Discarding unreadable disk cache entry", path=str(path), error=str(e))
+            path.unlink(missing_ok=True)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data
+
+    def put(self, key: str, data: Any) -> None:
+        """Store a raw parse result under `key`.
+
+        Failures to write are logged and otherwise ignored: the cache is an
+        optimisation, never a reason for a parse to fail.
+        """
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        blob = _MAGIC + zlib.compress(payload, self.compression_level)
+        if len(blob) > self.max_bytes:
+            return
+
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=_ENTRY_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(blob)
+                Path(tmp_name).replace(path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("📄⚠️ Disk cache write failed", path=str(path), error=str(e))
+            return
+
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = self._scan_size()
+            else:
+                self._approx_bytes += len(blob)
+            over_budget = self._approx_bytes > self.max_bytes
+        if over_budget:
+            self.prune()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob(f"*/*{_ENTRY_SUFFIX}"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def prune(self) -> int:
+        """Evict least recently used entries until under the size cap.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * _PRUNE_TARGET_RATIO)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._approx_bytes = total
+        if removed:
+            logger.debug("📄🧹 Pruned disk cache", directory=str(self.directory), removed=removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry from the cache directory."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._approx_bytes = 0
+
+    def size_bytes(self) -> int:
+        """Return the bytes currently occupied by entries on disk."""
+        return self._scan_size()
+
+
+# 📄⚙️🔚
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""The Lark parser behind python-hcl2, and its serialized artifact.
+
+Constructing python-hcl2's LALR parser from the grammar takes over a second;
+loading it from a serialized artifact takes a few tens of milliseconds.
+python-hcl2 only writes that artifact inside its own installed package, which
+is read-only in most deployed images, so every short-lived process paid the
+full construction cost on its first parse.
+
+This module builds the same parser (same grammar, same options) against an
+artifact location that is actually writable, and exposes `warmup` so a process
+can pay even the load cost before its first request instead of during it.
+
+Build the artifact ahead of time, e.g. while building a container image::
+
+    PYVIDER_HCL_GRAMMAR_CACHE=/opt/app/hcl2.lark_cache \\
+        python -m pyvider.hcl.parser.grammar
+
+Lark keys an artifact on the grammar, the options *including the artifact
+path*, the Lark version and the Python version, so it must be loaded from the
+path it was built at. A stale or foreign artifact is rebuilt, never misused.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+import os
+from pathlib import Path
+import sys
+import time
+
+from hcl2 import parser as hcl2_parser
+import lark
+from provide.foundation import logger
+
+from pyvider.hcl.parser.disk_cache import default_cache_dir
+
+GRAMMAR_CACHE_ENV_VAR = "PYVIDER_HCL_GRAMMAR_CACHE"
+
+_WARMUP_DOCUMENT = 'warmup "block" {\n  attribute = ["value", 1, true]\n}\n'
+
+
+def grammar_cache_path() -> Path:
+    """Return where the serialized parser is loaded from and written to.
+
+    In order of preference: the path in ``PYVIDER_HCL_GRAMMAR_CACHE``,
+    python-hcl2's own artifact if it already exists, and otherwise a file in
+    the pyvider-hcl user cache directory.
+    """
+    override = os.environ.get(GRAMMAR_CACHE_ENV_VAR)
+    if override:
+        return Path(override)
+    bundled = Path(hcl2_parser.PARSER_FILE)
+    if bundled.exists():
+        return bundled
+    python = f"{sys.version_info.major}{sys.version_info.minor}"
+    return default_cache_dir() / f"hcl2-lark-{lark.__version__}-py{python}.lark_cache"
+
+
+def _open_parser(cache_path: Path) -> lark.Lark:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    return lark.Lark.open(
+        "hcl2.lark",
+        parser="lalr",
+        cache=str(cache_path),
+        rel_to=hcl2_parser.__file__,
+        propagate_positions=True,
+    )
+
+
+@cache
+def get_parser() -> lark.Lark:
+    """Return the process-wide python-hcl2 parser, loading the artifact if possible."""
+    cache_path = grammar_cache_path()
+    start = time.perf_counter()
+    try:
+        parser = _open_parser(cache_path)
+    except OSError as e:
+        logger.warning("📄⚠️ Grammar cache unavailable", path=str(cache_path), error=str(e))
+        parser = hcl2_parser.parser()
+    logger.debug(
+        "📄✅ HCL parser ready",
+        cache_path=str(cache_path),
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 2),
+    )
+    return parser
+
+
+def build_parser_artifact(path: Path | None = None) -> Path:
+    """Build the serialized parser at `path` (default: `grammar_cache_path()`).
+
+    An existing artifact at that path is replaced. The artifact is only used by
+    processes that resolve the same path, so set ``PYVIDER_HCL_GRAMMAR_CACHE``
+    to it at runtime when building to a custom location.
+
+    Returns:
+        The path the artifact was written to
+    """
+    target = path if path is not None else grammar_cache_path()
+    target.unlink(missing_ok=True)
+    _open_parser(target)
+    if not target.exists():
+        raise OSError(f"Lark did not write a parser artifact to {target}")
+    return target
+
+
+def warmup() -> None:
+    """Load the HCL parser and exercise it once so the next parse is a warm one.
+
+    The modules `parse_hcl_to_cty` needs, which ``import pyvider.hcl`` leaves
+    until first use, are imported too.
+
+    Call this at process start (or from a background thread) in short-lived
+    processes; it is cheap and idempotent once the parser is loaded.
+    """
+    from pyvider.hcl.parser import base  # noqa: F401
+    from pyvider.hcl.parser.loader import load_raw
+
+    load_raw(_WARMUP_DOCUMENT)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Build the parser artifact: ``python -m pyvider.hcl.parser.grammar [PATH]``."""
+    args = sys.argv[1:] if argv is None else argv
+    target = build_parser_artifact(Path(args[0]) if args else None)
+    print(target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# 📄⚙️🔚
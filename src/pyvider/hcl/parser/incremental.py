@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Incremental reparsing for editor integrations.
+
+A `ParseSession` keeps the document split into top-level statements along
+with each statement's parse. An edit is rescanned from the last statement
+boundary before it until the scan lines up with an untouched boundary after
+it again; only the statements in between are parsed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import attrs
+from attrs import define, field
+from provide.foundation import logger
+
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.segments import Segment, iter_segments, merge_fragments, split_lines, split_segments
+from pyvider.hcl.parser.streaming import parse_segment
+
+
+def _common_length(a: str, b: str, matches: Callable[[int], bool]) -> int:
+    """Binary-search the longest length `n` for which `matches(n)` holds."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if matches(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+@define(frozen=True, slots=True)
+class ReparseResult:
+    """Outcome of applying an edit to a `ParseSession`.
+
+    Attributes:
+        tree: Raw parse of the whole updated document, in the same shape as
+            `parse_with_context` returns
+        changed: Addresses (``resource.aws_instance.web``, ``variable.region``,
+            or an attribute name) of statements added, removed or modified
+    """
+
+    tree: dict[str, Any]
+    changed: frozenset[str]
+
+
+@define(slots=True)
+class ParseSession:
+    """A parsed document that can be edited and reparsed block by block.
+
+    The tree and its fragments are shared between versions of the document;
+    treat them as read-only.
+
+    Example:
+        >>> session = ParseSession(text, source_file="main.tf")
+        >>> result = session.apply_edit(120, 125, '"t3.large"')
+        >>> result.changed
+        frozenset({'resource.aws_instance.web'})
+    """
+
+    _text: str = field(alias="text")
+    source_file: Path | str | None = field(default=None)
+    disk_cache: DiskParseCache | None = field(default=None)
+    _segments: list[Segment] = field(init=False, factory=list)
+    _fragments: list[Any] = field(init=False, factory=list)
+    _tree: dict[str, Any] = field(init=False, factory=dict)
+
+    def __attrs_post_init__(self) -> None:
+        self._segments = split_segments(self._text)
+        self._fragments = [self._parse(segment) for segment in self._segments]
+        self._tree = merge_fragments(self._segments, self._fragments)
+
+    @property
+    def text(self) -> str:
+        """Current document text."""
+        return self._text
+
+    @property
+    def tree(self) -> dict[str, Any]:
+        """Raw parse of the current document."""
+        return self._tree
+
+    @property
+    def segments(self) -> tuple[Segment, ...]:
+        """Top-level statements with their offsets and line spans."""
+        return tuple(self._segments)
+
+    def _parse(self, segment: Segment) -> Any:
+        return parse_segment(segment, source_file=self.source_file, disk_cache=self.disk_cache)
+
+    def apply_edit(self, start: int, end: int, new_text: str) -> ReparseResult:
+        """Replace ``text[start:end]`` with `new_text` and reparse what it touched.
+
+        Args:
+            start: Offset where the replaced range begins
+            end: Offset just past the replaced range
+            new_text: Replacement text
+
+        Returns:
+            The updated tree and the addresses of the statements that changed
+
+        Raises:
+            ValueError: If the range is outside the document
+            HclParsingError: If an edited statement no longer parses; the
+                session is left at its previous state
+        """
+        if not 0 <= start <= end <= len(self._text):
+            raise ValueError(f"Edit range {start}:{end} is outside the document (length {len(self._text)})")
+
+        old_text = self._text
+        text = old_text[:start] + new_text + old_text[end:]
+        delta = len(new_text) - (end - start)
+        line_delta = new_text.count("\n") - old_text.count("\n", start, end)
+        segments = self._segments
+
+        # First statement the edit can affect. One that ends exactly at `start`
+        # is complete unless it is an unterminated final statement.
+        lo = next((i for i, segment in enumerate(segments) if segment.end > start), len(segments))
+        if lo > 0 and not segments[lo - 1].text.endswith("\n"):
+            lo -= 1
+        scan_offset = segments[lo - 1].end if lo > 0 else 0
+        scan_line = segments[lo - 1].end_line + 1 if lo > 0 else 1
+
+        # Boundaries after the edit, in new coordinates; reaching one means the
+        # rest of the document scans exactly as before.
+        resync = {
+            segment.start + delta: index
+            for index, segment in enumerate(segments[lo:], start=lo)
+            if segment.start >= end
+        }
+        edited_end = start + len(new_text)
+
+        rescanned: list[Segment] = []
+        hi = len(segments)
+        lines = split_lines(text[scan_offset:])
+        for segment in iter_segments(lines, first_line=scan_line, first_offset=scan_offset):
+            if segment.start >= edited_end and segment.start in resync:
+                hi = resync[segment.start]
+                break
+            rescanned.append(segment)
+
+        removed = segments[lo:hi]
+        previous: dict[tuple[str, str], list[Any]] = {}
+        for segment, fragment in zip(removed, self._fragments[lo:hi], strict=True):
+            previous.setdefault((segment.address, segment.text), []).append(fragment)
+
+        fragments = []
+        changed = set()
+        for segment in rescanned:
+            reusable = previous.get((segment.address, segment.text))
+            if reusable:
+                fragments.append(reusable.pop(0))
+            else:
+                fragments.append(self._parse(segment))
+                changed.add(segment.address)
+        # Whatever was not reused was modified or deleted.
+        changed.update(address for (address, _), left in previous.items() if left)
+
+        shifted = [
+            attrs.evolve(
+                segment,
+                start=segment.start + delta,
+                end=segment.end + delta,
+                start_line=segment.start_line + line_delta,
+                end_line=segment.end_line + line_delta,
+            )
+            for segment in segments[hi:]
+        ]
+
+        self._text = text
+        self._segments = segments[:lo] + rescanned + shifted
+        self._fragments = self._fragments[:lo] + fragments + self._fragments[hi:]
+        self._tree = merge_fragments(self._segments, self._fragments)
+        logger.debug("📄✏️ Reparsed edit", reparsed=len(rescanned), changed=len(changed))
+        return ReparseResult(tree=self._tree, changed=frozenset(changed))
+
+    def update(self, text: str) -> ReparseResult:
+        """Replace the whole document, reparsing only the region that differs.
+
+        For editors that send the full buffer rather than an edit range.
+        """
+        old_text = self._text
+        prefix = _common_length(old_text, text, lambda n: old_text[:n] == text[:n])
+        limit = min(len(old_text), len(text)) - prefix
+        suffix = _common_length(
+            old_text, text, lambda n: n <= limit and old_text[len(old_text) - n :] == text[len(text) - n :]
+        )
+        return self.apply_edit(prefix, len(old_text) - suffix, text[prefix : len(text) - suffix])
+
+
+# 📄⚙️🔚
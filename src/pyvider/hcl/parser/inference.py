@@ -8,14 +8,220 @@
 This module provides HCL-specific wrappers around pyvider-cty's canonical
 type inference implementation, which correctly handles lists, objects, and
 all CTY types with sophisticated element type analysis and caching.
+
+For the data a parser produces -- dicts with string keys, lists, strings,
+numbers, booleans and None -- the type and the value are built together in
+a single walk rather than inferring a type and then validating the data
+against it, and `infer_type` infers the type alone in the same way. Anything
+else is handed to pyvider-cty whole.
 """
 
 from __future__ import annotations
 
+from decimal import Decimal
 from typing import Any
+import unicodedata
 
-from pyvider.cty import CtyValue
+from pyvider.cty import CtyBool, CtyDynamic, CtyList, CtyNumber, CtyObject, CtyString, CtyType, CtyValue
 from pyvider.cty.conversion import infer_cty_type_from_raw
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.hcl.parser.compiling import MAX_DEPTH
+
+_STRING_TYPE = CtyString()
+_NUMBER_TYPE = CtyNumber()
+_BOOL_TYPE = CtyBool()
+_DYNAMIC_TYPE = CtyDynamic()
+_DYNAMIC_NULL = CtyValue.null(_DYNAMIC_TYPE)
+_EMPTY_LIST_TYPE = CtyList(element_type=_DYNAMIC_TYPE)
+
+# Interned container types, keyed by shape: attribute names and the ids of
+# the (themselves interned) attribute or element types. Configurations
+# repeat the same shapes -- tags, ingress rules, whole resources -- so most
+# objects find their type here. An entry's type holds the types its key
+# refers to, so those ids stay valid while it is cached.
+_SHAPE_CACHE_SIZE = 4096
+_object_types: dict[tuple[tuple[str, ...], tuple[int, ...]], CtyObject] = {}
+_list_types: dict[int, CtyList[Any]] = {id(_DYNAMIC_TYPE): _EMPTY_LIST_TYPE}
+
+
+def _object_type(names: tuple[str, ...], types: tuple[CtyType[Any], ...]) -> CtyObject:
+    key = (names, tuple(map(id, types)))
+    object_type = _object_types.get(key)
+    if object_type is None:
+        if len(_object_types) >= _SHAPE_CACHE_SIZE:
+            _object_types.clear()
+        object_type = _object_types[key] = CtyObject(attribute_types=dict(zip(names, types, strict=True)))
+    return object_type
+
+
+def _list_type(element_type: CtyType[Any]) -> CtyList[Any]:
+    list_type = _list_types.get(id(element_type))
+    if list_type is None:
+        if len(_list_types) >= _SHAPE_CACHE_SIZE:
+            _list_types.clear()
+        list_type = _list_types[id(element_type)] = CtyList(element_type=element_type)
+    return list_type
+
+
+def clear_type_cache() -> None:
+    """Drop the interned container types inference reuses across calls."""
+    _object_types.clear()
+    _list_types.clear()
+    _list_types[id(_DYNAMIC_TYPE)] = _EMPTY_LIST_TYPE
+
+
+class _Unsupported(Exception):
+    """Raised by the builder for data only pyvider-cty's inference handles."""
+
+
+def _unify(types: list[CtyType[Any]]) -> CtyType[Any]:
+    """The element type inference gives a list whose elements have `types`.
+
+    The same rule as pyvider-cty's inference: the common type when there is
+    one, element- or attribute-wise for lists and for objects with the same
+    attribute names, and dynamic otherwise. Nothing is converted.
+    """
+    first = types[0]
+    if all(candidate is first or candidate == first for candidate in types):
+        return first
+    if any(isinstance(candidate, CtyDynamic) for candidate in types):
+        return _DYNAMIC_TYPE
+    if all(isinstance(candidate, CtyList) for candidate in types):
+        return _list_type(_unify([candidate.element_type for candidate in types]))  # type: ignore[attr-defined]
+    if all(isinstance(candidate, CtyObject) for candidate in types):
+        names = first.attribute_types.keys()  # type: ignore[attr-defined]
+        if any(candidate.attribute_types.keys() != names for candidate in types):  # type: ignore[attr-defined]
+            return _DYNAMIC_TYPE
+        return _object_type(
+            tuple(names),
+            tuple(_unify([candidate.attribute_types[name] for candidate in types]) for name in names),  # type: ignore[attr-defined]
+        )
+    return _DYNAMIC_TYPE
+
+
+def _type_of(raw_data: Any, depth: int = 0) -> CtyType[Any]:
+    """The type `_ValueBuilder.build` would give `raw_data`, without building values."""
+    kind = type(raw_data)
+    if kind is str:
+        return _STRING_TYPE
+    if kind is bool:
+        return _BOOL_TYPE
+    if kind is int or kind is float or kind is Decimal:
+        return _NUMBER_TYPE
+    if raw_data is None:
+        return _DYNAMIC_TYPE
+    if depth == MAX_DEPTH:
+        raise _Unsupported
+    if kind is dict or kind is FrozenDict:
+        return _object_type_of(raw_data, depth + 1)
+    if kind is list:
+        if not raw_data:
+            return _EMPTY_LIST_TYPE
+        return _list_type(_unify([_type_of(item, depth + 1) for item in raw_data]))
+    raise _Unsupported
+
+
+def _object_type_of(raw_data: dict[Any, Any], depth: int) -> CtyObject:
+    names = []
+    for key in raw_data:
+        if type(key) is not str:
+            raise _Unsupported
+        names.append(key if key.isascii() else unicodedata.normalize("NFC", key))
+    if len(set(names)) != len(names):
+        # Two spellings of one name, which validation refuses.
+        raise _Unsupported
+    return _object_type(tuple(names), tuple(_type_of(item, depth) for item in raw_data.values()))
+
+
+class _ValueBuilder:
+    """Builds a value and its inferred type in one walk over plain parser output.
+
+    A list's elements are re-typed to the list's unified element type. When
+    the list is itself re-typed by an enclosing list, its elements have to be
+    re-typed again from their own types, so those are kept (along with the
+    list value, which keeps its id unique) until the build finishes.
+    """
+
+    __slots__ = ("_elements",)
+
+    def __init__(self) -> None:
+        self._elements: dict[int, tuple[CtyValue[Any], list[CtyValue[Any]]]] = {}
+
+    def build(self, raw_data: Any, depth: int = 0) -> CtyValue[Any]:
+        kind = type(raw_data)
+        if kind is str:
+            return CtyValue(
+                vtype=_STRING_TYPE,
+                value=raw_data if raw_data.isascii() else unicodedata.normalize("NFC", raw_data),
+            )
+        if kind is bool:
+            return CtyValue(vtype=_BOOL_TYPE, value=raw_data)
+        if kind is int or kind is float or kind is Decimal:
+            return CtyValue(vtype=_NUMBER_TYPE, value=Decimal(raw_data))
+        if raw_data is None:
+            return _DYNAMIC_NULL
+        if depth == MAX_DEPTH:
+            raise _Unsupported
+        if kind is dict or kind is FrozenDict:
+            return self._object(raw_data, depth + 1)
+        if kind is list:
+            return self._list(raw_data, depth + 1)
+        raise _Unsupported
+
+    def _object(self, raw_data: dict[Any, Any], depth: int) -> CtyValue[Any]:
+        attributes = {}
+        for key, item in raw_data.items():
+            if type(key) is not str:
+                raise _Unsupported
+            attributes[key if key.isascii() else unicodedata.normalize("NFC", key)] = self.build(item, depth)
+        if len(attributes) != len(raw_data):
+            # Two spellings of one name, which validation refuses.
+            raise _Unsupported
+        object_type = _object_type(tuple(attributes), tuple(item.vtype for item in attributes.values()))
+        return CtyValue(vtype=object_type, value=FrozenDict(attributes))
+
+    def _list(self, raw_data: list[Any], depth: int) -> CtyValue[Any]:
+        elements = [self.build(item, depth) for item in raw_data]
+        if not elements:
+            return CtyValue(vtype=_EMPTY_LIST_TYPE, value=())
+        element_type = _unify([element.vtype for element in elements])
+        conformed = tuple(self.conform(element, element_type) for element in elements)
+        value = CtyValue(vtype=_list_type(element_type), value=conformed)
+        if any(new is not old for new, old in zip(conformed, elements, strict=True)):
+            self._elements[id(value)] = (value, elements)
+        return value
+
+    def conform(self, value: CtyValue[Any], vtype: CtyType[Any]) -> CtyValue[Any]:
+        """Re-type a built value to a type `_unify` produced from its own."""
+        if value.vtype is vtype or value.vtype == vtype:
+            return value
+        if isinstance(vtype, CtyDynamic):
+            return CtyValue(vtype=vtype, value=value)
+        if isinstance(vtype, CtyList):
+            kept = self._elements.get(id(value))
+            elements: Any = kept[1] if kept is not None else value.value
+            element_type = vtype.element_type
+            return CtyValue(vtype=vtype, value=tuple(self.conform(item, element_type) for item in elements))
+        if isinstance(vtype, CtyObject):
+            attributes: Any = value.value
+            conformed = {
+                name: self.conform(attributes[name], item) for name, item in vtype.attribute_types.items()
+            }
+            return CtyValue(vtype=vtype, value=FrozenDict(conformed))
+        raise _Unsupported
+
+
+def infer_type(raw_data: Any) -> CtyType[Any]:
+    """Infer the CTY type of raw Python data without building its value.
+
+    Gives the type `auto_infer_cty_type` would, sharing its interned
+    container types, from one walk over plain parser output; other data
+    goes through pyvider-cty's inference.
+    """
+    try:
+        return _type_of(raw_data)
+    except _Unsupported:
+        return infer_cty_type_from_raw(raw_data)
 
 
 def auto_infer_cty_type(raw_data: Any) -> CtyValue[Any]:
@@ -38,16 +244,20 @@ def auto_infer_cty_type(raw_data: Any) -> CtyValue[Any]:
         True
 
     Note:
-        This delegates to pyvider.cty.conversion.infer_cty_type_from_raw()
-        which provides sophisticated type inference including:
+        The result is the value pyvider.cty.conversion.infer_cty_type_from_raw()
+        followed by validation gives, which provides sophisticated type
+        inference including:
         - List element type analysis (e.g., [1,2,3] → list(number))
         - Object attribute inference
         - Type unification for mixed collections
         - Caching and cycle detection
+        Plain parser output is built in a single pass; other data, and data
+        nested unusually deeply, goes through pyvider-cty.
     """
-    # Use pyvider-cty's canonical inference implementation
-    inferred_type = infer_cty_type_from_raw(raw_data)
-    return inferred_type.validate(raw_data)
+    try:
+        return _ValueBuilder().build(raw_data)
+    except _Unsupported:
+        return infer_cty_type_from_raw(raw_data).validate(raw_data)
 
 
 # 📄⚙️🔚
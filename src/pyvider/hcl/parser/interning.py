@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""One string object per distinct attribute name, block type and label.
+
+python-hcl2 makes a new string for every identifier it reads, so a thousand
+resources with a ``tags`` attribute hold a thousand ``"tags"`` strings, and
+so do the `CtyValue`s built from them. Keys are interned with `sys.intern`
+as each document is loaded, so every document in the process shares them,
+including across a batch. Values are left alone: they repeat far less and
+can be large.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+
+def intern_keys(raw_data: Any) -> Any:
+    """Intern every dict key in freshly parsed raw data, in place.
+
+    Dicts are refilled rather than rebuilt, so containers keep their identity
+    and insertion order. Data must be mutable, as the loaders produce it.
+
+    Returns:
+        `raw_data`, for chaining
+    """
+    intern = sys.intern
+    stack = [raw_data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            pairs = [(intern(key) if type(key) is str else key, value) for key, value in node.items()]
+            node.clear()
+            node.update(pairs)
+            stack.extend(value for _, value in pairs if isinstance(value, dict | list))
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, dict | list))
+    return raw_data
+
+
+# 📄⚙️🔚
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Loading of the JSON variant of HCL (``.tf.json``, ``.hcl.json``).
+
+Machine-generated configurations are usually written in JSON syntax. They are
+decoded with a JSON decoder -- orjson when it is installed, the standard
+library otherwise -- and reshaped into the structure python-hcl2 produces for
+native syntax, so nothing downstream needs to know which syntax a file used.
+
+JSON syntax does not say which properties are blocks; that comes from the
+schema. Top-level Terraform block types (``resource``, ``variable``, ...)
+are recognised by name with their label counts and expanded into the
+native shape. Everything inside a block body is kept as written, and a
+``"//"`` property at the top level or directly in a block body is a comment
+and is dropped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import json
+from pathlib import Path
+from typing import Any
+
+from pyvider.cty import CtyType, CtyValue
+from pyvider.cty.exceptions import CtyError as CtySchemaError, CtyValidationError
+from pyvider.hcl.exceptions import HclParsingError
+from pyvider.hcl.parser.cache import ParseCache, SchemaKey, content_digest, freeze_raw
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.interning import intern_keys
+from pyvider.hcl.parser.limits import Budget, ParseLimits, start_budget
+from pyvider.hcl.parser.validators import compile_validator
+
+try:
+    import orjson
+
+    _decode: Any = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _decode = json.loads
+
+JSON_SUFFIXES = (".tf.json", ".hcl.json", ".tfvars.json")
+
+# Label counts of Terraform's top-level block types.
+BLOCK_LABELS: dict[str, int] = {
+    "check": 1,
+    "data": 2,
+    "ephemeral": 2,
+    "import": 0,
+    "locals": 0,
+    "module": 1,
+    "moved": 0,
+    "output": 1,
+    "provider": 1,
+    "removed": 0,
+    "resource": 2,
+    "terraform": 0,
+    "variable": 1,
+}
+
+_COMMENT_KEY = "//"
+
+
+def is_json_path(path: Path | str) -> bool:
+    """Return True if `path` names a JSON-syntax HCL file."""
+    return str(path).endswith(JSON_SUFFIXES)
+
+
+def _body(value: Any, block_type: str) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ValueError(f"{block_type!r} block body must be a JSON object, got {type(value).__name__}")
+    return {key: item for key, item in value.items() if key != _COMMENT_KEY}
+
+
+def _expand(value: Any, depth: int, block_type: str) -> Iterator[tuple[tuple[str, ...], dict[str, Any]]]:
+    """Yield (labels, body) for every block under a block-type property."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _expand(item, depth, block_type)
+        return
+    if depth == 0:
+        yield (), _body(value, block_type)
+        return
+    if not isinstance(value, dict):
+        raise ValueError(f"{block_type!r} block labels must be JSON object keys, got {type(value).__name__}")
+    for label, nested in value.items():
+        if label == _COMMENT_KEY:
+            continue
+        for labels, body in _expand(nested, depth - 1, block_type):
+            yield (label, *labels), body
+
+
+def normalize_json_config(data: Any, block_labels: Mapping[str, int] = BLOCK_LABELS) -> dict[str, Any]:
+    """Reshape decoded JSON-syntax configuration into python-hcl2's native shape.
+
+    Args:
+        data: Decoded JSON document
+        block_labels: Top-level block types and their label counts; any
+            other top-level property is an attribute
+
+    Returns:
+        Raw data shaped as `parse_with_context` returns it for native syntax
+
+    Raises:
+        ValueError: If the document or a block is not shaped as JSON syntax requires
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"JSON configuration must be an object, got {type(data).__name__}")
+
+    result: dict[str, Any] = {}
+    for key, value in data.items():
+        if key == _COMMENT_KEY:
+            continue
+        depth = block_labels.get(key)
+        if depth is None:
+            result[key] = value
+            continue
+        blocks = result.setdefault(key, [])
+        for labels, body in _expand(value, depth, key):
+            node: Any = body
+            for label in reversed(labels):
+                node = {label: node}
+            blocks.append(node)
+    return result
+
+
+def _block_labels(source_file: Path | str | None) -> Mapping[str, int]:
+    # Variable files hold only attributes, whatever their names.
+    return {} if source_file and str(source_file).endswith(".tfvars.json") else BLOCK_LABELS
+
+
+def _load(
+    content: str | bytes, source_file: Path | str | None, budget: Budget | None = None
+) -> dict[str, Any]:
+    try:
+        data = _decode(content)
+        if budget is not None:
+            budget.check_data(data)
+        return intern_keys(normalize_json_config(data, _block_labels(source_file)))  # type: ignore[no-any-return]
+    except json.JSONDecodeError as e:
+        raise HclParsingError(
+            message=f"Invalid JSON syntax: {e.msg}",
+            source_file=str(source_file) if source_file else None,
+            line=e.lineno,
+            column=e.colno,
+        ) from e
+    except ValueError as e:
+        raise HclParsingError(
+            message=f"Invalid JSON configuration: {e}",
+            source_file=str(source_file) if source_file else None,
+        ) from e
+
+
+def parse_json_with_context(
+    content: str | bytes,
+    source_file: Path | str | None = None,
+    *,
+    cache: ParseCache | None = None,
+    limits: ParseLimits | None = None,
+) -> Any:
+    """Parse JSON-syntax HCL into the raw shape `parse_with_context` returns.
+
+    Args:
+        content: JSON document
+        source_file: Optional source file path for error reporting
+        cache: Optional cache; results are then returned deeply frozen
+        limits: Optional bounds on size, nesting, value count and time
+
+    Returns:
+        Raw parsed data
+
+    Raises:
+        HclParsingError: If the JSON is invalid or not shaped as configuration
+        HclLimitError: If the document exceeds `limits`
+
+    Example:
+        >>> data = parse_json_with_context('{"variable": {"region": {"default": "us-east-1"}}}')
+        >>> data["variable"]
+        [{'region': {'default': 'us-east-1'}}]
+    """
+    budget = start_budget(limits, source_file)
+    if budget is not None:
+        budget.check_size(content)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = ("json", content_digest(content), _block_labels(source_file) is BLOCK_LABELS)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    raw_data = _load(content, source_file, budget)
+
+    if cache is not None:
+        raw_data = freeze_raw(raw_data)
+        cache.put(cache_key, raw_data)
+    return raw_data
+
+
+def parse_json_to_cty(
+    content: str | bytes,
+    schema: CtyType[Any] | None = None,
+    *,
+    source_file: Path | str | None = None,
+    cache: ParseCache | None = None,
+    limits: ParseLimits | None = None,
+) -> CtyValue[Any]:
+    """Parse JSON-syntax HCL directly into a CtyValue.
+
+    Args:
+        content: JSON document
+        schema: Optional CTY type schema for validation
+        source_file: Optional source file path for error reporting
+        cache: Optional cache; identical content and the same schema object return
+            the cached value
+        limits: Optional bounds on size, nesting, value count and time
+
+    Returns:
+        Parsed and validated CTY value
+
+    Raises:
+        HclParsingError: If parsing or validation fails
+        HclLimitError: If the document exceeds `limits`
+    """
+    budget = start_budget(limits, source_file)
+    if budget is not None:
+        budget.check_size(content)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = (
+            "cty-json",
+            content_digest(content),
+            _block_labels(source_file) is BLOCK_LABELS,
+            SchemaKey(schema),
+        )
+        cached: CtyValue[Any] | None = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    raw_data = _load(content, source_file, budget)
+    if schema:
+        try:
+            result = compile_validator(schema)(raw_data)
+        except (CtySchemaError, CtyValidationError) as e:
+            raise HclParsingError(
+                message=f"Schema validation failed after HCL parsing: {e}",
+                source_file=str(source_file) if source_file else None,
+            ) from e
+    else:
+        result = auto_infer_cty_type(raw_data)
+    if budget is not None:
+        budget.check_deadline()
+
+    if cache is not None:
+        cache.put(cache_key, result)
+    return result
+
+
+# 📄⚙️🔚
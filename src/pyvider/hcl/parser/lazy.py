@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Lazily materialized `CtyValue` trees for large configurations.
+
+A `LazyCtyValue` holds the raw parse of an object and builds nothing until
+it is read. Reading `value` builds that one level: scalars and lists become
+ordinary values, nested objects -- including those inside lists -- become
+further lazy values. Reading `type`
+infers the type of the subtree without building any values. Both are
+memoized, so a caller that reads two attributes of a large configuration
+pays for those two and the objects on the way to them.
+
+A lazy value is a `CtyValue` subclass and compares, hashes and subscripts
+like the eager value `auto_infer_cty_type` would return for the same data.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyvider.cty import CtyDynamic, CtyList, CtyObject, CtyType, CtyValue
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.hcl.parser.inference import auto_infer_cty_type, infer_type
+
+
+def _deferrable(raw_data: Any) -> bool:
+    # Non-ASCII attribute names are normalized as part of validation, so
+    # those objects are built eagerly.
+    return isinstance(raw_data, dict) and all(key.isascii() for key in raw_data)
+
+
+def _conform(raw_data: Any, vtype: CtyType[Any]) -> CtyValue[Any]:
+    """Return what ``vtype.validate(raw_data)`` would, deferring the objects in it."""
+    if _deferrable(raw_data):
+        if isinstance(vtype, CtyDynamic):
+            return CtyValue(vtype=vtype, value=LazyCtyValue(raw_data))
+        if isinstance(vtype, CtyObject) and vtype.attribute_types.keys() == raw_data.keys():
+            return LazyCtyValue(raw_data, vtype)
+    elif isinstance(vtype, CtyList) and isinstance(raw_data, list):
+        element_type = vtype.element_type
+        return CtyValue(vtype=vtype, value=tuple(_conform(item, element_type) for item in raw_data))
+    # Anything that needs converting or filling in is left to validation.
+    return vtype.validate(raw_data)
+
+
+def lazy_cty_value(raw_data: Any) -> CtyValue[Any]:
+    """Return the value for raw data, deferring the objects within it.
+
+    Objects become `LazyCtyValue`s. A list's type is inferred up front, as it
+    depends on every element, but the objects among its elements are still
+    deferred -- block bodies sit in lists. Scalars are built directly.
+    """
+    if _deferrable(raw_data):
+        return LazyCtyValue(raw_data)
+    if isinstance(raw_data, list):
+        return _conform(raw_data, infer_type(raw_data))
+    return auto_infer_cty_type(raw_data)
+
+
+class LazyCtyValue(CtyValue[Any]):
+    """An object `CtyValue` whose type and attributes are built on first access.
+
+    Operations that return a modified copy (marking, pickling) act on the
+    fully built value instead; use `materialize` to get it directly.
+
+    Example:
+        >>> config = LazyCtyValue({"region": "us-east-1", "tags": {"env": "prod"}})
+        >>> config["tags"]["env"].value
+        'prod'
+    """
+
+    __slots__ = ("_lazy_payload", "_lazy_raw", "_lazy_type")
+
+    _lazy_raw: dict[str, Any]
+    _lazy_payload: FrozenDict | None
+    _lazy_type: CtyType[Any] | None
+
+    def __init__(self, raw_data: dict[str, Any], vtype: CtyType[Any] | None = None) -> None:
+        object.__setattr__(self, "is_unknown", False)
+        object.__setattr__(self, "is_null", False)
+        object.__setattr__(self, "marks", frozenset())
+        object.__setattr__(self, "_deep_marks", None)
+        object.__setattr__(self, "_stripped", None)
+        object.__setattr__(self, "_lazy_raw", raw_data)
+        object.__setattr__(self, "_lazy_payload", None)
+        object.__setattr__(self, "_lazy_type", vtype)
+
+    @property
+    def vtype(self) -> CtyType[Any]:
+        vtype: CtyType[Any] | None = self._lazy_type
+        if vtype is None:
+            vtype = infer_type(self._lazy_raw)
+            object.__setattr__(self, "_lazy_type", vtype)
+        return vtype
+
+    @property
+    def value(self) -> FrozenDict:
+        payload: FrozenDict | None = self._lazy_payload
+        if payload is None:
+            vtype = self._lazy_type
+            if isinstance(vtype, CtyObject):
+                # Typed by an enclosing list's unified element type.
+                types = vtype.attribute_types
+                payload = FrozenDict({key: _conform(item, types[key]) for key, item in self._lazy_raw.items()})
+            else:
+                payload = FrozenDict({key: lazy_cty_value(item) for key, item in self._lazy_raw.items()})
+            object.__setattr__(self, "_lazy_payload", payload)
+        return payload
+
+    @property
+    def raw_data(self) -> dict[str, Any]:
+        """The raw parse this value is built from."""
+        return self._lazy_raw
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether this level's attributes have been built."""
+        return self._lazy_payload is not None
+
+    def _through_dynamic(self) -> CtyValue[Any] | None:
+        # Always an object, never a `dynamic` wrapper; answering from `vtype`
+        # would infer the whole subtree.
+        return None
+
+    def _select(self, key: Any) -> CtyValue[Any]:
+        # Attribute access needs only the payload; the base class would infer
+        # the whole subtree's type first to check the name.
+        if isinstance(key, str) and key in self._lazy_raw:
+            child: CtyValue[Any] = self.value[key]
+            return child
+        return super()._select(key)
+
+    def materialize(self) -> CtyValue[Any]:
+        """Build the equivalent eager value for the whole subtree."""
+        return auto_infer_cty_type(self._lazy_raw)
+
+    def mark(self, mark: object) -> CtyValue[Any]:  # type: ignore[override]
+        return self.materialize().mark(mark)
+
+    def with_marks(self, marks_to_add: Any) -> CtyValue[Any]:  # type: ignore[override]
+        return self.materialize().with_marks(marks_to_add)
+
+    def unmark(self) -> tuple[CtyValue[Any], frozenset[Any]]:  # type: ignore[override]
+        return self.materialize(), frozenset()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return auto_infer_cty_type, (self._lazy_raw,)
+
+    def __repr__(self) -> str:
+        state = "materialized" if self.is_materialized else "pending"
+        return f"LazyCtyValue(attributes={list(self._lazy_raw)!r}, {state})"
+
+
+# 📄⚙️🔚
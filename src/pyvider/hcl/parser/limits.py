@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Resource limits for parsing untrusted HCL.
+
+Every limit is checked as early as it can be, so a pathological document
+fails fast instead of occupying a worker:
+
+- ``max_bytes`` before anything else, including cache lookups.
+- ``max_depth`` and ``timeout`` token by token while Lark parses, before
+  python-hcl2 turns the parse tree into data. Its transformer recurses, so
+  deep nesting must be refused before it gets there.
+- ``max_nodes`` and ``max_depth`` on the parsed data, with ``timeout``,
+  before types are inferred or a schema is applied. Inference and
+  validation are linear in the data, so bounding it bounds them; the
+  deadline is checked again once they finish.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+import functools
+from pathlib import Path
+import time
+from typing import Any
+
+import attrs
+from attrs import define, field, validators
+from lark import Lark, Tree
+
+from pyvider.hcl.exceptions import HclLimitError
+from pyvider.hcl.parser.source import HclSource, source_size
+
+_OPENERS = frozenset({"{", "[", "(", "${"})
+_CLOSERS = frozenset({"}", "]", ")"})
+
+# Tokens or values between clock reads; reading it each time costs more than
+# the work it guards.
+_CLOCK_INTERVAL = 256
+
+_optional_positive = validators.optional(validators.gt(0))
+
+
+@define(frozen=True, slots=True)
+class ParseLimits:
+    """Bounds on the work a single parse may do.
+
+    Each limit is off when None.
+
+    Attributes:
+        max_bytes: Largest document accepted, in UTF-8 bytes
+        max_depth: Deepest nesting accepted, counting brackets, braces and
+            parentheses in the source and objects and lists in the parsed
+            data (blocks add a level per label there)
+        max_nodes: Most values (scalars, objects and lists) the parsed
+            document may contain
+        timeout: Seconds from the start of the call after which parsing,
+            inference and validation are abandoned
+
+    Example:
+        >>> limits = ParseLimits(max_bytes=1 << 20, max_depth=32, timeout=2.0)
+        >>> parse_hcl_to_cty(tenant_content, limits=limits)
+    """
+
+    max_bytes: int | None = field(default=None, validator=_optional_positive)
+    max_depth: int | None = field(default=None, validator=_optional_positive)
+    max_nodes: int | None = field(default=None, validator=_optional_positive)
+    timeout: float | None = field(default=None, validator=_optional_positive)
+
+    def start(self, source_file: Path | str | None = None) -> Budget:
+        """Start the clock for one call; errors name `source_file`."""
+        return Budget(self, source_file)
+
+
+@functools.cache
+def _bracket_types(parser: Lark) -> tuple[frozenset[str], frozenset[str]]:
+    """Names of the terminals that open and close a nesting level.
+
+    Matching on token type rather than text keeps string contents, such as
+    ``"{"``, from counting as nesting.
+    """
+    literals = [terminal for terminal in parser.terminals if terminal.pattern.type == "str"]
+    return (
+        frozenset(terminal.name for terminal in literals if terminal.pattern.value in _OPENERS),
+        frozenset(terminal.name for terminal in literals if terminal.pattern.value in _CLOSERS),
+    )
+
+
+class Budget:
+    """The limits for one call, with its deadline fixed when the call began."""
+
+    __slots__ = ("_deadline", "_source_file", "limits")
+
+    def __init__(self, limits: ParseLimits, source_file: Path | str | None = None) -> None:
+        self.limits = limits
+        self._source_file = str(source_file) if source_file else None
+        self._deadline = None if limits.timeout is None else time.monotonic() + limits.timeout
+
+    def _exceeded(
+        self, limit: str, message: str, line: int | None = None, column: int | None = None
+    ) -> HclLimitError:
+        return HclLimitError(
+            message=message, source_file=self._source_file, line=line, column=column, limit=limit
+        )
+
+    def check_deadline(self) -> None:
+        """Raise if the call has run past its timeout."""
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise self._exceeded("timeout", f"HCL parsing exceeded its {self.limits.timeout}s timeout")
+
+    def remaining(self) -> ParseLimits:
+        """The limits with ``timeout`` cut to the time left.
+
+        For handing the rest of a call to another entry point, which starts
+        its own budget, without restarting the clock.
+        """
+        if self._deadline is None:
+            return self.limits
+        left = self._deadline - time.monotonic()
+        if left <= 0:
+            raise self._exceeded("timeout", f"HCL parsing exceeded its {self.limits.timeout}s timeout")
+        return attrs.evolve(self.limits, timeout=left)
+
+    def check_size(self, content: HclSource) -> None:
+        """Raise if the document is larger than ``max_bytes``."""
+        max_bytes = self.limits.max_bytes
+        if max_bytes is None:
+            return
+        size = source_size(content)
+        # A character is at most four UTF-8 bytes, so most documents need no encoding.
+        if isinstance(content, str) and max_bytes < size * 4 and size <= max_bytes:
+            size = len(content.encode("utf-8", "surrogatepass"))
+        if size > max_bytes:
+            raise self._exceeded("max_bytes", f"HCL document is larger than {max_bytes} bytes")
+
+    def parse(self, parser: Lark, text: str) -> Tree[Any]:
+        """Parse with Lark token by token, checking depth and the deadline."""
+        max_depth = self.limits.max_depth
+        checks_clock = self._deadline is not None
+        if max_depth is None and not checks_clock:
+            return parser.parse(text)
+
+        openers, closers = _bracket_types(parser)
+        interactive = parser.parse_interactive(text)
+        depth = 0
+        countdown = _CLOCK_INTERVAL
+        token = None
+        for token in interactive.iter_parse():
+            if max_depth is not None:
+                if token.type in openers:
+                    depth += 1
+                    if depth > max_depth:
+                        raise self._exceeded(
+                            "max_depth", f"HCL nesting is deeper than {max_depth}", token.line, token.column
+                        )
+                elif token.type in closers:
+                    depth -= 1
+            if checks_clock:
+                countdown -= 1
+                if not countdown:
+                    countdown = _CLOCK_INTERVAL
+                    self.check_deadline()
+        tree: Tree[Any] = interactive.feed_eof(token)  # type: ignore[no-untyped-call]
+        return tree
+
+    def check_data(self, raw_data: Any) -> None:
+        """Raise if parsed data is too deep or has too many values."""
+        self.check_deadline()
+        limits = self.limits
+        if limits.max_depth is None and limits.max_nodes is None:
+            return
+        max_depth = limits.max_depth if limits.max_depth is not None else -1
+        max_nodes = limits.max_nodes if limits.max_nodes is not None else -1
+        nodes = 0
+        stack: list[tuple[Any, int]] = [(raw_data, 1)]
+        while stack:
+            value, depth = stack.pop()
+            nodes += 1
+            if nodes == max_nodes + 1:
+                raise self._exceeded("max_nodes", f"HCL document has more than {max_nodes} values")
+            if not nodes % _CLOCK_INTERVAL:
+                self.check_deadline()
+            children: Collection[Any]
+            if isinstance(value, dict):
+                children = value.values()
+            elif isinstance(value, list | tuple):
+                children = value
+            else:
+                continue
+            if depth == max_depth + 1:
+                raise self._exceeded("max_depth", f"HCL nesting is deeper than {max_depth}")
+            stack.extend((child, depth + 1) for child in children)
+
+
+def start_budget(limits: ParseLimits | None, source_file: Path | str | None = None) -> Budget | None:
+    """A budget for one call, or None when there are no limits."""
+    return None if limits is None else limits.start(source_file)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""The single call site for python-hcl2.
+
+Every parse entry point turns HCL text into raw Python data through
+`load_raw`, so concerns that belong to that step live in one place. It does
+what `hcl2.loads` does, but with the parser from `pyvider.hcl.parser.grammar`
+so the serialized artifact and `warmup` apply to every entry point.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from hcl2.transformer import DictTransformer
+
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.grammar import get_parser
+from pyvider.hcl.parser.interning import intern_keys
+from pyvider.hcl.parser.limits import Budget
+from pyvider.hcl.parser.tfvars import scan_attributes
+
+if TYPE_CHECKING:
+    from pyvider.hcl.parser.stats import ParseStats
+
+
+def _loads(content: str, budget: Budget | None = None) -> Any:
+    # python-hcl2's grammar needs every statement newline-terminated, including
+    # the last one; `hcl2.loads` appends the newline for the same reason.
+    # Most documents already end with one, and appending copies the whole text.
+    text = content if content.endswith("\n") else content + "\n"
+    tree = get_parser().parse(text) if budget is None else budget.parse(get_parser(), text)
+    return DictTransformer(with_meta=False).transform(tree)
+
+
+def _load(
+    content: str,
+    disk_cache: DiskParseCache | None,
+    fast_path: bool,
+    budget: Budget | None,
+    stats: ParseStats | None = None,
+) -> Any:
+    if fast_path:
+        attributes = scan_attributes(content)
+        if attributes is not None:
+            if stats is not None:
+                stats.fast_path += 1
+            return attributes
+
+    if disk_cache is None:
+        return _loads(content, budget)
+
+    key = disk_cache.key_for(content)
+    raw_data = disk_cache.get(key)
+    if raw_data is None:
+        raw_data = _loads(content, budget)
+        disk_cache.put(key, raw_data)
+    elif stats is not None:
+        stats.disk_cache_hits += 1
+    return raw_data
+
+
+def load_raw(
+    content: str,
+    *,
+    disk_cache: DiskParseCache | None = None,
+    fast_path: bool = True,
+    budget: Budget | None = None,
+    stats: ParseStats | None = None,
+) -> Any:
+    """Parse HCL text into raw Python data with python-hcl2.
+
+    Args:
+        content: HCL content string to parse
+        disk_cache: Optional persistent cache consulted before parsing
+        fast_path: Try the attribute-only scanner first; documents it cannot
+            handle still go to python-hcl2
+        budget: Optional limits on parsing and on the parsed data; the
+            document size is the caller's to check, before any cache lookup
+        stats: Optional stats counting fast-path and disk cache hits; timing
+            is the caller's
+
+    Returns:
+        Raw parsed data (typically a dict), its keys interned so that
+        documents share one string per attribute name, block type and label
+
+    Raises:
+        HclLimitError: If the budget is exceeded
+        Exception: Whatever python-hcl2 raises; callers wrap it with context.
+    """
+    raw_data = _load(content, disk_cache, fast_path, budget, stats)
+    if budget is not None:
+        budget.check_data(raw_data)
+    return intern_keys(raw_data)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Source positions for parse errors.
+
+Lark reports where it failed as an offset into the text it parsed. A
+`LineIndex` turns offsets into line and column with a binary search over an
+array of line-start offsets, without copying any line. It is only built once
+an error needs locating, so successful parses never pay for it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+from lark.exceptions import UnexpectedInput, UnexpectedToken, VisitError
+
+from pyvider.hcl.exceptions import HclParsingError
+
+
+class LineIndex:
+    """Offsets at which each line of a text starts.
+
+    Lines are split on ``\\n`` only, as the parser counts them; lines and
+    columns are 1-based, and columns count characters.
+    """
+
+    __slots__ = ("_length", "_starts")
+
+    def __init__(self, text: str) -> None:
+        starts = array("q", [0])
+        find = text.find
+        pos = find("\n")
+        while pos >= 0:
+            starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+        self._starts = starts
+        self._length = len(text)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def locate(self, offset: int) -> tuple[int, int]:
+        """Return the line and column of an offset, clamped to the text."""
+        offset = min(max(offset, 0), self._length)
+        line = bisect_right(self._starts, offset)
+        return line, offset - self._starts[line - 1] + 1
+
+
+def error_offset(error: BaseException) -> int | None:
+    """Offset into the parsed text that a python-hcl2 error points at, if any."""
+    if isinstance(error, UnexpectedInput):
+        return error.pos_in_stream
+    if isinstance(error, VisitError):
+        # Transformer failures, such as a repeated attribute, carry the
+        # position of the rule being transformed.
+        meta = getattr(error.obj, "meta", None)
+        if meta is not None and not meta.empty:
+            start: int = meta.start_pos
+            return start
+    return None
+
+
+def located_error(
+    message: str,
+    error: BaseException,
+    text: str,
+    *,
+    source_file: Path | str | None = None,
+    first_line: int = 1,
+) -> HclParsingError:
+    """Build an `HclParsingError` at the position `error` points at in `text`.
+
+    Args:
+        message: Error message
+        error: Exception python-hcl2 raised while parsing `text`
+        text: The text that was parsed
+        source_file: Optional source path for error reporting
+        first_line: Line number of the first line of `text`, when it is
+            part of a larger document; used as the line when the error has
+            no position
+    """
+    line: int | None = None
+    column: int | None = None
+    offset = error_offset(error)
+    if offset == len(text) - 1 and isinstance(error, UnexpectedToken) and error.token.type == "$END":
+        # Lark puts the end of input at the final newline. The loader only
+        # appends one when the text lacks it, but the end of input is past
+        # the text either way.
+        offset = len(text)
+    if offset is not None:
+        line, column = LineIndex(text).locate(offset)
+        line += first_line - 1
+    elif first_line != 1:
+        line = first_line
+    return HclParsingError(
+        message=message,
+        source_file=str(source_file) if source_file else None,
+        line=line,
+        column=column,
+    )
+
+
+# 📄⚙️🔚
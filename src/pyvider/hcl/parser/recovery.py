@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Parsing that reports every syntax error in a document in one run.
+
+A document that parses is returned as it is. One that does not is split into
+top-level statements, each parsed on its own, so an error costs only the
+statement it is in. A statement left open -- a missing ``}`` or closing
+quote -- would otherwise swallow the rest of the document, so a failing
+statement is cut at the next line that starts a top-level block or
+attribute in column 0, and scanning resumes there.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import re
+from typing import Any
+
+import attrs
+from attrs import define
+from provide.foundation import logger
+
+from pyvider.hcl.exceptions import HclParsingError
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.positions import located_error
+from pyvider.hcl.parser.segments import Segment, iter_segments, merge_fragments, split_lines
+from pyvider.hcl.parser.streaming import parse_segment
+
+# `resource "a" "b" {` or `name =` at the very start of a line.
+_STATEMENT_START = re.compile(
+    r'[A-Za-z_][\w-]*(?:[ \t]+(?:"[^"\n]*"|[A-Za-z_][\w-]*))*[ \t]*\{[ \t]*(?:(?:#|//).*)?$'
+    r"|[A-Za-z_][\w-]*[ \t]*=(?!=)"
+)
+
+
+@define(frozen=True, slots=True)
+class RecoveredParse:
+    """What an error-recovering parse could read, and what it could not.
+
+    Attributes:
+        tree: Raw parse of every top-level statement that parsed, in the same
+            shape as `parse_with_context` returns
+        errors: One `HclParsingError` per statement that failed, in source
+            order, each with its line and column where the parser gave one
+    """
+
+    tree: dict[str, Any]
+    errors: tuple[HclParsingError, ...]
+
+    @property
+    def ok(self) -> bool:
+        """True when the whole document parsed."""
+        return not self.errors
+
+
+def _resync_line(segment: Segment) -> int | None:
+    """First line after the statement's own first line that starts a new one."""
+    lines = segment.text.split("\n")
+    for number, line in enumerate(lines[1:], start=segment.start_line + 1):
+        if _STATEMENT_START.match(line):
+            return number
+    return None
+
+
+def _head(segment: Segment, end_line: int) -> Segment:
+    """The part of a statement before `end_line`."""
+    keep = end_line - segment.start_line
+    text = "".join(split_lines(segment.text)[:keep])
+    return attrs.evolve(segment, text=text, end_line=end_line - 1, end=segment.start + len(text))
+
+
+def parse_with_recovery(
+    content: str,
+    source_file: Path | str | None = None,
+    *,
+    disk_cache: DiskParseCache | None = None,
+) -> RecoveredParse:
+    """Parse HCL, collecting every syntax error instead of stopping at the first.
+
+    Args:
+        content: HCL content string to parse
+        source_file: Optional source path for error reporting
+        disk_cache: Optional persistent cache of raw parse results
+
+    Returns:
+        The statements that parsed and an error for each one that did not
+
+    Example:
+        >>> result = parse_with_recovery('a = 1\\nb = \\nc = 3\\nd = = 4\\n')
+        >>> result.tree
+        {'a': 1, 'c': 3}
+        >>> [error.line for error in result.errors]
+        [2, 4]
+    """
+    try:
+        return RecoveredParse(tree=load_raw(content, disk_cache=disk_cache), errors=())
+    except Exception as e:
+        document_error = located_error(f"Failed to parse HCL: {e}", e, content, source_file=source_file)
+
+    lines = split_lines(content)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+
+    parsed: list[Segment] = []
+    fragments: list[Any] = []
+    errors: list[HclParsingError] = []
+
+    def parse(segment: Segment) -> bool:
+        try:
+            fragments.append(parse_segment(segment, source_file=source_file, disk_cache=disk_cache))
+        except HclParsingError as e:
+            errors.append(e)
+            return False
+        parsed.append(segment)
+        return True
+
+    resume: int | None = 0
+    while resume is not None:
+        start, resume = resume, None
+        for segment in iter_segments(lines[start:], first_line=start + 1, first_offset=offsets[start]):
+            if parse(segment):
+                continue
+            resync = _resync_line(segment)
+            if resync is not None:
+                # Replace the error for the whole statement with one for the
+                # part before the cut, and rescan from the cut.
+                errors.pop()
+                parse(_head(segment, resync))
+                resume = resync - 1
+                break
+
+    if not errors:
+        # Every statement parses alone, but not together (a repeated
+        # attribute, say), so the error belongs to the whole document.
+        errors.append(document_error)
+    logger.debug("📄🩹 Recovered from parse errors", errors=len(errors), parsed=len(parsed))
+    return RecoveredParse(tree=merge_fragments(parsed, fragments), errors=tuple(errors))
+
+
+# 📄⚙️🔚
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Split HCL source into top-level blocks and attributes without parsing it.
+
+A top-level statement always ends at a newline outside any bracket, string,
+heredoc or comment -- except a block header, whose ``{`` may follow on a
+later line -- so a line-at-a-time scan that tracks only that nesting finds
+every boundary. Each segment is a complete HCL document on its own and
+can be handed to python-hcl2 separately, which is what streaming,
+incremental and error-recovering parses build on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import re
+from typing import Any, Literal
+
+from attrs import define, field
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][\w-]*")
+_LABEL = re.compile(r'\s*(?:"((?:[^"\\]|\\.)*)"|([A-Za-z_][\w-]*))')
+_HEREDOC = re.compile(r"<<-?([A-Za-z_][\w-]*)\s*$")
+
+_STRING = '"'
+_TEMPLATE = "${"
+_OPENERS = "{[("
+_CLOSERS = "}])"
+
+
+@define(frozen=True, slots=True)
+class Segment:
+    """One top-level statement and where it sits in the source.
+
+    Attributes:
+        kind: ``"block"`` or ``"attribute"``
+        name: Block type, or the attribute name
+        labels: Block labels in order; empty for attributes
+        text: Source text of the statement, including its final newline
+        start_line: 1-based line the statement starts on
+        end_line: 1-based line the statement ends on (inclusive)
+        start: Offset of the first character of `start_line`
+        end: Offset just past the statement's final newline
+    """
+
+    kind: Literal["block", "attribute"]
+    name: str
+    labels: tuple[str, ...]
+    text: str
+    start_line: int
+    end_line: int
+    start: int
+    end: int
+
+    @property
+    def address(self) -> str:
+        """Dotted address such as ``resource.aws_instance.web``."""
+        return ".".join((self.name, *self.labels))
+
+
+@define(slots=True)
+class _LineScanner:
+    """Tracks nesting across lines; balanced means a statement can end here."""
+
+    stack: list[str] = field(factory=list)
+    heredoc: str | None = None
+    in_comment: bool = False
+    code_column: int | None = None
+    opened: bool = False
+
+    @property
+    def balanced(self) -> bool:
+        return not self.stack and self.heredoc is None and not self.in_comment
+
+    def reset(self) -> None:
+        self.stack.clear()
+        self.heredoc = None
+        self.in_comment = False
+        self.code_column = None
+        self.opened = False
+
+    def feed(self, line: str) -> None:  # noqa: C901
+        if self.heredoc is not None:
+            if line.strip() == self.heredoc:
+                self.heredoc = None
+            return
+
+        stack = self.stack
+        i, n = 0, len(line)
+        while i < n:
+            c = line[i]
+            if self.in_comment:
+                end = line.find("*/", i)
+                if end < 0:
+                    return
+                self.in_comment = False
+                i = end + 2
+                continue
+
+            if stack and stack[-1] == _STRING:
+                if c == "\\":
+                    i += 2
+                    continue
+                if c == '"':
+                    stack.pop()
+                elif c in "$%" and line.startswith("{", i + 1):
+                    stack.append(_TEMPLATE)
+                    i += 2
+                    continue
+                elif line.startswith(c * 2 + "{", i) and c in "$%":
+                    i += 3
+                    continue
+                i += 1
+                continue
+
+            if c == "#" or line.startswith("//", i):
+                return
+            if line.startswith("/*", i):
+                self.in_comment = True
+                i += 2
+                continue
+            if not c.isspace() and self.code_column is None:
+                self.code_column = i
+
+            if c == '"':
+                stack.append(_STRING)
+            elif c in _OPENERS:
+                if c == "{" and not stack:
+                    self.opened = True
+                stack.append(c)
+            elif c in _CLOSERS:
+                if stack:
+                    stack.pop()
+            elif c == "<" and line.startswith("<<", i):
+                match = _HEREDOC.match(line, i)
+                if match:
+                    self.heredoc = match.group(1)
+                    return
+            i += 1
+
+
+def _describe(line: str, column: int) -> tuple[Literal["block", "attribute"], str, tuple[str, ...]]:
+    """Read the kind, name and labels from a statement's first line."""
+    match = _IDENTIFIER.match(line, column)
+    if match is None:
+        return "attribute", "", ()
+    name = match.group(0)
+    rest = line[match.end() :].lstrip()
+    if rest.startswith("=") and not rest.startswith("=="):
+        return "attribute", name, ()
+
+    labels = []
+    pos = match.end()
+    while (label := _LABEL.match(line, pos)) is not None:
+        labels.append(label.group(1) if label.group(1) is not None else label.group(2))
+        pos = label.end()
+    return "block", name, tuple(labels)
+
+
+def iter_segments(lines: Iterable[str], *, first_line: int = 1, first_offset: int = 0) -> Iterator[Segment]:
+    """Yield top-level statements from an iterable of source lines.
+
+    Lines must keep their line endings, as file objects yield them. Blank and
+    comment-only lines between statements are skipped. A block header whose
+    ``{`` is on a later line is held until that line; if the next code is
+    anything else, the header is yielded alone for the parser to reject. Only the statement
+    being assembled is held in memory. Unterminated input is yielded as a
+    final segment so the parser can report the error.
+
+    Args:
+        lines: Source lines, starting at a statement boundary
+        first_line: Line number of the first line, for scans that resume
+            part-way through a document
+        first_offset: Offset of the first line in the document
+    """
+    scanner = _LineScanner()
+    buffer: list[str] = []
+    kind: Literal["block", "attribute"] = "attribute"
+    name = ""
+    labels: tuple[str, ...] = ()
+    start_line = start = 0
+    line_no, offset = first_line - 1, first_offset
+
+    for line in lines:
+        line_no += 1
+        line_start, offset = offset, offset + len(line)
+        if buffer and scanner.balanced:
+            # A block header still waiting for its body.
+            probe = _LineScanner()
+            probe.feed(line)
+            if probe.code_column is not None and line[probe.code_column] != "{":
+                yield Segment(kind, name, labels, "".join(buffer), start_line, line_no - 1, start, line_start)
+                buffer.clear()
+                scanner.reset()
+        scanner.feed(line)
+        if not buffer:
+            if scanner.code_column is None:
+                if scanner.balanced:
+                    scanner.reset()
+                continue
+            kind, name, labels = _describe(line, scanner.code_column)
+            start_line, start = line_no, line_start
+            if line[: scanner.code_column].strip():
+                # The tail of a block comment opened on an earlier line;
+                # blank it so the segment parses on its own.
+                line = " " * scanner.code_column + line[scanner.code_column :]
+        buffer.append(line)
+        if scanner.balanced and (kind == "attribute" or scanner.opened):
+            yield Segment(kind, name, labels, "".join(buffer), start_line, line_no, start, offset)
+            buffer.clear()
+            scanner.reset()
+
+    if buffer:
+        yield Segment(kind, name, labels, "".join(buffer), start_line, line_no, start, offset)
+
+
+def merge_fragments(segments: Iterable[Segment], fragments: Iterable[Any]) -> dict[str, Any]:
+    """Combine per-segment parse results into the shape of a whole-document parse.
+
+    Blocks of the same type are appended in source order, as python-hcl2 does
+    for repeated blocks; attributes are assigned. Each fragment must hold only
+    its own segment's statement, as `parse_segment` ensures.
+    """
+    tree: dict[str, Any] = {}
+    for segment, fragment in zip(segments, fragments, strict=True):
+        for name, value in fragment.items():
+            if segment.kind == "block" and name == segment.name:
+                tree.setdefault(name, []).extend(value)
+            else:
+                tree[name] = value
+    return tree
+
+
+def split_lines(text: str) -> list[str]:
+    """Split on ``\\n`` only, keeping line endings, so offsets match the parser's."""
+    lines = [line + "\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def split_segments(text: str) -> list[Segment]:
+    """Return every top-level statement in `text`."""
+    return list(iter_segments(split_lines(text)))
+
+
+# 📄⚙️🔚
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""HCL sources given as text, as a buffer, or as a file to map.
+
+The parsers work on `str`, so a buffer is decoded exactly once, straight from
+its memory: no `bytes` copy is made of a `bytearray`, `memoryview` or `mmap`
+first. Files are memory-mapped rather than read, so their contents are never
+copied into a `bytes` object either, and their size is known before anything
+is decoded. A UTF-8 byte order mark is dropped, and
+invalid UTF-8 is reported with the line and column where it starts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import mmap
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeAlias
+
+from pyvider.hcl.exceptions import HclParsingError
+
+if TYPE_CHECKING:
+    from pyvider.hcl.parser.limits import Budget
+
+HclSource: TypeAlias = str | bytes | bytearray | memoryview | mmap.mmap
+"""Anything an entry point accepting a source can parse."""
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def source_size(content: HclSource) -> int:
+    """Length of a buffer in bytes, or of a string in characters."""
+    return content.nbytes if isinstance(content, memoryview) else len(content)
+
+
+def decode_source(content: HclSource, source_file: Path | str | None = None) -> str:
+    """Return the text of a source, decoding a buffer as UTF-8.
+
+    Args:
+        content: Text, or a buffer of UTF-8 bytes
+        source_file: Optional source path for error reporting
+
+    Returns:
+        The text, without a leading byte order mark
+
+    Raises:
+        HclParsingError: If a buffer is not valid UTF-8
+    """
+    if isinstance(content, str):
+        return content[1:] if content.startswith("\ufeff") else content
+    with memoryview(content) as view:
+        start = len(_BOM) if view[: len(_BOM)] == _BOM else 0
+        try:
+            return str(view[start:], "utf-8")
+        except UnicodeDecodeError as e:
+            # Everything before the bad byte decoded, so it can be decoded
+            # again to count lines and characters.
+            head = view[start : start + e.start].tobytes()
+            line_start = head.rfind(b"\n") + 1
+            raise HclParsingError(
+                message=f"HCL source is not valid UTF-8: {e.reason}",
+                source_file=str(source_file) if source_file else None,
+                line=head.count(b"\n") + 1,
+                column=len(head[line_start:].decode("utf-8")) + 1,
+            ) from e
+
+
+@contextmanager
+def mapped_file(path: Path | str) -> Iterator[HclSource]:
+    """Map a file read-only for the duration of a parse.
+
+    Empty files and files that cannot be mapped, such as pipes, are read
+    instead.
+
+    Raises:
+        HclParsingError: If the file cannot be opened or read
+    """
+    try:
+        handle = Path(path).open("rb")  # noqa: SIM115 - closed below, after the mapping
+    except OSError as e:
+        raise HclParsingError(message=f"Failed to read HCL file: {e}", source_file=str(path)) from e
+    with handle:
+        try:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            try:
+                content = handle.read()
+            except OSError as e:
+                raise HclParsingError(message=f"Failed to read HCL file: {e}", source_file=str(path)) from e
+            yield content
+            return
+        with mapping:
+            yield mapping
+
+
+def read_source(path: Path | str, budget: Budget | None = None) -> str:
+    """Read a UTF-8 file into a string, decoding straight from its mapping.
+
+    The mapping is closed before returning, so its pages are not kept
+    resident alongside the string while it is parsed.
+
+    Args:
+        path: File to read
+        budget: Optional limits; the file size is checked before decoding
+
+    Raises:
+        HclParsingError: If the file cannot be read or is not valid UTF-8
+        HclLimitError: If the file is larger than the budget allows
+    """
+    with mapped_file(path) as content:
+        if budget is not None:
+            budget.check_size(content)
+        return decode_source(content, path)
+
+
+# 📄⚙️🔚
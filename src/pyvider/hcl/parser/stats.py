@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Per-phase measurements of parse calls.
+
+Pass a `ParseStats` as ``stats=`` to `parse_hcl_to_cty` or
+`parse_with_context` to see where a slow parse spends its time. Each call is
+split into phases, timed with `time.perf_counter`:
+
+- ``cache``: the `ParseCache` lookup and store, including the content digest.
+- ``decode``: turning a buffer into text.
+- ``parse``: text to raw data -- the attribute-only scanner, the disk cache,
+  python-hcl2 and the data limits -- and counting its values.
+- ``validate``: applying a schema, or ``infer``: inferring types and building
+  values without one.
+
+Without stats, the only cost is an ``is None`` check at each phase boundary.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+from typing import Any
+
+from attrs import define, field
+
+from pyvider.hcl.parser.source import HclSource, source_size
+
+PhaseCallback = Callable[[str, float], None]
+"""Called with a phase name and its seconds each time a phase ends."""
+
+
+def source_bytes(content: HclSource) -> int:
+    """Size of a source in UTF-8 bytes, encoding text only when it is not ASCII."""
+    if isinstance(content, str) and not content.isascii():
+        return len(content.encode("utf-8", "surrogatepass"))
+    return source_size(content)
+
+
+@define(slots=True)
+class ParseStats:
+    """Measurements accumulated over every call it is passed to.
+
+    One instance may be reused across calls to total them, but not shared
+    between threads.
+
+    Attributes:
+        on_phase: Optional callback given each phase's name and seconds as
+            it ends, for forwarding to a metrics system
+        calls: Calls measured
+        bytes_in: UTF-8 bytes of source received
+        nodes: Values (scalars, objects and lists) in the parsed data,
+            counted as for ``ParseLimits.max_nodes``; cache hits add none
+        cache_hits: Calls answered from the `ParseCache`
+        disk_cache_hits: Documents whose raw data came from the `DiskParseCache`
+        fast_path: Documents read by the attribute-only scanner instead of
+            python-hcl2
+        seconds: Wall time per phase, in seconds
+
+    Example:
+        >>> stats = ParseStats()
+        >>> parse_hcl_to_cty(content, stats=stats)
+        >>> max(stats.seconds, key=stats.seconds.get)
+        'parse'
+    """
+
+    on_phase: PhaseCallback | None = None
+    calls: int = 0
+    bytes_in: int = 0
+    nodes: int = 0
+    cache_hits: int = 0
+    disk_cache_hits: int = 0
+    fast_path: int = 0
+    seconds: dict[str, float] = field(factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        """Wall time across all phases."""
+        return sum(self.seconds.values())
+
+    def begin(self, content: HclSource) -> float:
+        """Count a call reading `content`; return the clock reading that starts its first phase."""
+        self.calls += 1
+        self.bytes_in += source_bytes(content)
+        return time.perf_counter()
+
+    def lap(self, phase: str, start: float) -> float:
+        """Charge the time since `start` to `phase`; return the clock reading that ends it."""
+        now = time.perf_counter()
+        elapsed = now - start
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + elapsed
+        if self.on_phase is not None:
+            self.on_phase(phase, elapsed)
+        return now
+
+    def count_nodes(self, raw_data: Any) -> None:
+        """Add the values in `raw_data`.
+
+        Callers count before ending the ``parse`` phase, so the walk is
+        charged to it and the phases still add up to the call's wall time.
+        """
+        nodes = 0
+        stack = [raw_data]
+        while stack:
+            value = stack.pop()
+            nodes += 1
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list | tuple):
+                stack.extend(value)
+        self.nodes += nodes
+
+    def reset(self) -> None:
+        """Zero every counter and timing, keeping the callback."""
+        self.calls = self.bytes_in = self.nodes = 0
+        self.cache_hits = self.disk_cache_hits = self.fast_path = 0
+        self.seconds.clear()
+
+
+# 📄⚙️🔚
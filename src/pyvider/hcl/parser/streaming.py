@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Streaming parse of large HCL documents one top-level block at a time."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import io
+from pathlib import Path
+from typing import Any, Literal
+
+from attrs import define
+
+from pyvider.hcl.exceptions import HclParsingError
+from pyvider.hcl.parser.disk_cache import DiskParseCache
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.positions import located_error
+from pyvider.hcl.parser.segments import Segment, iter_segments
+
+
+@define(frozen=True, slots=True)
+class HclBlock:
+    """A parsed top-level block or attribute.
+
+    Attributes:
+        kind: ``"block"`` or ``"attribute"``
+        name: Block type (``resource``, ``variable``, ...) or attribute name
+        labels: Block labels in order; empty for attributes
+        body: Block body or attribute value, as raw data or a `CtyValue`
+        start_line: 1-based line the statement starts on
+        end_line: 1-based line the statement ends on (inclusive)
+    """
+
+    kind: Literal["block", "attribute"]
+    name: str
+    labels: tuple[str, ...]
+    body: Any
+    start_line: int
+    end_line: int
+
+    @property
+    def address(self) -> str:
+        """Dotted address such as ``resource.aws_instance.web``."""
+        return ".".join((self.name, *self.labels))
+
+
+def parse_segment(
+    segment: Segment,
+    *,
+    source_file: Path | str | None = None,
+    disk_cache: DiskParseCache | None = None,
+) -> Any:
+    """Parse one segment into the raw fragment python-hcl2 gives for it alone.
+
+    python-hcl2 accepts a statement after a block's closing brace or after an
+    attribute's value on the same line, which HCL itself does not. A segment
+    that parses to more than its own statement is rejected, as a fragment
+    does not say which of its keys are blocks.
+
+    Raises:
+        HclParsingError: If the segment does not parse, pointing at the
+            error's line and column in the document, or at the line the
+            statement starts on when the parser gives no position; or if
+            another statement shares a line with it
+    """
+    try:
+        fragment = load_raw(segment.text, disk_cache=disk_cache)
+    except Exception as e:
+        raise located_error(
+            f"Failed to parse HCL: {e}",
+            e,
+            segment.text,
+            source_file=source_file,
+            first_line=segment.start_line,
+        ) from e
+    if fragment.keys() != {segment.name} or (segment.kind == "block" and len(fragment[segment.name]) != 1):
+        raise HclParsingError(
+            message=f"Top-level statement {segment.address!r} shares a line with the next one; "
+            "HCL needs a newline after each block and attribute",
+            source_file=str(source_file) if source_file else None,
+            line=segment.start_line,
+        )
+    return fragment
+
+
+def _unwrap(segment: Segment, raw: dict[str, Any]) -> Any:
+    """Strip the block-type and label nesting python-hcl2 wraps a body in."""
+    if segment.kind == "attribute":
+        return raw[segment.name]
+    body = raw[segment.name][0]
+    for label in segment.labels:
+        body = body[label]
+    return body
+
+
+def iter_blocks(
+    stream: Iterable[str] | str,
+    *,
+    to_cty: bool = False,
+    source_file: Path | str | None = None,
+    disk_cache: DiskParseCache | None = None,
+) -> Iterator[HclBlock]:
+    """Parse HCL incrementally, yielding each top-level statement as it completes.
+
+    Input is split at top-level boundaries and each statement is parsed on its
+    own, so memory stays proportional to the largest block rather than the
+    whole document, and the first block is available before the rest of the
+    input has been read.
+
+    Args:
+        stream: Text file object, any iterable of lines, or a string
+        to_cty: Convert each body to a `CtyValue` with inferred types
+        source_file: Optional source path for error reporting
+        disk_cache: Optional persistent cache of raw parse results per block
+
+    Yields:
+        One `HclBlock` per top-level block or attribute, in source order
+
+    Raises:
+        HclParsingError: When a statement fails to parse or shares a line
+            with the next one; blocks before it have already been yielded
+
+    Example:
+        >>> with open("generated.tf", encoding="utf-8") as f:
+        ...     for block in iter_blocks(f):
+        ...         print(block.address)
+    """
+    lines = io.StringIO(stream, newline="\n") if isinstance(stream, str) else stream
+    for segment in iter_segments(lines):
+        raw = parse_segment(segment, source_file=source_file, disk_cache=disk_cache)
+        try:
+            body = _unwrap(segment, raw)
+        except (KeyError, IndexError, TypeError) as e:
+            raise HclParsingError(
+                message=f"Unexpected structure for top-level statement {segment.name!r}",
+                source_file=str(source_file) if source_file else None,
+                line=segment.start_line,
+            ) from e
+        yield HclBlock(
+            kind=segment.kind,
+            name=segment.name,
+            labels=segment.labels,
+            body=auto_infer_cty_type(body) if to_cty else body,
+            start_line=segment.start_line,
+            end_line=segment.end_line,
+        )
+
+
+# 📄⚙️🔚
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Fast path for attribute-only documents such as ``.tfvars`` files.
+
+Variable files are flat ``key = literal`` assignments, for which the full
+Lark pipeline is far more machinery than needed. `scan_attributes` is a
+hand-written scanner for exactly that subset: top-level attributes whose
+values are strings, numbers, booleans, null, heredocs, lists and objects.
+It produces the same raw data python-hcl2 does, and gives up (returning
+None) on anything else -- a block, an expression, an interpolation, an
+unusual escape -- so the caller can fall back to the full parser, which
+also owns every error message.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+_ASSIGN = re.compile(r"[ \t]*=(?!=)[ \t]*")
+_OBJECT_ASSIGN = re.compile(r"[ \t]*[=:](?!=)[ \t]*")
+_STRING = re.compile(r'"((?:[^"\\\n]|\\.)*)"')
+_NUMBER = re.compile(r"-?[0-9]+(\.[0-9]+)?(?![0-9A-Za-z_.])")
+_KEYWORD = re.compile(r"(true|false|null)(?![A-Za-z0-9_-])")
+# Same token python-hcl2's lexer accepts for a heredoc, closing newline included.
+_HEREDOC = re.compile(r"<<(-?)([a-zA-Z][a-zA-Z0-9._-]+)\n?(?:.|\n)*?\n\s*\2\n")
+# Whitespace, newlines and comments between statements or inside brackets.
+_GAP = re.compile(r"(?:\s+|#[^\n]*|//[^\n]*|/\*(?:[^*]|\*(?!/))*\*/)*")
+# Whatever may follow a value on its line before the line ends.
+_LINE_END = re.compile(r"[ \t]*(?:/\*[^\n]*?\*/[ \t]*)*(?:(?:#|//)[^\n]*)?(?:\n|\Z)")
+_INLINE_GAP = re.compile(r"[ \t]*(?:/\*[^\n]*?\*/[ \t]*)*(?:(?:#|//)[^\n]*)?")
+
+_KEYWORDS = {"true": True, "false": False, "null": None}
+
+
+class _Unsupported(Exception):
+    """Raised inside the scanner for anything outside the fast-path subset."""
+
+
+def _unescape(text: str) -> str:
+    # The exact replacements python-hcl2 applies, in the same order.
+    return (
+        text.replace("\\n", "\n")
+        .replace("\\r", "\r")
+        .replace("\\t", "\t")
+        .replace('\\"', '"')
+        .replace("\\\\", "\\")
+    )
+
+
+class _AttributeScanner:
+    __slots__ = ("pos", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def document(self) -> dict[str, Any]:
+        text = self.text
+        result: dict[str, Any] = {}
+        self.pos = _GAP.match(text).end()  # type: ignore[union-attr]
+        while self.pos < len(text):
+            name = self._expect(_IDENTIFIER).group(0)
+            if name in result:
+                raise _Unsupported
+            self._expect(_ASSIGN)
+            result[name] = self.value()
+            if text[self.pos - 1] != "\n":
+                # Only a heredoc ends with a newline; it consumes its own.
+                self._expect(_LINE_END)
+            self.pos = _GAP.match(text, self.pos).end()  # type: ignore[union-attr]
+        return result
+
+    def _expect(self, pattern: re.Pattern[str]) -> re.Match[str]:
+        match = pattern.match(self.text, self.pos)
+        if match is None:
+            raise _Unsupported
+        self.pos = match.end()
+        return match
+
+    def value(self) -> Any:
+        text, pos = self.text, self.pos
+        char = text[pos : pos + 1]
+        if char == '"':
+            return self.string()
+        if char == "[":
+            return self.list()
+        if char == "{":
+            return self.object()
+        if char == "<":
+            return self.heredoc()
+        match = _NUMBER.match(text, pos)
+        if match is not None:
+            self.pos = match.end()
+            return float(match.group(0)) if match.group(1) else int(match.group(0))
+        match = _KEYWORD.match(text, pos)
+        if match is not None:
+            self.pos = match.end()
+            return _KEYWORDS[match.group(1)]
+        raise _Unsupported
+
+    def string(self) -> str:
+        content = self._expect(_STRING).group(1)
+        if "${" in content or "%{" in content:
+            raise _Unsupported
+        return _unescape(content) if "\\" in content else content
+
+    def heredoc(self) -> str:
+        match = self._expect(_HEREDOC)
+        token = match.group(0)
+        trim, marker = match.group(1), match.group(2)
+        # python-hcl2 takes the body up to the last occurrence of the marker.
+        body = token[len(marker) + len(trim) + 3 : token.rindex(marker)]
+        if "${" in body or "%{" in body or "\\" in body:
+            raise _Unsupported
+        body = body.rstrip("\n\t ")
+        if trim:
+            lines = body.split("\n")
+            indent = min(len(line) - len(line.lstrip(" ")) for line in lines)
+            body = "\n".join(line[indent:] for line in lines)
+        return body
+
+    def _gap(self) -> bool:
+        """Skip whitespace and comments; True if a newline was skipped."""
+        start = self.pos
+        self.pos = _GAP.match(self.text, start).end()  # type: ignore[union-attr]
+        return "\n" in self.text[start : self.pos]
+
+    def list(self) -> list[Any]:
+        text = self.text
+        self.pos += 1
+        items: list[Any] = []
+        newline = self._gap()
+        while not text.startswith("]", self.pos):
+            if newline and text.startswith("-", self.pos):
+                # python-hcl2 reads a negative number that starts a line in a
+                # list as an expression.
+                raise _Unsupported
+            items.append(self.value())
+            newline = self._gap()
+            if text.startswith(",", self.pos):
+                self.pos += 1
+                newline = self._gap()
+            elif not text.startswith("]", self.pos):
+                raise _Unsupported
+        self.pos += 1
+        return items
+
+    def object(self) -> dict[str, Any]:
+        text = self.text
+        self.pos += 1
+        items: dict[str, Any] = {}
+        self._gap()
+        while not text.startswith("}", self.pos):
+            if text.startswith('"', self.pos):
+                key = self._expect(_STRING).group(1)
+                if "\\" in key or "${" in key:
+                    raise _Unsupported
+            else:
+                key = self._expect(_IDENTIFIER).group(0)
+            self._expect(_OBJECT_ASSIGN)
+            items[key] = self.value()
+            self.pos = _INLINE_GAP.match(text, self.pos).end()  # type: ignore[union-attr]
+            if text.startswith(",", self.pos):
+                self.pos += 1
+            elif not text.startswith(("\n", "}"), self.pos):
+                raise _Unsupported
+            self._gap()
+        self.pos += 1
+        return items
+
+
+def scan_attributes(content: str) -> dict[str, Any] | None:
+    """Parse an attribute-only document without the full parser.
+
+    Args:
+        content: HCL content string
+
+    Returns:
+        The same raw data python-hcl2 would return, or None if the document
+        uses anything outside the literal-attribute subset (or is invalid)
+    """
+    if "\r" in content:
+        return None
+    try:
+        return _AttributeScanner(content).document()
+    except (_Unsupported, RecursionError):
+        return None
+
+
+# 📄⚙️🔚
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Schema validators compiled once per CtyType.
+
+`schema.validate(raw)` interprets the type tree on every call: each node
+re-checks for CtyValues, unknown markers and attrs instances, normalizes
+every key and builds an error path whether or not anything fails. A
+compiled validator walks the schema once, up front, into nested closures
+that accept exactly the data a parser produces -- dicts with string keys,
+lists, strings, numbers, booleans and None -- and build the value directly.
+
+Anything else, and anything that would not validate, makes the compiled
+validator give up and hand the whole input to `schema.validate`, so results
+and errors are those of pyvider-cty.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+import unicodedata
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtyString,
+    CtyType,
+    CtyValue,
+)
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.hcl.parser.compiling import MAX_DEPTH, SchemaCache, compile_schema
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+
+_Node = Callable[[Any, int], CtyValue[Any]]
+
+
+class _Mismatch(Exception):
+    """Raised by a compiled node for data only `CtyType.validate` handles."""
+
+
+def _string(vtype: CtyString) -> _Node:
+    null = CtyValue.null(vtype)
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        if type(raw_data) is str:
+            return CtyValue(
+                vtype=vtype,
+                value=raw_data if raw_data.isascii() else unicodedata.normalize("NFC", raw_data),
+            )
+        if raw_data is None:
+            return null
+        raise _Mismatch
+
+    return validate
+
+
+def _number(vtype: CtyNumber) -> _Node:
+    null = CtyValue.null(vtype)
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        kind = type(raw_data)
+        if kind is int or kind is float or kind is Decimal:
+            return CtyValue(vtype=vtype, value=Decimal(raw_data))
+        if raw_data is None:
+            return null
+        raise _Mismatch
+
+    return validate
+
+
+def _bool(vtype: CtyBool) -> _Node:
+    null = CtyValue.null(vtype)
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        if type(raw_data) is bool:
+            return CtyValue(vtype=vtype, value=raw_data)
+        if raw_data is None:
+            return null
+        raise _Mismatch
+
+    return validate
+
+
+def _dynamic(vtype: CtyDynamic) -> _Node:
+    null = CtyValue.null(vtype)
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        if raw_data is None:
+            return null
+        if type(raw_data) is list and len(raw_data) == 2 and isinstance(raw_data[0], bytes):
+            # A wire-format (type, value) pair, which only validation decodes.
+            raise _Mismatch
+        try:
+            return CtyValue(vtype=vtype, value=auto_infer_cty_type(raw_data))
+        except CtyValidationError as e:
+            raise _Mismatch from e
+
+    return validate
+
+
+def _object(vtype: CtyObject) -> _Node:
+    null = CtyValue.null(vtype)
+    fields = tuple(
+        (
+            name,
+            unicodedata.normalize("NFC", name),
+            _compile(attribute_type),
+            CtyValue.null(attribute_type) if name in vtype.optional_attributes else None,
+        )
+        for name, attribute_type in vtype.attribute_types.items()
+    )
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        kind = type(raw_data)
+        if kind is not dict and kind is not FrozenDict:
+            if raw_data is None:
+                return null
+            raise _Mismatch
+        if depth == MAX_DEPTH:
+            raise _Mismatch
+        depth += 1
+        attributes = {}
+        found = 0
+        for name, key, node, missing in fields:
+            if key in raw_data:
+                attributes[name] = node(raw_data[key], depth)
+                found += 1
+            elif missing is not None:
+                attributes[name] = missing
+            else:
+                raise _Mismatch
+        if found != len(raw_data):
+            # Unknown attributes, or names that are not in NFC form.
+            raise _Mismatch
+        return CtyValue(vtype=vtype, value=FrozenDict(attributes))
+
+    return validate
+
+
+def _list(vtype: CtyList[Any]) -> _Node:
+    null = CtyValue.null(vtype)
+    element = _compile(vtype.element_type)
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        kind = type(raw_data)
+        if kind is not list and kind is not tuple:
+            if raw_data is None:
+                return null
+            raise _Mismatch
+        if depth == MAX_DEPTH:
+            raise _Mismatch
+        depth += 1
+        return CtyValue(vtype=vtype, value=tuple(element(item, depth) for item in raw_data))
+
+    return validate
+
+
+def _map(vtype: CtyMap[Any]) -> _Node:
+    null = CtyValue.null(vtype)
+    element = _compile(vtype.element_type)
+
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        kind = type(raw_data)
+        if kind is not dict and kind is not FrozenDict:
+            if raw_data is None:
+                return null
+            raise _Mismatch
+        if depth == MAX_DEPTH:
+            raise _Mismatch
+        depth += 1
+        entries = {}
+        for key, item in raw_data.items():
+            if type(key) is not str:
+                raise _Mismatch
+            entries[key if key.isascii() else unicodedata.normalize("NFC", key)] = element(item, depth)
+        if len(entries) != len(raw_data):
+            # Two spellings of one key, which validation refuses.
+            raise _Mismatch
+        return CtyValue(vtype=vtype, value=FrozenDict(entries))
+
+    return validate
+
+
+def _generic(vtype: CtyType[Any]) -> _Node:
+    def validate(raw_data: Any, depth: int) -> CtyValue[Any]:
+        try:
+            return vtype.validate(raw_data)
+        except CtyValidationError as e:
+            raise _Mismatch from e
+
+    return validate
+
+
+_COMPILERS: dict[type, Callable[[Any], _Node]] = {
+    CtyString: _string,
+    CtyNumber: _number,
+    CtyBool: _bool,
+    CtyDynamic: _dynamic,
+    CtyObject: _object,
+    CtyList: _list,
+    CtyMap: _map,
+}
+
+
+def _compile(vtype: CtyType[Any]) -> _Node:
+    return compile_schema(vtype, _COMPILERS, _generic)
+
+
+_compiled = SchemaCache(_compile)
+
+
+def compile_validator(schema: CtyType[Any]) -> Callable[[Any], CtyValue[Any]]:
+    """Return a function equivalent to ``schema.validate`` for raw parser output.
+
+    Compiled validators are cached per schema object, so keep a schema that
+    is used repeatedly rather than rebuilding it for every call.
+
+    Args:
+        schema: CTY type to validate against
+
+    Returns:
+        A function taking raw data and returning the validated CTY value
+
+    Raises:
+        CtyValidationError: From the returned function, if the data does not
+            conform to the schema
+
+    Example:
+        >>> validate = compile_validator(CtyObject({"name": CtyString()}))
+        >>> validate({"name": "web"})["name"].value
+        'web'
+    """
+    root = _compiled(schema)
+
+    def validate(raw_data: Any) -> CtyValue[Any]:
+        try:
+            return root(raw_data, 0)
+        except _Mismatch:
+            return schema.validate(raw_data)
+
+    return validate
+
+
+def clear_validator_cache() -> None:
+    """Drop the compiled validators `compile_validator` reuses across calls."""
+    _compiled.cache_clear()
+
+
+# 📄⚙️🔚
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Schema conformance checks that build no values.
+
+A checker is compiled from a schema once, like a validator, but only walks
+the raw data: it records every place the data does not conform and builds
+no `CtyValue`s. Data conforms exactly when `schema.validate` would accept it.
+Leaf conversions the checker does not handle itself, and types without a
+compiled form, are decided by `validate` on that part of the data alone.
+
+Raw data carries no source positions, so `locate_violations` finds lines
+afterwards from the source text, and only for documents that have
+violations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from decimal import Decimal
+import re
+from typing import Any
+import unicodedata
+
+from attrs import define, evolve
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+)
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.cty.path import CtyPath, GetAttrStep, IndexStep, KeyStep, PathStep
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.hcl.parser.compiling import MAX_DEPTH, SchemaCache, compile_schema
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+from pyvider.hcl.parser.segments import Segment, split_segments
+
+_SCALARS = (str, bool, int, float, Decimal)
+
+
+@define(frozen=True, slots=True)
+class SchemaViolation:
+    """One place where data does not conform to a schema.
+
+    Attributes:
+        path: Where the violation is, from the root of the document
+        expected: Type the schema wants there, in HCL type syntax, or
+            ``"absent"`` for an attribute the schema does not have
+        actual: Kind of value found (``"string"``, ``"object"``, ...), or
+            ``"absent"`` for a missing required attribute
+        message: Human-readable description
+        line: 1-based source line of the offending value, or of the nearest
+            enclosing one found; None when unknown
+    """
+
+    path: CtyPath
+    expected: str
+    actual: str
+    message: str
+    line: int | None = None
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+def type_name(vtype: CtyType[Any]) -> str:
+    """Name a type the way an HCL type constraint spells it, objects abbreviated."""
+    if isinstance(vtype, CtyObject):
+        return "object"
+    if isinstance(vtype, CtyDynamic):
+        return "any"
+    if isinstance(vtype, CtyList | CtyMap | CtySet):
+        return f"{vtype.ctype}({type_name(vtype.element_type)})"
+    if isinstance(vtype, CtyTuple):
+        return f"tuple([{', '.join(type_name(item) for item in vtype.element_types)}])"
+    return str(vtype)
+
+
+def _kind(raw_data: Any) -> str:
+    if raw_data is None:
+        return "null"
+    if isinstance(raw_data, str):
+        return "string"
+    if isinstance(raw_data, bool):
+        return "bool"
+    if isinstance(raw_data, int | float | Decimal):
+        return "number"
+    if isinstance(raw_data, dict):
+        return "object"
+    if isinstance(raw_data, list | tuple):
+        return "tuple"
+    return type(raw_data).__name__
+
+
+def _type_at(vtype: CtyType[Any], steps: tuple[PathStep, ...]) -> CtyType[Any]:
+    for step in steps:
+        if isinstance(step, GetAttrStep) and isinstance(vtype, CtyObject):
+            vtype = vtype.attribute_types.get(step.name, vtype)
+        elif isinstance(step, IndexStep) and isinstance(vtype, CtyTuple):
+            vtype = vtype.element_types[step.index]
+        elif isinstance(vtype, CtyList | CtyMap | CtySet):
+            vtype = vtype.element_type
+        else:
+            break
+    return vtype
+
+
+def _value_at(raw_data: Any, steps: tuple[PathStep, ...]) -> Any:
+    for step in steps:
+        if isinstance(step, GetAttrStep):
+            key: Any = step.name
+        elif isinstance(step, IndexStep):
+            key = step.index
+        else:
+            key = getattr(step, "key", None)
+        try:
+            raw_data = raw_data[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return raw_data
+
+
+class _Walk:
+    """The path to the data being checked, and the violations found so far."""
+
+    __slots__ = ("path", "violations")
+
+    def __init__(self) -> None:
+        self.path: list[PathStep] = []
+        self.violations: list[SchemaViolation] = []
+
+    def report(self, expected: str, actual: str, message: str, *steps: PathStep) -> None:
+        self.violations.append(
+            SchemaViolation(
+                path=CtyPath(steps=(*self.path, *steps)), expected=expected, actual=actual, message=message
+            )
+        )
+
+    def mismatch(self, vtype: CtyType[Any], raw_data: Any) -> None:
+        expected = type_name(vtype)
+        actual = _kind(raw_data)
+        self.report(expected, actual, f"Expected {expected}, got {actual}")
+
+    def validate(self, vtype: CtyType[Any], raw_data: Any) -> None:
+        """Let `vtype.validate` decide, reporting where it refuses."""
+        try:
+            vtype.validate(raw_data)
+        except CtyValidationError as e:
+            steps = e.path.steps if e.path else ()
+            self.report(
+                type_name(_type_at(vtype, steps)), _kind(_value_at(raw_data, steps)), e.message, *steps
+            )
+
+
+_Checker = Callable[[Any, _Walk, int], None]
+
+
+def _leaf(vtype: CtyType[Any], accepted: tuple[type, ...]) -> _Checker:
+    def check(raw_data: Any, walk: _Walk, depth: int) -> None:
+        kind = type(raw_data)
+        if raw_data is None or kind in accepted:
+            return
+        if kind is dict or kind is list:
+            walk.mismatch(vtype, raw_data)
+        else:
+            # Conversions such as "5" to a number are the type's to decide.
+            walk.validate(vtype, raw_data)
+
+    return check
+
+
+def _dynamic(vtype: CtyDynamic) -> _Checker:
+    def check(raw_data: Any, walk: _Walk, depth: int) -> None:
+        kind = type(raw_data)
+        if raw_data is None or kind in _SCALARS:
+            return
+        if depth == MAX_DEPTH:
+            walk.validate(vtype, raw_data)
+        elif kind is dict or kind is FrozenDict:
+            for key, item in (_attributes(raw_data, walk) or {}).items():
+                walk.path.append(GetAttrStep(key))
+                check(item, walk, depth + 1)
+                walk.path.pop()
+        elif kind is list:
+            for index, item in enumerate(raw_data):
+                walk.path.append(IndexStep(index))
+                check(item, walk, depth + 1)
+                walk.path.pop()
+        else:
+            try:
+                auto_infer_cty_type(raw_data)
+            except CtyValidationError as e:
+                walk.report("any", _kind(raw_data), e.message)
+
+    return check
+
+
+def _attributes(raw_data: Any, walk: _Walk) -> Any:
+    """The object's attributes by NFC name, or None after reporting bad names."""
+    for key in raw_data:
+        if type(key) is not str or not key.isascii():
+            break
+    else:
+        # ASCII names are already in NFC form, which is the common case.
+        return raw_data
+    attributes: dict[str, Any] = {}
+    for key, item in raw_data.items():
+        if type(key) is not str:
+            walk.report("object", "object", "Object attribute names must be strings")
+            return None
+        normalized = unicodedata.normalize("NFC", key)
+        if normalized in attributes:
+            walk.report(
+                "object",
+                "object",
+                f"Attribute names {key!r} and {normalized!r} normalize to the same NFC string",
+            )
+            return None
+        attributes[normalized] = item
+    return attributes
+
+
+def _unsupported(attributes: Any, names: set[str], walk: _Walk) -> None:
+    for key in sorted(attributes.keys() - names):
+        walk.report("absent", _kind(attributes[key]), "Unsupported attribute", GetAttrStep(key))
+
+
+def _object(vtype: CtyObject) -> _Checker:
+    fields = tuple(
+        (
+            GetAttrStep(name),
+            unicodedata.normalize("NFC", name),
+            _compile(attribute_type),
+            name in vtype.optional_attributes,
+            type_name(attribute_type),
+        )
+        for name, attribute_type in vtype.attribute_types.items()
+    )
+    names = {key for _, key, _, _, _ in fields}
+
+    def check(raw_data: Any, walk: _Walk, depth: int) -> None:
+        kind = type(raw_data)
+        if kind is not dict and kind is not FrozenDict:
+            if raw_data is not None:
+                walk.mismatch(vtype, raw_data)
+            return
+        if depth == MAX_DEPTH:
+            walk.validate(vtype, raw_data)
+            return
+        attributes = _attributes(raw_data, walk)
+        if attributes is None:
+            return
+        found = 0
+        for step, key, checker, optional, expected in fields:
+            if key in attributes:
+                found += 1
+                walk.path.append(step)
+                checker(attributes[key], walk, depth + 1)
+                walk.path.pop()
+            elif not optional:
+                walk.report(expected, "absent", "Missing required attribute", step)
+        if found != len(attributes):
+            _unsupported(attributes, names, walk)
+
+    return check
+
+
+def _list(vtype: CtyList[Any]) -> _Checker:
+    element = _compile(vtype.element_type)
+
+    def check(raw_data: Any, walk: _Walk, depth: int) -> None:
+        kind = type(raw_data)
+        if kind is not list and kind is not tuple:
+            if raw_data is not None:
+                walk.mismatch(vtype, raw_data)
+            return
+        if depth == MAX_DEPTH:
+            walk.validate(vtype, raw_data)
+            return
+        for index, item in enumerate(raw_data):
+            walk.path.append(IndexStep(index))
+            element(item, walk, depth + 1)
+            walk.path.pop()
+
+    return check
+
+
+def _map(vtype: CtyMap[Any]) -> _Checker:
+    element = _compile(vtype.element_type)
+
+    def check(raw_data: Any, walk: _Walk, depth: int) -> None:
+        kind = type(raw_data)
+        if kind is not dict and kind is not FrozenDict:
+            if raw_data is not None:
+                walk.mismatch(vtype, raw_data)
+            return
+        if depth == MAX_DEPTH:
+            walk.validate(vtype, raw_data)
+            return
+        keys: set[str] = set()
+        for key, item in raw_data.items():
+            if type(key) is not str:
+                walk.report(type_name(vtype), "object", "Map keys must be strings")
+                return
+            normalized = unicodedata.normalize("NFC", key)
+            if normalized in keys:
+                walk.report(
+                    type_name(vtype),
+                    "object",
+                    f"Map keys {key!r} and {normalized!r} normalize to the same NFC string",
+                )
+                return
+            keys.add(normalized)
+            walk.path.append(KeyStep(normalized))
+            element(item, walk, depth + 1)
+            walk.path.pop()
+
+    return check
+
+
+def _generic(vtype: CtyType[Any]) -> _Checker:
+    def check(raw_data: Any, walk: _Walk, depth: int) -> None:
+        walk.validate(vtype, raw_data)
+
+    return check
+
+
+_COMPILERS: dict[type, Callable[[Any], _Checker]] = {
+    CtyString: lambda vtype: _leaf(vtype, (str,)),
+    CtyNumber: lambda vtype: _leaf(vtype, (int, float, Decimal)),
+    CtyBool: lambda vtype: _leaf(vtype, (bool,)),
+    CtyDynamic: _dynamic,
+    CtyObject: _object,
+    CtyList: _list,
+    CtyMap: _map,
+}
+
+
+def _compile(vtype: CtyType[Any]) -> _Checker:
+    return compile_schema(vtype, _COMPILERS, _generic)
+
+
+_compiled: SchemaCache[_Checker] = SchemaCache(_compile)
+
+
+def find_violations(raw_data: Any, schema: CtyType[Any]) -> list[SchemaViolation]:
+    """Return every place raw data does not conform to a schema.
+
+    Args:
+        raw_data: Raw parse result, as `parse_with_context` returns it
+        schema: CTY type the data should conform to
+
+    Returns:
+        Violations in schema order; empty when ``schema.validate`` would
+        accept the data
+
+    Example:
+        >>> schema = CtyObject({"name": CtyString(), "count": CtyNumber()})
+        >>> [str(v) for v in find_violations({"count": [1]}, schema)]
+        ['name: Missing required attribute', 'count: Expected number, got tuple']
+    """
+    walk = _Walk()
+    _compiled(schema)(raw_data, walk, 0)
+    return walk.violations
+
+
+def _name_pattern(name: str) -> re.Pattern[str]:
+    # An attribute (`name =`, `"name":`) or a block (`name {`, `name "label"`).
+    return re.compile(rf'(?<![\w.-])"?{re.escape(name)}"?[ \t]*(?:=(?!=)|:|(\{{|"))')
+
+
+def _element_start(text: str, pos: int, index: int) -> int | None:  # noqa: C901
+    """Offset of element `index` of the tuple literal starting at `pos`."""
+    start = len(text) - len(text[pos:].lstrip())
+    if not text.startswith("[", start):
+        return None
+    depth, count, in_string, expecting = 0, 0, False, False
+    i = start
+    while i < len(text):
+        c = text[i]
+        if expecting and not c.isspace() and c not in ",]":
+            if count == index:
+                return i
+            expecting = False
+        if in_string:
+            if c == "\\":
+                i += 1
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in "[{(":
+            depth += 1
+            expecting = depth == 1
+        elif c in "]})":
+            depth -= 1
+            if depth == 0:
+                return None
+        elif c == "," and depth == 1:
+            count += 1
+            expecting = True
+        i += 1
+    return None
+
+
+def _locate_in(segment: Segment, steps: tuple[PathStep, ...]) -> int:
+    """Follow path steps through a statement's text as far as they can be found."""
+    text = segment.text
+    line = segment.start_line
+    pos = 0
+    previous: re.Match[str] | None = None
+    for step in steps:
+        if isinstance(step, IndexStep):
+            if previous is None:
+                break
+            if previous.group(1) is not None:
+                # Repeated nested blocks: the index counts occurrences.
+                match: re.Match[str] | None = previous
+                for _ in range(step.index):
+                    match = previous.re.search(text, match.end()) if match is not None else None
+                if match is None:
+                    return line
+                pos = match.end()
+                previous = None
+            else:
+                found = _element_start(text, pos, step.index)
+                if found is None:
+                    break
+                pos = found
+        else:
+            name = step.name if isinstance(step, GetAttrStep) else getattr(step, "key", None)
+            if type(name) is not str:
+                break
+            previous = _name_pattern(name).search(text, pos)
+            if previous is None:
+                break
+            pos = previous.end()
+        line = segment.start_line + text.count("\n", 0, pos)
+    return line
+
+
+def _line_of(segments: list[Segment], steps: tuple[PathStep, ...]) -> int | None:
+    if not steps or not isinstance(steps[0], GetAttrStep):
+        return None
+    name = steps[0].name
+    for segment in reversed(segments):
+        if segment.kind == "attribute" and segment.name == name:
+            return _locate_in(segment, steps)
+
+    blocks = [segment for segment in segments if segment.kind == "block" and segment.name == name]
+    if not blocks:
+        return None
+    if len(steps) < 2 or not isinstance(steps[1], IndexStep) or steps[1].index >= len(blocks):
+        return blocks[0].start_line
+    block = blocks[steps[1].index]
+    rest = steps[2:]
+    # python-hcl2 nests a block's body under one key per label.
+    for label in block.labels:
+        if not rest or label not in (getattr(rest[0], "name", None), getattr(rest[0], "key", None)):
+            return block.start_line
+        rest = rest[1:]
+    return _locate_in(block, rest) if rest else block.start_line
+
+
+def locate_violations(content: str, violations: list[SchemaViolation]) -> list[SchemaViolation]:
+    """Fill in source lines for violations found in an HCL document.
+
+    Lines are found by following each path through the document's text,
+    stopping at the deepest step that can be found, so a missing attribute
+    points at the object that lacks it. The search is textual and
+    best-effort: a violation it cannot place keeps ``line=None``.
+
+    Args:
+        content: HCL source the violations were found in
+        violations: Violations from `find_violations` on its parse
+
+    Returns:
+        The violations, in the same order, with `line` set where found
+    """
+    if not violations:
+        return violations
+    segments = split_segments(content)
+    return [
+        violation
+        if violation.line is not None
+        else evolve(violation, line=_line_of(segments, violation.path.steps))
+        for violation in violations
+    ]
+
+
+def clear_checker_cache() -> None:
+    """Drop the compiled checkers `find_violations` reuses across calls."""
+    _compiled.cache_clear()
+
+
+# 📄⚙️🔚
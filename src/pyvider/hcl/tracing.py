@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tracing spans for the parse pipeline and the factories.
+
+Tracing is off until `configure_tracing` turns it on. Spans are
+provide.foundation `Span`s: they nest under the caller's current foundation
+span, and when OpenTelemetry is installed each is mirrored to the global
+tracer provider, so pyvider-hcl shows up inside a provider's own traces.
+An exporter -- any callable taking a finished span, such as ``list.append``
+-- receives every span as it ends, for local inspection.
+
+Entry points get a span named ``hcl.<function>``, with one child per stage
+(``hcl.read``, ``hcl.cache``, ``hcl.decode``, ``hcl.parse``, ``hcl.infer``,
+``hcl.validate``, ``hcl.violations``). Attributes:
+
+- ``hcl.file``: the source path, when there is one
+- ``hcl.size``: source size in UTF-8 bytes
+- ``hcl.schema``: the schema's type name, a variable's type string or a
+  resource type
+- ``hcl.outcome``: ``ok``, ``cache_hit``, or the class name of the
+  exception raised
+- ``hcl.variable`` / ``hcl.resource``: the name given to a factory
+
+While tracing is off, a stage costs one check and a shared no-op context.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import contextlib
+from contextlib import AbstractContextManager
+import functools
+import inspect
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from provide.foundation.tracer import Span, with_span
+
+if TYPE_CHECKING:
+    from pyvider.cty import CtyType
+    from pyvider.hcl.parser.source import HclSource
+
+SpanExporter = Callable[[Span], None]
+"""Receives each span once it has finished."""
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_config_lock = threading.Lock()
+_enabled = False
+_exporter: SpanExporter | None = None
+_DISABLED: AbstractContextManager[None] = contextlib.nullcontext()
+
+
+def configure_tracing(enabled: bool = True, exporter: SpanExporter | None = None) -> None:
+    """Turn tracing spans on or off.
+
+    Args:
+        enabled: Emit spans from the parse entry points and factories
+        exporter: Optional callable given every finished span, replacing
+            any previous one; OpenTelemetry export, when installed, does
+            not need it
+
+    Example:
+        >>> spans = []
+        >>> configure_tracing(exporter=spans.append)
+        >>> parse_hcl_to_cty('name = "web"')
+        >>> [span.name for span in spans]
+        ['hcl.decode', 'hcl.parse', 'hcl.infer', 'hcl.parse_hcl_to_cty']
+    """
+    global _enabled, _exporter
+    with _config_lock:
+        _enabled = enabled
+        _exporter = exporter
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are being emitted."""
+    return _enabled
+
+
+def _attributes(
+    source: HclSource | None, file: Path | str | None, schema: CtyType[Any] | str | None
+) -> dict[str, Any]:
+    from pyvider.hcl.parser.stats import source_bytes
+    from pyvider.hcl.parser.violations import type_name
+
+    attributes: dict[str, Any] = {}
+    if file is not None:
+        attributes["hcl.file"] = str(file)
+    if source is not None:
+        attributes["hcl.size"] = source_bytes(source)
+    if schema is not None:
+        attributes["hcl.schema"] = schema if isinstance(schema, str) else type_name(schema)
+    return attributes
+
+
+@contextlib.contextmanager
+def _span(name: str, attributes: dict[str, Any]) -> Iterator[Span]:
+    context = with_span(f"hcl.{name}")
+    span = context.span
+    try:
+        with context:
+            for key, value in attributes.items():
+                span.set_tag(key, value)
+            try:
+                yield span
+            except BaseException as e:
+                span.set_tag("hcl.outcome", type(e).__name__)
+                raise
+            if "hcl.outcome" not in span.tags:
+                span.set_tag("hcl.outcome", "ok")
+    finally:
+        exporter = _exporter
+        if exporter is not None:
+            exporter(span)
+
+
+def traced(
+    name: str,
+    *,
+    source: HclSource | None = None,
+    file: Path | str | None = None,
+    schema: CtyType[Any] | str | None = None,
+    **attributes: Any,
+) -> AbstractContextManager[Span | None]:
+    """A span around one stage or call, or a no-op while tracing is off.
+
+    Attributes are only worked out when tracing is on, so callers pass the
+    source and schema rather than their size and name.
+
+    Args:
+        name: Span name, without the ``hcl.`` prefix
+        source: Source whose size to record
+        file: Source path to record
+        schema: Schema whose type name to record, or the name itself
+        **attributes: Further span attributes, recorded with the ``hcl.``
+            prefix
+
+    Returns:
+        A context manager yielding the span, or None while tracing is off
+    """
+    if not _enabled:
+        return _DISABLED
+    extra = {f"hcl.{key}": value for key, value in attributes.items()}
+    return _span(name, {**_attributes(source, file, schema), **extra})
+
+
+def traced_call(**parameters: str) -> Callable[[_F], _F]:
+    """Decorate a function to run in a span named after it, as `traced` would.
+
+    Args:
+        **parameters: `traced` keyword arguments, each naming the parameter
+            of the decorated function whose value to record
+
+    Example:
+        >>> @traced_call(schema="type_str", variable="name")
+        ... def create_variable_cty(name, type_str, ...): ...
+    """
+
+    def decorate(function: _F) -> _F:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return function(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs).arguments
+            values = {key: arguments.get(parameter) for key, parameter in parameters.items()}
+            with traced(function.__name__, **values):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+# 📄⚙️🔚
@@ -12,6 +12,8 @@ from provide.testkit import (
 )
 import pytest
 
+from benchmarks.corpus import CorpusSpec, write_corpus
+
 
 @pytest.fixture(autouse=True)
 def reset_foundation() -> None:
@@ -117,6 +119,13 @@ variable "vpc_name" {
     return tmp_path
 
 
+@pytest.fixture
+def terraform_corpus(tmp_path: Path) -> Path:
+    """Writes a small synthetic multi-module Terraform tree and returns its root."""
+    write_corpus(CorpusSpec(modules=2, files_per_module=4, blocks_per_file=5, heredoc_lines=3), tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def hcl_config_file(tmp_path: Path) -> Path:
     """Provides a temporary HCL configuration file."""
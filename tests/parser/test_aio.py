@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the asyncio parsing API."""
+
+import asyncio
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyObject, CtyString
+from pyvider.hcl import (
+    HclParsingError,
+    aparse_directory,
+    aparse_file,
+    aparse_hcl_to_cty,
+    configure_async_parsing,
+)
+from pyvider.hcl.parser import aio
+
+
+@pytest.fixture
+def slow_parse(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Replace the parse with one that sleeps and records peak concurrency."""
+    state: dict[str, Any] = {"active": 0, "peak": 0, "finished": 0, "lock": threading.Lock()}
+
+    def _parse(hcl_content: str, *args: Any) -> str:
+        with state["lock"]:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with state["lock"]:
+            state["active"] -= 1
+            state["finished"] += 1
+        return hcl_content
+
+    monkeypatch.setattr(aio, "_parse_hcl", _parse)
+    return state
+
+
+class TestAsyncParsing:
+    """Tests for the async entry points."""
+
+    async def test_parse_string(self) -> None:
+        result = await aparse_hcl_to_cty('name = "example"')
+        assert result.value["name"].value == "example"
+
+    async def test_parse_with_schema(self) -> None:
+        schema = CtyObject({"name": CtyString()})
+        result = await aparse_hcl_to_cty('name = "example"', schema)
+        assert result.type == schema
+
+    async def test_parse_error_propagates(self) -> None:
+        with pytest.raises(HclParsingError):
+            await aparse_hcl_to_cty("invalid { unclosed")
+
+    async def test_file_error_carries_source(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.hcl"
+        path.write_text("invalid { unclosed")
+        with pytest.raises(HclParsingError) as exc_info:
+            await aparse_file(path)
+        assert exc_info.value.source_file == str(path)
+
+    async def test_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(HclParsingError, match="Failed to read HCL file"):
+            await aparse_file(tmp_path / "missing.hcl")
+
+    async def test_timeout(self, slow_parse: dict[str, Any]) -> None:
+        with pytest.raises(TimeoutError):
+            await aparse_hcl_to_cty("a = 1", timeout=0.01)
+
+    async def test_concurrency_limit(self, slow_parse: dict[str, Any]) -> None:
+        semaphore = asyncio.Semaphore(2)
+        results = await asyncio.gather(*(aparse_hcl_to_cty(f"a = {i}", semaphore=semaphore) for i in range(6)))
+        assert results == [f"a = {i}" for i in range(6)]
+        assert slow_parse["peak"] <= 2
+
+    async def test_cancelled_caller_holds_permit_until_job_ends(self, slow_parse: dict[str, Any]) -> None:
+        semaphore = asyncio.Semaphore(1)
+        task = asyncio.ensure_future(aparse_hcl_to_cty("a = 1", semaphore=semaphore))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The running job still owns the only permit, so the next parse
+        # starts only once it has finished.
+        await aparse_hcl_to_cty("b = 2", semaphore=semaphore)
+        assert slow_parse["peak"] == 1
+        assert slow_parse["finished"] == 2
+
+    async def test_parse_directory(self, tmp_path: Path) -> None:
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "b.tf").write_text('name = "b"')
+        (tmp_path / "a.hcl").write_text('name = "a"')
+        (tmp_path / "nested" / "c.tf").write_text('name = "c"')
+        (tmp_path / "ignored.txt").write_text("not hcl")
+
+        results = await aparse_directory(tmp_path)
+        assert list(results) == sorted(results)
+        assert {path.name: value.value["name"].value for path, value in results.items()} == {
+            "a.hcl": "a",
+            "b.tf": "b",
+            "c.tf": "c",
+        }
+
+    async def test_directory_is_walked_off_the_loop_within_the_timeout(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        threads: list[threading.Thread] = []
+
+        def slow_find(root: Path, patterns: tuple[str, ...]) -> list[Path]:
+            threads.append(threading.current_thread())
+            time.sleep(0.2)
+            return []
+
+        monkeypatch.setattr(aio, "_find_files", slow_find)
+        with pytest.raises(TimeoutError):
+            await aparse_directory(tmp_path, timeout=0.05)
+        assert threads
+        assert threads[0] is not threading.current_thread()
+
+    async def test_parse_directory_error(self, tmp_path: Path) -> None:
+        (tmp_path / "good.tf").write_text('name = "good"')
+        (tmp_path / "bad.tf").write_text("invalid { unclosed")
+        with pytest.raises(HclParsingError) as exc_info:
+            await aparse_directory(tmp_path)
+        assert exc_info.value.source_file == str(tmp_path / "bad.tf")
+
+    def test_invalid_max_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            configure_async_parsing(max_concurrency=0)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for parse_files batch parsing."""
+
+from pathlib import Path
+
+import pytest
+
+from pyvider.hcl import DiskParseCache, HclParsingError, parse_files
+
+
+def _write_files(root: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = root / f"file_{i:03d}.hcl"
+        path.write_text(f'index = {i}\nname = "file-{i}"\n')
+        paths.append(path)
+    return paths
+
+
+class TestParseFiles:
+    """Tests for ordering, error propagation and pooling."""
+
+    def test_serial_results_in_input_order(self, tmp_path: Path) -> None:
+        paths = _write_files(tmp_path, 5)
+        results = parse_files(reversed(paths), workers=1)
+        assert [result["index"] for result in results] == [4, 3, 2, 1, 0]
+
+    def test_pool_results_in_input_order(self, tmp_path: Path) -> None:
+        paths = _write_files(tmp_path, 20)
+        results = parse_files(paths, workers=2, chunksize=3)
+        assert [result["index"] for result in results] == list(range(20))
+
+    def test_error_crosses_process_boundary(self, tmp_path: Path) -> None:
+        paths = _write_files(tmp_path, 4)
+        paths[2].write_text("invalid { unclosed")
+
+        with pytest.raises(HclParsingError) as exc_info:
+            parse_files(paths, workers=2)
+        assert exc_info.value.source_file == str(paths[2])
+
+    def test_return_exceptions(self, tmp_path: Path) -> None:
+        paths = _write_files(tmp_path, 4)
+        paths[1].write_text("invalid { unclosed")
+
+        results = parse_files(paths, workers=2, return_exceptions=True)
+        assert isinstance(results[1], HclParsingError)
+        assert results[1].source_file == str(paths[1])
+        assert results[3]["index"] == 3
+
+    def test_missing_file_reports_source(self, tmp_path: Path) -> None:
+        missing = tmp_path / "missing.hcl"
+        with pytest.raises(HclParsingError, match="Failed to read HCL file") as exc_info:
+            parse_files([missing], workers=1)
+        assert exc_info.value.source_file == str(missing)
+
+    def test_shared_disk_cache(self, tmp_path: Path) -> None:
+        paths = _write_files(tmp_path, 3)
+        for path in paths:
+            path.write_text(f'service "{path.stem}" {{\n  port = 80\n}}\n')
+        cache = DiskParseCache(tmp_path / "cache")
+        parse_files(paths, workers=2, disk_cache=cache)
+        assert cache.size_bytes() > 0
+
+    def test_empty_input(self) -> None:
+        assert parse_files([]) == []
+
+    def test_invalid_worker_count(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            parse_files(_write_files(tmp_path, 1), workers=0)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the in-memory parse cache."""
+
+import pytest
+
+from pyvider.cty import CtyObject, CtyString
+from pyvider.hcl import HclParsingError, ParseCache, parse_hcl_to_cty, parse_with_context
+from pyvider.hcl.parser.cache import content_digest, freeze_raw
+
+
+class TestParseCache:
+    """Tests for ParseCache bookkeeping."""
+
+    def test_get_miss_then_hit(self) -> None:
+        cache = ParseCache()
+        assert cache.get("k") is None
+        cache.put("k", "value", size=10)
+        assert cache.get("k") == "value"
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entries == 1
+        assert stats.current_bytes == 10
+        assert stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used_to_fit_budget(self) -> None:
+        cache = ParseCache(max_bytes=100)
+        cache.put("a", 1, size=40)
+        cache.put("b", 2, size=40)
+        cache.get("a")
+        cache.put("c", 3, size=40)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats().evictions == 1
+        assert cache.stats().current_bytes == 80
+
+    def test_oversized_entry_is_not_stored(self) -> None:
+        cache = ParseCache(max_bytes=10)
+        cache.put("big", "x", size=11)
+        assert len(cache) == 0
+
+    def test_replacing_key_updates_size(self) -> None:
+        cache = ParseCache(max_bytes=100)
+        cache.put("a", 1, size=30)
+        cache.put("a", 2, size=50)
+        assert cache.stats().current_bytes == 50
+        assert cache.get("a") == 2
+
+    def test_clear(self) -> None:
+        cache = ParseCache()
+        cache.put("a", 1, size=1)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().current_bytes == 0
+
+    def test_negative_budget_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ParseCache(max_bytes=-1)
+
+
+class TestCachedParsing:
+    """Tests for cache integration in the parse entry points."""
+
+    def test_parse_hcl_to_cty_returns_shared_value_on_hit(self) -> None:
+        cache = ParseCache()
+        first = parse_hcl_to_cty('name = "example"', cache=cache)
+        second = parse_hcl_to_cty('name = "example"', cache=cache)
+        assert second is first
+        assert cache.stats().hits == 1
+
+    def test_parse_hcl_to_cty_keys_on_schema(self) -> None:
+        cache = ParseCache()
+        schema = CtyObject({"name": CtyString()})
+        inferred = parse_hcl_to_cty('name = "example"', cache=cache)
+        validated = parse_hcl_to_cty('name = "example"', schema=schema, cache=cache)
+        assert validated is not inferred
+        assert parse_hcl_to_cty('name = "example"', schema=schema, cache=cache) is validated
+        assert len(cache) == 2
+
+    def test_equal_schemas_get_values_of_their_own_type(self) -> None:
+        cache = ParseCache()
+        first = CtyObject({"a": CtyString(), "b": CtyString()})
+        second = CtyObject({"b": CtyString(), "a": CtyString()})
+        assert first == second
+        parse_hcl_to_cty('a = "x"\nb = "y"\n', schema=first, cache=cache)
+        result = parse_hcl_to_cty('a = "x"\nb = "y"\n', schema=second, cache=cache)
+        assert result.type is second
+        assert list(result.type.attribute_types) == ["b", "a"]
+        assert parse_hcl_to_cty('a = "x"\nb = "y"\n', schema=second, cache=cache) is result
+
+    def test_errors_are_not_cached(self) -> None:
+        cache = ParseCache()
+        for _ in range(2):
+            with pytest.raises(HclParsingError):
+                parse_hcl_to_cty("invalid { unclosed", cache=cache)
+        assert len(cache) == 0
+
+    def test_parse_with_context_returns_frozen_result(self) -> None:
+        cache = ParseCache()
+        result = parse_with_context('key = "value"\nitems = [1, 2]', cache=cache)
+        assert result["key"] == "value"
+        assert result["items"] == (1, 2)
+        with pytest.raises(TypeError):
+            result["key"] = "changed"
+        assert parse_with_context('key = "value"\nitems = [1, 2]', cache=cache) is result
+
+    def test_parse_with_context_without_cache_is_unchanged(self) -> None:
+        result = parse_with_context("items = [1, 2]")
+        assert isinstance(result["items"], list)
+
+
+class TestCacheHelpers:
+    """Tests for digest and freezing helpers."""
+
+    def test_content_digest_is_stable(self) -> None:
+        assert content_digest("a = 1") == content_digest("a = 1")
+        assert content_digest("a = 1") != content_digest("a = 2")
+
+    def test_freeze_raw_nested(self) -> None:
+        frozen = freeze_raw({"a": [{"b": [1]}]})
+        assert frozen == {"a": ({"b": (1,)},)}
+        with pytest.raises(TypeError):
+            frozen["a"][0]["b"] = 2
+
+
+# 📄⚙️🔚
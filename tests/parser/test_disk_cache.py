@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the persistent on-disk parse cache."""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+
+import pytest
+
+from pyvider.hcl import DiskParseCache, parse_hcl_to_cty, parse_with_context
+from pyvider.hcl.parser import disk_cache as disk_cache_module
+from pyvider.hcl.parser.disk_cache import default_cache_dir
+
+HCL = 'name = "example"\nports = [80, 443]\nratio = 1.5\n'
+# Attribute-only documents take the scanner fast path, which skips the disk
+# cache, so the integration tests use a document with a block.
+BLOCK_HCL = 'service "web" {\n  ports = [80, 443]\n}\n'
+
+
+def _write_and_read(directory: str) -> object:
+    cache = DiskParseCache(Path(directory))
+    key = cache.key_for(HCL)
+    for _ in range(20):
+        cache.put(key, {"name": "example", "ports": [80, 443]})
+        assert cache.get(key) == {"name": "example", "ports": [80, 443]}
+    return cache.get(key)
+
+
+class TestDiskParseCache:
+    """Tests for DiskParseCache storage."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        key = cache.key_for(HCL)
+        assert cache.get(key) is None
+
+        data = {"name": "example", "ports": [80, 443], "ratio": 1.5, "none": None, "flag": True}
+        cache.put(key, data)
+        assert cache.get(key) == data
+        assert cache.size_bytes() > 0
+
+    def test_key_depends_on_content(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        assert cache.key_for("a = 1") != cache.key_for("a = 2")
+
+    def test_key_depends_on_versions(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = DiskParseCache(tmp_path)
+        before = cache.key_for(HCL)
+        monkeypatch.setattr(disk_cache_module, "_version_salt", lambda: b"python-hcl2=other\n")
+        assert cache.key_for(HCL) != before
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        key = cache.key_for(HCL)
+        cache.put(key, {"a": 1})
+        entry = next(tmp_path.glob("*/*.hclz"))
+        entry.write_bytes(b"garbage")
+
+        assert cache.get(key) is None
+        assert not entry.exists()
+
+    def test_prune_removes_least_recently_used(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path, max_bytes=10_000)
+        keys = [cache.key_for(f"v = {i}") for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, {"payload": os.urandom(1500).hex()})
+            entry = next(tmp_path.glob(f"*/{key}.hclz"))
+            os.utime(entry, (1_000_000 + age, 1_000_000 + age))
+
+        cache.max_bytes = 5_000
+        removed = cache.prune()
+
+        assert removed >= 1
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.size_bytes() <= 5_000
+
+    def test_put_prunes_when_over_budget(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path, max_bytes=4_000)
+        for i in range(10):
+            cache.put(cache.key_for(f"v = {i}"), {"payload": os.urandom(500).hex()})
+        assert cache.size_bytes() <= 4_000
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        cache.put(cache.key_for(HCL), {"a": 1})
+        cache.clear()
+        assert cache.size_bytes() == 0
+
+    def test_no_temporary_files_left_behind(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        cache.put(cache.key_for(HCL), {"a": 1})
+        assert not list(tmp_path.glob("*/.tmp-*"))
+
+    def test_concurrent_processes(self, tmp_path: Path) -> None:
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_write_and_read, [str(tmp_path)] * 4))
+        assert all(result == {"name": "example", "ports": [80, 443]} for result in results)
+
+    def test_default_directory_from_environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYVIDER_HCL_CACHE_DIR", str(tmp_path / "custom"))
+        assert default_cache_dir() == tmp_path / "custom"
+        assert DiskParseCache().directory == tmp_path / "custom"
+
+
+class TestDiskCachedParsing:
+    """Tests for disk cache integration in the parse entry points."""
+
+    def test_parse_with_context_uses_disk_cache(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        first = parse_with_context(BLOCK_HCL, disk_cache=cache)
+        assert cache.get(cache.key_for(BLOCK_HCL)) == first
+
+        # A fresh instance on the same directory, as a new process would have.
+        second = parse_with_context(BLOCK_HCL, disk_cache=DiskParseCache(tmp_path))
+        assert second == first
+
+    def test_parse_hcl_to_cty_uses_disk_cache(self, tmp_path: Path) -> None:
+        cache = DiskParseCache(tmp_path)
+        cache.put(cache.key_for(BLOCK_HCL), {"name": "from-cache"})
+        result = parse_hcl_to_cty(BLOCK_HCL, disk_cache=cache)
+        assert result.value["name"].value == "from-cache"
+
+
+# 📄⚙️🔚
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the serialized parser artifact and warm-up."""
+
+from pathlib import Path
+
+import hcl2
+import pytest
+
+from pyvider.hcl import warmup
+from pyvider.hcl.parser.grammar import build_parser_artifact, get_parser, grammar_cache_path
+from pyvider.hcl.parser.loader import load_raw
+
+
+class TestGrammarCache:
+    """Tests for artifact location and construction."""
+
+    def test_environment_override(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYVIDER_HCL_GRAMMAR_CACHE", str(tmp_path / "parser.bin"))
+        assert grammar_cache_path() == tmp_path / "parser.bin"
+
+    @pytest.mark.slow
+    def test_build_parser_artifact(self, tmp_path: Path) -> None:
+        target = build_parser_artifact(tmp_path / "nested" / "parser.bin")
+        assert target.exists()
+        assert target.stat().st_size > 0
+
+    def test_get_parser_is_shared(self) -> None:
+        assert get_parser() is get_parser()
+
+
+class TestWarmup:
+    """Tests for warmup and the loader built on it."""
+
+    def test_warmup_is_idempotent(self) -> None:
+        warmup()
+        warmup()
+
+    def test_load_raw_matches_hcl2(self, sample_hcl_content: str) -> None:
+        assert load_raw(sample_hcl_content) == hcl2.loads(sample_hcl_content)
+
+    def test_load_raw_without_trailing_newline(self) -> None:
+        assert load_raw('name = "x"') == {"name": "x"}
+
+
+# 📄⚙️🔚
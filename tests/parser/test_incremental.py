@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for incremental reparsing with ParseSession."""
+
+from typing import Any
+
+import pytest
+
+from pyvider.hcl import HclParsingError, ParseSession, parse_with_context
+from pyvider.hcl.parser import incremental
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.segments import split_segments
+
+DOCUMENT = """variable "region" {
+  default = "us-east-1"
+}
+
+resource "aws_instance" "web" {
+  ami = "ami-123"
+}
+
+resource "aws_instance" "db" {
+  ami = "ami-456"
+}
+
+count = 3
+"""
+
+
+@pytest.fixture
+def parsed_segments(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the text of every segment the session parses."""
+    seen: list[str] = []
+    original = incremental.parse_segment
+
+    def _parse(segment: Any, **kwargs: Any) -> Any:
+        seen.append(segment.text)
+        return original(segment, **kwargs)
+
+    monkeypatch.setattr(incremental, "parse_segment", _parse)
+    return seen
+
+
+def _replace(session: ParseSession, old: str, new: str) -> Any:
+    start = session.text.index(old)
+    return session.apply_edit(start, start + len(old), new)
+
+
+class TestParseSession:
+    """Tests for edit application, change tracking and consistency."""
+
+    def test_initial_tree_matches_full_parse(self) -> None:
+        assert ParseSession(DOCUMENT).tree == parse_with_context(DOCUMENT)
+
+    def test_edit_reparses_only_touched_block(self, parsed_segments: list[str]) -> None:
+        session = ParseSession(DOCUMENT)
+        parsed_segments.clear()
+
+        result = _replace(session, "ami-123", "ami-999")
+        assert result.changed == {"resource.aws_instance.web"}
+        assert len(parsed_segments) == 1
+        assert result.tree == parse_with_context(session.text)
+
+    def test_spans_shift_after_edit(self) -> None:
+        session = ParseSession(DOCUMENT)
+        _replace(session, 'ami = "ami-123"\n', 'ami = "ami-123"\n  instance_type = "t3.micro"\n')
+        assert list(session.segments) == split_segments(session.text)
+        assert session.segments[-1].start_line == 14
+
+    def test_added_and_removed_blocks(self) -> None:
+        session = ParseSession(DOCUMENT)
+        result = _replace(session, "count = 3\n", 'output "ip" {\n  value = 1\n}\n')
+        assert result.changed == {"count", "output.ip"}
+        assert "count" not in result.tree
+        assert result.tree["output"] == [{"ip": {"value": 1}}]
+
+    def test_edit_in_gap_changes_nothing(self, parsed_segments: list[str]) -> None:
+        session = ParseSession(DOCUMENT)
+        parsed_segments.clear()
+        result = _replace(session, "}\n\nresource", "}\n\n# comment\nresource")
+        assert result.changed == frozenset()
+        assert parsed_segments == []
+
+    def test_unbalanced_edit_fails_atomically(self) -> None:
+        session = ParseSession(DOCUMENT)
+        with pytest.raises(HclParsingError):
+            _replace(session, '}\n\nresource "aws_instance" "db"', '\n\nresource "aws_instance" "db"')
+        assert session.text == DOCUMENT
+        assert session.tree == parse_with_context(DOCUMENT)
+
+    def test_statements_sharing_a_line_are_rejected(self) -> None:
+        shared = 'locals {\n  a = 1\n} resource "a" "two" {\n  y = 2\n}\n'
+        assert load_raw(shared)["resource"] == [{"a": {"two": {"y": 2}}}]
+        with pytest.raises(HclParsingError, match="shares a line") as excinfo:
+            ParseSession('resource "a" "one" {\n  x = 1\n}\n' + shared)
+        assert excinfo.value.line == 4
+
+        session = ParseSession(DOCUMENT)
+        with pytest.raises(HclParsingError, match="shares a line"):
+            _replace(session, "}\n\nresource", "} resource")
+        assert session.tree == load_raw(DOCUMENT)
+
+    def test_update_with_full_text(self) -> None:
+        session = ParseSession(DOCUMENT)
+        new_text = DOCUMENT.replace('default = "us-east-1"', 'default = "eu-west-1"')
+        result = session.update(new_text)
+        assert result.changed == {"variable.region"}
+        assert result.tree == parse_with_context(new_text)
+
+    def test_invalid_range(self) -> None:
+        session = ParseSession(DOCUMENT)
+        with pytest.raises(ValueError, match="outside the document"):
+            session.apply_edit(10, len(DOCUMENT) + 1, "")
+
+
+# 📄⚙️🔚
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for single-pass type inference and value building."""
+
+from decimal import Decimal
+from typing import Any
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+import pytest
+
+from pyvider.cty import CtyValue
+from pyvider.cty.conversion import infer_cty_type_from_raw
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.hcl.parser import inference
+from pyvider.hcl.parser.inference import auto_infer_cty_type, clear_type_cache, infer_type
+
+
+def _two_pass(raw: Any) -> CtyValue[Any]:
+    return infer_cty_type_from_raw(raw).validate(raw)
+
+
+RAW_DATA = [
+    {"name": "x", "count": 3, "ratio": 0.5, "big": 10**30, "on": True, "none": None},
+    {"empty_list": [], "empty_object": {}, "price": Decimal("1.25")},
+    {"unicode": "é", "keys": {"é": 1}},
+    {"mixed": [1, "a", None, [1], {"a": 1}]},
+    {"blocks": [{"web": {"ami": "a"}}, {"db": {"engine": "pg"}}]},
+    {"unified": [{"a": 1, "b": [1]}, {"a": "x", "b": ["y"]}]},
+    {"nested_lists": [[], [[], [False]], [[1], ["a"]]]},
+    {"retyped_twice": [[[1], ["a"]], [[True]], []]},
+    [],
+    None,
+    "scalar",
+]
+
+
+@pytest.mark.parametrize("raw", RAW_DATA)
+def test_single_pass_matches_infer_then_validate(raw: Any) -> None:
+    result = auto_infer_cty_type(raw)
+    expected = _two_pass(raw)
+    assert result == expected
+    assert result.type.equal(expected.type)
+    assert result.raw_value == expected.raw_value
+
+
+@pytest.mark.parametrize("raw", RAW_DATA)
+def test_type_alone_matches_the_built_value(raw: Any) -> None:
+    assert infer_type(raw).equal(auto_infer_cty_type(raw).type)
+
+
+def test_data_outside_parser_output_is_left_to_pyvider_cty(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    original = inference.infer_cty_type_from_raw
+
+    def _record(raw: Any) -> Any:
+        calls.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(inference, "infer_cty_type_from_raw", _record)
+    auto_infer_cty_type({"a": [1, 2]})
+    assert calls == []
+
+    raw = {"pair": (1, "a")}
+    assert auto_infer_cty_type(raw) == _two_pass(raw)
+    assert calls == [raw]
+    assert infer_type(raw) == infer_cty_type_from_raw(raw)
+    assert calls == [raw, raw]
+
+
+def test_deep_nesting_falls_back() -> None:
+    raw: Any = {"leaf": 1}
+    for _ in range(200):
+        raw = {"n": raw}
+    assert auto_infer_cty_type(raw) == _two_pass(raw)
+
+
+@pytest.mark.parametrize("raw", [{1: "a"}, {"e\u0301": 1, "\u00e9": 2}])
+def test_invalid_data_raises_as_before(raw: Any) -> None:
+    with pytest.raises(CtyValidationError):
+        _two_pass(raw)
+    with pytest.raises(CtyValidationError):
+        auto_infer_cty_type(raw)
+
+
+def test_repeated_shapes_share_one_type() -> None:
+    rule = {"from_port": 443, "cidr_blocks": ["0.0.0.0/0"]}
+    first = auto_infer_cty_type({"ingress": [dict(rule), dict(rule)], "tags": {"a": "x"}})
+    second = auto_infer_cty_type({"rule": dict(rule, from_port=80), "tags": {"a": "y"}})
+
+    elements = first["ingress"].value
+    assert elements[0].type is elements[1].type
+    assert second["rule"].type is elements[0].type
+    assert second["tags"].type is first["tags"].type
+
+
+def test_type_cache_is_bounded_and_clearable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inference, "_SHAPE_CACHE_SIZE", 4)
+    clear_type_cache()
+    for i in range(20):
+        raw = {f"key_{i}": {"nested": [i]}, "other": {"a": [{"b": i}]}}
+        assert auto_infer_cty_type(raw) == _two_pass(raw)
+        assert len(inference._object_types) <= 4
+    clear_type_cache()
+    assert not inference._object_types
+
+
+_raw = st.recursive(
+    st.one_of(
+        st.none(),
+        st.booleans(),
+        st.integers(),
+        st.floats(allow_nan=False),
+        st.text(max_size=3),
+    ),
+    lambda children: st.one_of(
+        st.lists(children, max_size=4),
+        st.dictionaries(st.sampled_from(["a", "b", "c", "é"]), children, max_size=3),
+    ),
+    max_leaves=20,
+)
+
+
+@given(raw=_raw)
+@settings(max_examples=150, deadline=None, suppress_health_check=[HealthCheck.differing_executors])
+def test_single_pass_equivalence_property(raw: Any) -> None:
+    result = auto_infer_cty_type(raw)
+    expected = _two_pass(raw)
+    assert result == expected
+    assert result.raw_value == expected.raw_value
+    assert infer_type(raw) == expected.type
+
+
+# 📄⚙️🔚
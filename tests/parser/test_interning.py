@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for key interning across parsed documents."""
+
+from pathlib import Path
+import sys
+from typing import Any
+
+from pyvider.hcl import parse_files, parse_hcl_to_cty, parse_json_with_context, parse_with_context
+from pyvider.hcl.parser.interning import intern_keys
+
+
+def _keys(data: Any) -> list[str]:
+    """Every dict key in the data, depth first."""
+    if isinstance(data, dict):
+        return [key for k, v in data.items() for key in (k, *_keys(v))]
+    if isinstance(data, list):
+        return [key for item in data for key in _keys(item)]
+    return []
+
+
+def _document(i: int) -> str:
+    return (
+        'resource "aws_instance" "web" {\n'
+        '  instance_tags = { owning_team = "platform" }\n'
+        f"  root_block_device {{\n    volume_size = {i}\n  }}\n"
+        "}\n"
+    )
+
+
+class TestInternKeys:
+    """Tests for the interning walk and where it is applied."""
+
+    def test_interns_nested_keys_in_place(self) -> None:
+        inner = {"".join(["inner", "-key"]): [{"".join(["list", "-key"]): 1}]}
+        raw = {"".join(["outer", "-key"]): inner}
+        assert intern_keys(raw) is raw
+        assert raw["outer-key"] is inner
+        assert all(key is sys.intern(key) for key in _keys(raw))
+
+    def test_preserves_order_and_values(self) -> None:
+        raw = {"b": 1, "a": [2, {"c": "d"}], 3: "non-string key"}
+        assert list(intern_keys(raw)) == ["b", "a", 3]
+        assert raw == {"b": 1, "a": [2, {"c": "d"}], 3: "non-string key"}
+
+    def test_documents_share_keys(self) -> None:
+        first, second = parse_with_context(_document(1)), parse_with_context(_document(2))
+        assert first != second
+        for a, b in zip(_keys(first), _keys(second), strict=True):
+            assert a is b
+
+    def test_fast_path_and_values_share_keys(self) -> None:
+        first = parse_hcl_to_cty('deployment_region = "a"')
+        second = parse_hcl_to_cty('deployment_region = "b"')
+        assert next(iter(first.value)) is next(iter(second.value))
+
+    def test_json_documents_share_keys(self) -> None:
+        name = "-".join(["instance", "type"])
+        first = parse_json_with_context(f'{{"{name}": "a"}}')
+        second = parse_json_with_context(f'{{"{name}": "b"}}')
+        assert next(iter(first)) is next(iter(second))
+
+    def test_pool_results_share_keys(self, tmp_path: Path) -> None:
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"main_{i}.tf"
+            path.write_text(_document(i))
+            paths.append(path)
+        results = parse_files(paths, workers=2, chunksize=1)
+        for result in results[1:]:
+            for a, b in zip(_keys(results[0]), _keys(result), strict=True):
+                assert a is b
+
+
+# 📄⚙️🔚
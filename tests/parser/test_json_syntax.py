@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for JSON-syntax HCL loading."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pyvider.cty import CtyObject, CtyString
+from pyvider.hcl import (
+    HclParsingError,
+    ParseCache,
+    aparse_file,
+    parse_files,
+    parse_hcl_to_cty,
+    parse_json_to_cty,
+    parse_json_with_context,
+    parse_with_context,
+)
+
+NATIVE = """
+terraform {
+  required_version = ">= 1.0"
+}
+
+variable "region" {
+  default = "us-east-1"
+}
+
+provider "aws" {
+  region = "us-east-1"
+}
+
+provider "aws" {
+  alias = "west"
+}
+
+resource "aws_instance" "web" {
+  ami = "ami-1"
+}
+
+resource "aws_instance" "db" {
+  ami = "ami-2"
+}
+
+locals {
+  a = 1
+}
+"""
+
+JSON = {
+    "//": "generated by a tool",
+    "terraform": {"required_version": ">= 1.0"},
+    "variable": {"region": {"default": "us-east-1"}},
+    "provider": {"aws": [{"region": "us-east-1"}, {"alias": "west"}]},
+    "resource": {"aws_instance": {"web": {"ami": "ami-1", "//": "comment"}, "db": {"ami": "ami-2"}}},
+    "locals": {"a": 1},
+}
+
+
+class TestJsonSyntax:
+    """Tests for normalisation, errors and dispatch by file name."""
+
+    def test_same_shape_as_native_syntax(self) -> None:
+        assert parse_json_with_context(json.dumps(JSON)) == parse_with_context(NATIVE)
+
+    def test_bytes_input(self) -> None:
+        assert parse_json_with_context(json.dumps(JSON).encode()) == parse_with_context(NATIVE)
+
+    def test_to_cty_matches_native(self) -> None:
+        assert parse_json_to_cty(json.dumps(JSON)) == parse_hcl_to_cty(NATIVE)
+
+    def test_schema_validation(self) -> None:
+        schema = CtyObject({"name": CtyString()})
+        assert parse_json_to_cty('{"name": "x"}', schema).value["name"].value == "x"
+        with pytest.raises(HclParsingError, match="Schema validation failed"):
+            parse_json_to_cty('{"other": "x"}', schema)
+
+    def test_tfvars_json_keeps_block_names_as_attributes(self) -> None:
+        data = parse_json_with_context('{"variable": {"a": 1}}', source_file="prod.tfvars.json")
+        assert data == {"variable": {"a": 1}}
+
+    def test_syntax_error_has_location(self) -> None:
+        with pytest.raises(HclParsingError) as exc_info:
+            parse_json_with_context('{\n  "a": ', source_file="main.tf.json")
+        assert exc_info.value.source_file == "main.tf.json"
+        assert exc_info.value.line == 2
+
+    def test_shape_error(self) -> None:
+        with pytest.raises(HclParsingError, match="block body must be a JSON object"):
+            parse_json_with_context('{"variable": {"region": "us-east-1"}}')
+        with pytest.raises(HclParsingError, match="must be an object"):
+            parse_json_with_context("[1, 2]")
+
+    def test_cache_returns_frozen_result(self) -> None:
+        cache = ParseCache()
+        first = parse_json_with_context(json.dumps(JSON), cache=cache)
+        assert parse_json_with_context(json.dumps(JSON), cache=cache) is first
+        assert cache.stats().hits == 1
+
+    def test_cached_values_keep_their_schema(self) -> None:
+        cache = ParseCache()
+        first = CtyObject({"a": CtyString(), "b": CtyString()})
+        second = CtyObject({"b": CtyString(), "a": CtyString()})
+        parse_json_to_cty('{"a": "x", "b": "y"}', first, cache=cache)
+        result = parse_json_to_cty('{"a": "x", "b": "y"}', second, cache=cache)
+        assert result.type is second
+        assert parse_json_to_cty('{"a": "x", "b": "y"}', second, cache=cache) is result
+
+    def test_parse_files_dispatches_on_suffix(self, tmp_path: Path) -> None:
+        json_path = tmp_path / "main.tf.json"
+        json_path.write_text(json.dumps(JSON))
+        native_path = tmp_path / "main.tf"
+        native_path.write_text(NATIVE)
+        from_json, from_native = parse_files([json_path, native_path], workers=1)
+        assert from_json == from_native
+
+    async def test_aparse_file_dispatches_on_suffix(self, tmp_path: Path) -> None:
+        path = tmp_path / "main.tf.json"
+        path.write_text(json.dumps(JSON))
+        assert await aparse_file(path) == parse_hcl_to_cty(NATIVE)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for lazily materialized CtyValues."""
+
+import pickle
+from typing import Any
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+import pytest
+
+from pyvider.cty import CtyObject, CtyString
+from pyvider.cty.exceptions import CtyAttributeValidationError
+from pyvider.hcl import LazyCtyValue, ParseCache, parse_hcl_to_cty
+from pyvider.hcl.parser import inference
+from pyvider.hcl.parser.inference import auto_infer_cty_type
+
+CONFIG = """
+region = "us-east-1"
+zones  = ["a", "b"]
+mixed  = [1, "a"]
+nothing = null
+tags = {
+  env = "prod"
+  owner = { team = "platform", size = 4 }
+}
+
+resource "aws_instance" "web" {
+  ami = "ami-123"
+  count = 2
+}
+"""
+
+RAW = {"region": "us-east-1", "tags": {"env": "prod", "nested": {"depth": 2}}, "zones": ["a"], "none": None}
+
+
+def test_lazy_parse_equals_eager_parse() -> None:
+    lazy = parse_hcl_to_cty(CONFIG, lazy=True)
+    eager = parse_hcl_to_cty(CONFIG)
+
+    assert isinstance(lazy, LazyCtyValue)
+    assert lazy == eager
+    assert eager == lazy
+    assert hash(lazy) == hash(eager)
+    assert lazy.type.equal(eager.type)
+    assert lazy.raw_value == eager.raw_value
+
+
+def test_children_are_built_on_first_access_and_memoized() -> None:
+    value = LazyCtyValue(RAW)
+    assert not value.is_materialized
+
+    tags = value["tags"]
+    assert value.is_materialized
+    assert isinstance(tags, LazyCtyValue)
+    assert not tags.is_materialized
+    assert value["tags"] is tags
+    assert tags["nested"]["depth"].value == 2
+    assert value["region"].value == "us-east-1"
+
+
+def test_attribute_access_does_not_infer_the_type() -> None:
+    value = LazyCtyValue(RAW)
+    value["tags"]["env"]
+    assert value._lazy_type is None
+
+
+def test_missing_attribute_raises_like_an_eager_object() -> None:
+    with pytest.raises(CtyAttributeValidationError):
+        LazyCtyValue(RAW)["missing"]
+
+
+def test_non_object_children_match_inference() -> None:
+    value = parse_hcl_to_cty(CONFIG, lazy=True)
+    eager = auto_infer_cty_type({"mixed": [1, "a"], "nothing": None})
+    assert value["mixed"] == eager["mixed"]
+    assert value["nothing"].is_null
+
+
+def test_non_ascii_object_is_built_eagerly() -> None:
+    value = LazyCtyValue({"outer": {"é": "x"}})
+    assert not isinstance(value["outer"], LazyCtyValue)
+    assert value == auto_infer_cty_type({"outer": {"é": "x"}})
+
+
+def test_materialize_marks_and_pickle_produce_eager_values() -> None:
+    value = LazyCtyValue(RAW)
+    eager = auto_infer_cty_type(RAW)
+
+    assert type(value.materialize()) is not LazyCtyValue
+    assert value.materialize() == eager
+    assert value.mark("sensitive").marks == frozenset({"sensitive"})
+    assert pickle.loads(pickle.dumps(value)) == eager  # noqa: S301
+
+
+def test_lazy_results_are_cached_separately() -> None:
+    cache = ParseCache()
+    lazy = parse_hcl_to_cty(CONFIG, cache=cache, lazy=True)
+    eager = parse_hcl_to_cty(CONFIG, cache=cache)
+
+    assert isinstance(lazy, LazyCtyValue)
+    assert not isinstance(eager, LazyCtyValue)
+    assert parse_hcl_to_cty(CONFIG, cache=cache, lazy=True) is lazy
+    # Sizing the entry for the cache must not build it.
+    assert not lazy.is_materialized
+
+
+def test_objects_in_lists_are_deferred_under_the_unified_type() -> None:
+    raw = {"blocks": [{"web": {"a": 1}}, {"db": {"b": "x"}}], "same": [{"a": 1}, {"a": 2}]}
+    value = LazyCtyValue(raw)
+    eager = auto_infer_cty_type(raw)
+
+    first = value["blocks"].value[0]
+    assert isinstance(first.value, LazyCtyValue)
+    assert isinstance(value["same"].value[1], LazyCtyValue)
+    assert value["blocks"] == eager["blocks"]
+    assert value["same"] == eager["same"]
+
+
+def test_lists_are_typed_in_one_walk_of_plain_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inference, "infer_cty_type_from_raw", None)
+    raw = {"resource": [{"aws_instance": {"web": {"ami": "a", "ebs": [{"size": 1}]}}}, {"other": {}}]}
+    value = LazyCtyValue(raw)
+    assert value["resource"].type == value.type.attribute_types["resource"]
+    monkeypatch.undo()
+    assert value == auto_infer_cty_type(raw)
+
+
+_raw = st.recursive(
+    st.one_of(st.none(), st.booleans(), st.integers(-100, 100), st.text(max_size=3)),
+    lambda children: st.one_of(
+        st.lists(children, max_size=3),
+        st.dictionaries(st.sampled_from(["a", "b", "c", "é"]), children, max_size=3),
+    ),
+    max_leaves=12,
+)
+
+
+@given(raw=st.dictionaries(st.sampled_from(["x", "y", "z"]), _raw, max_size=3))
+@settings(max_examples=75, deadline=None, suppress_health_check=[HealthCheck.differing_executors])
+def test_lazy_equivalence_property(raw: dict[str, Any]) -> None:
+    assert LazyCtyValue(raw) == auto_infer_cty_type(raw)
+
+
+def test_lazy_with_schema_is_rejected() -> None:
+    schema = CtyObject(attribute_types={"region": CtyString()})
+    with pytest.raises(ValueError, match="schema"):
+        parse_hcl_to_cty('region = "x"\n', schema, lazy=True)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for resource limits on untrusted input."""
+
+from pathlib import Path
+import time
+
+import pytest
+
+from pyvider.cty import CtyObject, CtyString
+from pyvider.hcl import (
+    HclLimitError,
+    HclParsingError,
+    ParseLimits,
+    aparse_hcl_to_cty,
+    parse_file,
+    parse_hcl_to_cty,
+    parse_json_to_cty,
+    parse_with_context,
+    validate_hcl,
+)
+from pyvider.hcl.parser import ParseCache, base
+
+# Blocks keep these off the attribute-only fast path, so Lark parses them.
+DEEP = 'resource "x" {\n  a = ' + "[" * 300 + "]" * 300 + "\n}\n"
+MANY = "".join(f'resource "r" "n{i}" {{\n  a = [1, 2, "x"]\n}}\n' for i in range(300))
+
+
+def _exceeded(limit: str, run: object) -> HclLimitError:
+    with pytest.raises(HclLimitError) as exc_info:
+        run()  # type: ignore[operator]
+    assert exc_info.value.limit == limit
+    return exc_info.value
+
+
+class TestParseLimits:
+    """Tests for each limit and where it is enforced."""
+
+    def test_limits_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            ParseLimits(max_bytes=0)
+        with pytest.raises(ValueError):
+            ParseLimits(timeout=-1.0)
+
+    def test_max_bytes_counts_utf8(self) -> None:
+        content = 'a = "é"'
+        assert parse_hcl_to_cty(content, limits=ParseLimits(max_bytes=8)).value["a"].value == "é"
+        _exceeded("max_bytes", lambda: parse_hcl_to_cty(content, limits=ParseLimits(max_bytes=7)))
+
+    def test_max_bytes_is_checked_before_the_cache(self) -> None:
+        cache = ParseCache()
+        parse_hcl_to_cty("a = 1", cache=cache)
+        _exceeded("max_bytes", lambda: parse_hcl_to_cty("a = 1", cache=cache, limits=ParseLimits(max_bytes=2)))
+
+    def test_max_depth_stops_the_parser_before_python_hcl2_recurses(self) -> None:
+        with pytest.raises(HclParsingError, match="recursion"):
+            parse_hcl_to_cty(DEEP)
+        error = _exceeded("max_depth", lambda: parse_hcl_to_cty(DEEP, limits=ParseLimits(max_depth=32)))
+        assert (error.line, error.column) == (2, 38)
+
+    def test_max_depth_ignores_brackets_in_strings(self) -> None:
+        content = "x {\n" + "".join(f'  k{i} = "{{"\n' for i in range(6)) + '  c = "}}}"\n}\n'
+        parse_hcl_to_cty(content, limits=ParseLimits(max_depth=4))
+        nested = "x {\n" + "".join(f'  k{i} = "}}"\n' for i in range(4)) + '  b = [[[["${1}"]]]]\n}\n'
+        _exceeded("max_depth", lambda: parse_hcl_to_cty(nested, limits=ParseLimits(max_depth=4)))
+
+    def test_max_depth_counts_data_nesting(self) -> None:
+        content = 'resource "a" "b" {\n  x = { y = 1 }\n}\n'
+        parse_hcl_to_cty(content, limits=ParseLimits(max_depth=6))
+        _exceeded("max_depth", lambda: parse_hcl_to_cty(content, limits=ParseLimits(max_depth=5)))
+        _exceeded("max_depth", lambda: parse_hcl_to_cty("a = [[[1]]]", limits=ParseLimits(max_depth=3)))
+
+    def test_max_nodes(self) -> None:
+        content = "a = [1, 2, [3, 4]]"
+        parse_hcl_to_cty(content, limits=ParseLimits(max_nodes=7))
+        _exceeded("max_nodes", lambda: parse_hcl_to_cty(content, limits=ParseLimits(max_nodes=6)))
+
+    def test_timeout_abandons_parsing(self) -> None:
+        _exceeded("timeout", lambda: parse_hcl_to_cty(MANY, limits=ParseLimits(timeout=1e-9)))
+
+    def test_parse_file_timeout_covers_the_read(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = tmp_path / "main.tf"
+        path.write_text('resource "r" "n" {\n  a = 1\n}\n', encoding="utf-8")
+        read_source = base.read_source
+
+        def slow_read(*args: object) -> str:
+            time.sleep(0.2)
+            return read_source(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(base, "read_source", slow_read)
+        error = _exceeded("timeout", lambda: parse_file(path, limits=ParseLimits(timeout=0.1)))
+        assert error.source_file == str(path)
+        assert parse_file(path, limits=ParseLimits(timeout=60.0)).value["resource"]
+
+    def test_within_limits_results_are_unchanged(self) -> None:
+        limits = ParseLimits(max_bytes=1 << 20, max_depth=16, max_nodes=10_000, timeout=60.0)
+        assert parse_with_context(MANY, limits=limits) == parse_with_context(MANY)
+
+    def test_errors_name_the_source_file(self) -> None:
+        error = _exceeded(
+            "max_depth", lambda: parse_with_context(DEEP, "tenant.tf", limits=ParseLimits(max_depth=8))
+        )
+        assert error.source_file == "tenant.tf"
+
+    def test_validate_hcl_and_json_honour_limits(self) -> None:
+        schema = CtyObject({"a": CtyString()})
+        _exceeded("max_bytes", lambda: validate_hcl('a = "xyz"', schema, limits=ParseLimits(max_bytes=4)))
+        _exceeded("max_depth", lambda: parse_json_to_cty('{"a": [[[1]]]}', limits=ParseLimits(max_depth=3)))
+
+    async def test_async_parse_honours_limits(self) -> None:
+        with pytest.raises(HclLimitError):
+            await aparse_hcl_to_cty(DEEP, limits=ParseLimits(max_depth=8))
+
+
+# 📄⚙️🔚
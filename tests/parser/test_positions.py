@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for locating parse errors in the source."""
+
+from hypothesis import given, strategies as st
+import pytest
+
+from pyvider.hcl import HclParsingError, parse_hcl_to_cty, parse_with_context
+from pyvider.hcl.parser.positions import LineIndex
+
+
+class TestLineIndex:
+    """Tests for offset to line and column conversion."""
+
+    def test_locates_offsets(self) -> None:
+        index = LineIndex("ab\n\ncd\n")
+        assert len(index) == 4
+        assert index.locate(0) == (1, 1)
+        assert index.locate(2) == (1, 3)
+        assert index.locate(3) == (2, 1)
+        assert index.locate(5) == (3, 2)
+        assert index.locate(7) == (4, 1)
+
+    def test_clamps_offsets_to_the_text(self) -> None:
+        index = LineIndex("ab\ncd")
+        assert index.locate(-1) == (1, 1)
+        assert index.locate(99) == (2, 3)
+
+    @given(text=st.text(alphabet="ab\n\r", max_size=30), data=st.data())
+    def test_matches_counting_newlines_property(self, text: str, data: st.DataObject) -> None:
+        offset = data.draw(st.integers(min_value=0, max_value=len(text)))
+        line = text.count("\n", 0, offset) + 1
+        column = offset - (text.rfind("\n", 0, offset) + 1) + 1
+        assert LineIndex(text).locate(offset) == (line, column)
+
+
+class TestErrorPositions:
+    """Tests for line and column on syntax errors."""
+
+    @pytest.mark.parametrize(
+        ("content", "line", "column"),
+        [
+            ("name = ", 1, 8),
+            ('a = 1\nb = "x\n', 2, 6),
+            ("a = 1\n  b = = 2\n", 2, 7),
+            ('a = 1\nresource "x" {\n  b = 2\n', 4, 1),
+        ],
+    )
+    def test_parse_hcl_to_cty_reports_position(self, content: str, line: int, column: int) -> None:
+        with pytest.raises(HclParsingError, match="Failed to parse HCL") as exc_info:
+            parse_hcl_to_cty(content)
+        assert (exc_info.value.line, exc_info.value.column) == (line, column)
+
+    def test_parse_with_context_reports_position(self) -> None:
+        with pytest.raises(HclParsingError) as exc_info:
+            parse_with_context('variable "x" {\n  default = @\n}\n', source_file="main.tf")
+        error = exc_info.value
+        assert (error.source_file, error.line, error.column) == ("main.tf", 2, 13)
+        assert str(error).endswith("(at main.tf, line 2, column 13)")
+
+    def test_transformer_errors_report_position(self) -> None:
+        with pytest.raises(HclParsingError) as exc_info:
+            parse_with_context("a = 1\na = 2\n")
+        assert exc_info.value.line == 1
+
+
+# 📄⚙️🔚
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for error-recovering parses."""
+
+from pyvider.hcl import RecoveredParse, parse_with_context, parse_with_recovery
+
+VALID = """variable "region" {
+  default = "us-east-1"
+}
+
+count = 3
+"""
+
+BROKEN = """variable "region" {
+  default = "us-east-1"
+
+resource "aws_instance" "web" {
+  ami = "ami-123
+}
+
+resource "aws_instance" "db" {
+  ami = "ami-456"
+}
+
+broken {
+  = 1
+}
+
+count = 3
+"""
+
+
+class TestParseWithRecovery:
+    """Tests for collecting every syntax error in one run."""
+
+    def test_valid_document_matches_parse_with_context(self) -> None:
+        result = parse_with_recovery(VALID)
+        assert isinstance(result, RecoveredParse)
+        assert result.ok
+        assert result.errors == ()
+        assert result.tree == parse_with_context(VALID)
+
+    def test_reports_every_error_and_keeps_the_rest(self) -> None:
+        result = parse_with_recovery(BROKEN, source_file="main.tf")
+        assert not result.ok
+        assert result.tree == {
+            "resource": [{"aws_instance": {"db": {"ami": "ami-456"}}}],
+            "count": 3,
+        }
+        assert [(e.line, e.source_file) for e in result.errors] == [
+            (4, "main.tf"),
+            (5, "main.tf"),
+            (13, "main.tf"),
+        ]
+        assert all(e.column is not None for e in result.errors)
+
+    def test_single_line_errors(self) -> None:
+        result = parse_with_recovery("a = 1\nb = \nc = 3\nd = = 4\n")
+        assert result.tree == {"a": 1, "c": 3}
+        assert [(e.line, e.column) for e in result.errors] == [(2, 5), (4, 5)]
+
+    def test_error_across_statements_is_reported_for_the_document(self) -> None:
+        result = parse_with_recovery("a = 1\nb = 2\na = 3\n")
+        assert len(result.errors) == 1
+        assert "already defined" in result.errors[0].message
+        assert result.tree["b"] == 2
+
+
+# 📄⚙️🔚
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for splitting HCL into top-level segments."""
+
+from pyvider.hcl.parser.segments import split_segments
+
+TRICKY = """# leading comment
+variable "name" {
+  default = "x}{"   # brace in a string and a comment }
+  description = <<EOT
+heredoc with } and {
+EOT
+}
+
+/* block comment
+   with { braces */
+locals { a = "${var.x} {" }
+tags = {
+  a = [1, 2]
+}
+count = 3
+"""
+
+
+class TestSplitSegments:
+    """Tests for boundary detection and segment metadata."""
+
+    def test_boundaries_ignore_nested_syntax(self) -> None:
+        segments = split_segments(TRICKY)
+        assert [(s.kind, s.name, s.start_line, s.end_line) for s in segments] == [
+            ("block", "variable", 2, 7),
+            ("block", "locals", 11, 11),
+            ("attribute", "tags", 12, 14),
+            ("attribute", "count", 15, 15),
+        ]
+
+    def test_offsets_slice_source(self) -> None:
+        for segment in split_segments(TRICKY):
+            assert TRICKY[segment.start : segment.end] == segment.text
+
+    def test_labels(self) -> None:
+        (segment,) = split_segments('resource "aws_instance" web {\n}\n')
+        assert segment.labels == ("aws_instance", "web")
+
+    def test_comparison_is_not_assignment(self) -> None:
+        (segment,) = split_segments("check {\n}\n")
+        assert segment.kind == "block"
+
+    def test_unterminated_input_is_final_segment(self) -> None:
+        segments = split_segments('a = 1\nblock "x" {\n  b = 2\n')
+        assert segments[-1].name == "block"
+        assert segments[-1].end_line == 3
+
+    def test_brace_on_a_later_line(self) -> None:
+        text = 'resource "a" "b"\n\n# body follows\n{\n  x = 1\n}\nheader "only"\ny = 2\n'
+        segments = split_segments(text)
+        assert [(s.name, s.start_line, s.end_line) for s in segments] == [
+            ("resource", 1, 6),
+            ("header", 7, 7),
+            ("y", 8, 8),
+        ]
+        assert all(text[s.start : s.end] == s.text for s in segments)
+
+    def test_code_after_block_comment(self) -> None:
+        (segment,) = split_segments("/* a\n b */ x = 1\n")
+        assert segment.name == "x"
+        assert segment.text.strip() == "x = 1"
+
+
+# 📄⚙️🔚
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for buffer and file sources."""
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from pyvider.cty import CtyObject, CtyString
+from pyvider.hcl import (
+    HclLimitError,
+    HclParsingError,
+    ParseLimits,
+    parse_file,
+    parse_files,
+    parse_hcl_to_cty,
+    parse_with_context,
+    validate_hcl,
+)
+from pyvider.hcl.parser import ParseCache
+from pyvider.hcl.parser.source import decode_source, read_source
+
+CONTENT = 'name = "café"\nresource "x" "y" {\n  size = 3\n}\n'
+
+
+class TestDecodeSource:
+    """Tests for decoding each kind of source."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_buffers_decode_to_the_same_text(self, wrap: type) -> None:
+        assert decode_source(wrap(CONTENT.encode())) == CONTENT
+
+    def test_byte_order_mark_is_dropped(self) -> None:
+        assert decode_source(b"\xef\xbb\xbf" + CONTENT.encode()) == CONTENT
+        assert decode_source("\ufeff" + CONTENT) == CONTENT
+        assert decode_source(CONTENT) is CONTENT
+
+    def test_invalid_utf8_reports_position(self) -> None:
+        with pytest.raises(HclParsingError, match="not valid UTF-8") as exc_info:
+            decode_source(b'a = 1\nb = "\xc3\xa9\xff"\n', "main.tf")
+        error = exc_info.value
+        assert (error.line, error.column, error.source_file) == (2, 7, "main.tf")
+
+
+class TestBufferInput:
+    """Tests for entry points given buffers instead of strings."""
+
+    def test_parse_hcl_to_cty_accepts_buffers(self, tmp_path: Path) -> None:
+        expected = parse_hcl_to_cty(CONTENT)
+        path = tmp_path / "main.tf"
+        path.write_bytes(CONTENT.encode())
+        with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            assert parse_hcl_to_cty(mapping) == expected
+        assert parse_hcl_to_cty(memoryview(CONTENT.encode())) == expected
+
+    def test_parse_with_context_and_validate_hcl_accept_bytes(self) -> None:
+        assert parse_with_context(CONTENT.encode()) == parse_with_context(CONTENT)
+        schema = CtyObject({"name": CtyString()})
+        assert validate_hcl(b'name = "x"\n', schema) == []
+
+    def test_text_and_bytes_share_cache_entries(self) -> None:
+        cache = ParseCache()
+        first = parse_hcl_to_cty(CONTENT, cache=cache)
+        assert parse_hcl_to_cty(CONTENT.encode(), cache=cache) is first
+
+    def test_max_bytes_counts_buffer_bytes_before_decoding(self) -> None:
+        with pytest.raises(HclLimitError):
+            parse_hcl_to_cty(b"a = 1\n" + b"\xff" * 64, limits=ParseLimits(max_bytes=32))
+
+
+class TestParseFile:
+    """Tests for parsing files by path."""
+
+    def test_parses_hcl_and_json(self, tmp_path: Path) -> None:
+        hcl = tmp_path / "main.tf"
+        hcl.write_text(CONTENT, encoding="utf-8")
+        assert parse_file(hcl) == parse_hcl_to_cty(CONTENT)
+        json = tmp_path / "vars.tf.json"
+        json.write_text('{"region": "eu-west-1"}', encoding="utf-8")
+        assert parse_file(str(json)).value["region"].value == "eu-west-1"
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.tf"
+        path.write_bytes(b"")
+        assert read_source(path) == ""
+        assert parse_file(path).value == {}
+
+    def test_errors_name_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.tf"
+        path.write_bytes(b'a = "x\xff"\n')
+        with pytest.raises(HclParsingError, match="not valid UTF-8") as exc_info:
+            parse_file(path)
+        assert exc_info.value.source_file == str(path)
+        with pytest.raises(HclParsingError, match="Failed to read HCL file") as exc_info:
+            parse_file(tmp_path / "missing.tf")
+        assert exc_info.value.source_file == str(tmp_path / "missing.tf")
+
+    def test_parse_files_reads_with_a_byte_order_mark(self, tmp_path: Path) -> None:
+        path = tmp_path / "main.tf"
+        path.write_bytes(b"\xef\xbb\xbf" + CONTENT.encode())
+        assert parse_files([path], workers=1) == [parse_with_context(CONTENT)]
+
+
+# 📄⚙️🔚
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for per-phase parse stats."""
+
+from pathlib import Path
+import time
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyList, CtyNumber, CtyObject
+from pyvider.hcl import ParseStats, parse_hcl_to_cty, parse_with_context
+from pyvider.hcl.parser import DiskParseCache, ParseCache
+
+ATTRIBUTES = "a = [1, 2]\n"
+BLOCK = 'resource "x" "y" {\n  name = "café"\n}\n'
+
+
+class TestParseStats:
+    """Tests for what each entry point records."""
+
+    def test_phases_without_a_schema(self) -> None:
+        stats = ParseStats()
+        parse_hcl_to_cty(BLOCK, stats=stats)
+        assert set(stats.seconds) == {"decode", "parse", "infer"}
+        assert stats.calls == 1
+        assert stats.bytes_in == len(BLOCK.encode())
+        assert stats.fast_path == 0
+        assert stats.total_seconds == sum(stats.seconds.values())
+
+    def test_phases_with_a_schema_and_node_count(self) -> None:
+        stats = ParseStats()
+        parse_hcl_to_cty(ATTRIBUTES, CtyObject({"a": CtyList(element_type=CtyNumber())}), stats=stats)
+        assert set(stats.seconds) == {"decode", "parse", "validate"}
+        assert stats.nodes == 4
+        assert stats.fast_path == 1
+
+    def test_cache_hits_skip_the_other_phases(self) -> None:
+        stats = ParseStats()
+        cache = ParseCache()
+        parse_hcl_to_cty(BLOCK, cache=cache, stats=stats)
+        nodes, parse_seconds = stats.nodes, stats.seconds["parse"]
+        parse_hcl_to_cty(BLOCK, cache=cache, stats=stats)
+        assert (stats.calls, stats.cache_hits) == (2, 1)
+        assert (stats.nodes, stats.seconds["parse"]) == (nodes, parse_seconds)
+        assert "cache" in stats.seconds
+
+    def test_parse_with_context_and_disk_cache_hits(self, tmp_path: Path) -> None:
+        stats = ParseStats()
+        disk = DiskParseCache(tmp_path)
+        parse_with_context(BLOCK.encode(), disk_cache=disk, stats=stats)
+        parse_with_context(BLOCK.encode(), disk_cache=disk, stats=stats)
+        parse_with_context(ATTRIBUTES, stats=stats)
+        assert set(stats.seconds) == {"decode", "parse"}
+        assert (stats.disk_cache_hits, stats.fast_path) == (1, 1)
+
+    def test_counting_values_is_charged_to_parse(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        count_nodes = ParseStats.count_nodes
+
+        def _slow_count(self: ParseStats, raw_data: Any) -> None:
+            time.sleep(0.05)
+            count_nodes(self, raw_data)
+
+        monkeypatch.setattr(ParseStats, "count_nodes", _slow_count)
+        for parse in (parse_hcl_to_cty, parse_with_context):
+            stats = ParseStats()
+            start = time.perf_counter()
+            parse(BLOCK, stats=stats)
+            elapsed = time.perf_counter() - start
+            assert stats.seconds["parse"] >= 0.05
+            assert elapsed - stats.total_seconds < 0.05
+
+    def test_callback_and_reset(self) -> None:
+        phases: list[str] = []
+        stats = ParseStats(on_phase=lambda phase, seconds: phases.append(phase))
+        parse_hcl_to_cty(BLOCK, cache=ParseCache(), stats=stats)
+        assert phases == ["cache", "decode", "parse", "infer", "cache"]
+        stats.reset()
+        assert (stats.calls, stats.nodes, stats.seconds) == (0, 0, {})
+        assert stats.on_phase is not None
+
+
+# 📄⚙️🔚
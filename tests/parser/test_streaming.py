@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for iter_blocks streaming parse."""
+
+from collections.abc import Iterator
+import io
+
+import pytest
+
+from pyvider.cty import CtyValue
+from pyvider.hcl import HclParsingError, iter_blocks, parse_with_context
+
+DOCUMENT = """
+terraform {
+  required_version = ">= 1.0"
+}
+
+variable "region" {
+  default = "us-east-1"
+}
+
+resource "aws_instance" "web" {
+  ami = "ami-123"
+  ingress {
+    from_port = 80
+  }
+}
+
+count = 3
+"""
+
+
+class TestIterBlocks:
+    """Tests for block boundaries, laziness and error reporting."""
+
+    def test_blocks_in_order(self) -> None:
+        blocks = list(iter_blocks(io.StringIO(DOCUMENT)))
+        assert [block.address for block in blocks] == [
+            "terraform",
+            "variable.region",
+            "resource.aws_instance.web",
+            "count",
+        ]
+        assert blocks[1].body == {"default": "us-east-1"}
+        assert blocks[2].body["ingress"] == [{"from_port": 80}]
+        assert blocks[3].kind == "attribute"
+        assert blocks[3].body == 3
+        assert (blocks[2].start_line, blocks[2].end_line) == (10, 15)
+
+    def test_bodies_match_full_parse(self) -> None:
+        full = parse_with_context(DOCUMENT)
+        blocks = {block.address: block.body for block in iter_blocks(DOCUMENT)}
+        assert blocks["resource.aws_instance.web"] == full["resource"][0]["aws_instance"]["web"]
+        assert blocks["terraform"] == full["terraform"][0]
+
+    def test_to_cty(self) -> None:
+        block = next(iter_blocks(DOCUMENT, to_cty=True))
+        assert isinstance(block.body, CtyValue)
+        assert block.body.value["required_version"].value == ">= 1.0"
+
+    def test_yields_before_reading_everything(self) -> None:
+        consumed = []
+
+        def lines() -> Iterator[str]:
+            for i in range(1000):
+                consumed.append(i)
+                yield f"a_{i} = {i}\n"
+
+        first = next(iter_blocks(lines()))
+        assert first.body == 0
+        assert len(consumed) <= 2
+
+    def test_error_after_earlier_blocks(self) -> None:
+        stream = iter_blocks("a = 1\nbroken {\n  = \n}\n", source_file="main.tf")
+        assert next(stream).body == 1
+        with pytest.raises(HclParsingError) as exc_info:
+            next(stream)
+        assert exc_info.value.source_file == "main.tf"
+        assert exc_info.value.line == 3
+        assert exc_info.value.column == 3
+
+    def test_brace_on_a_later_line(self) -> None:
+        text = 'resource "a" "b"\n{\n  x = 1\n}\n'
+        (block,) = iter_blocks(text)
+        assert (block.address, block.body, block.end_line) == ("resource.a.b", {"x": 1}, 4)
+
+    def test_statements_sharing_a_line_are_rejected(self) -> None:
+        stream = iter_blocks('resource "a" "one" {\n  x = 1\n} resource "a" "two" {\n  y = 2\n}\n')
+        with pytest.raises(HclParsingError, match="shares a line") as exc_info:
+            next(stream)
+        assert exc_info.value.line == 1
+
+
+# 📄⚙️🔚
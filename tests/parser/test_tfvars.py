@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the attribute-only fast path."""
+
+from typing import Any
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+import pytest
+
+from pyvider.hcl import parse_hcl_to_cty
+from pyvider.hcl.parser import loader
+from pyvider.hcl.parser.loader import load_raw
+from pyvider.hcl.parser.tfvars import scan_attributes
+
+FAST_PATH_DOCUMENTS = [
+    'region = "us-east-1"\ncount = 3\nratio = 0.1\nenabled = true\nnothing = null\n',
+    'name = "x"  # trailing comment\nother = "y" // another\n/* block */\nlast = -7\n',
+    'escapes = "tab\\there \\"quoted\\" back\\\\slash \\\\n"\n',
+    'unicode = "e\\u0301 é"\n',
+    'zones = ["a", "b",\n  "c", # comment\n]\nempty = []\nnested = [[1, 2], [3]]\n',
+    'tags = {\n  Name = "web"\n  "quoted key" = 1,\n  colon: true\n}\nempty = {}\n',
+    'objects = [{ a = 1 }, { a = 2 }]\nmixed = [1, "a"]\nnulls = { a = null }\n',
+    "text = <<EOT\n  hello\n    world\n\nEOT\ntrimmed = <<-EOT\n    hello\n      world\n    EOT\nafter = 1\n",
+    "",
+    "# only a comment\n",
+    "no_trailing_newline = 1",
+]
+
+FALLBACK_DOCUMENTS = [
+    'resource "a" "b" {\n}\n',
+    'name = "${var.prefix}-web"\n',
+    "total = 1 + 2\n",
+    "big = 1e3\n",
+    "ref = var.region\n",
+    "list = [1,\n  -2]\n",
+    "text = <<EOT\nvalue ${x}\nEOT\n",
+    "dup = 1\ndup = 2\n",
+    'crlf = "x"\r\n',
+    "broken = [1, 2\n",
+]
+
+
+@pytest.mark.parametrize("content", FAST_PATH_DOCUMENTS)
+def test_fast_path_matches_full_parser(content: str) -> None:
+    fast = scan_attributes(content)
+    assert fast is not None
+    full = load_raw(content, fast_path=False)
+    assert repr(fast) == repr(full)
+
+
+@pytest.mark.parametrize("content", FALLBACK_DOCUMENTS)
+def test_falls_back_outside_subset(content: str) -> None:
+    assert scan_attributes(content) is None
+
+
+def test_parse_hcl_to_cty_skips_full_parser(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(content: str) -> Any:
+        raise AssertionError("full parser used")
+
+    monkeypatch.setattr(loader, "_loads", _fail)
+    result = parse_hcl_to_cty('name = "example"\nports = [80, 443]\n')
+    assert result.value["name"].value == "example"
+
+
+def test_fallback_still_reports_errors() -> None:
+    with pytest.raises(Exception, match="Unexpected"):
+        load_raw("broken = [1, 2\n")
+
+
+_scalars = st.one_of(
+    st.sampled_from(["true", "false", "null", '""', '"a b"', '"x\\ty"', '"q\\"q"', '"é"']),
+    st.integers(min_value=-(10**6), max_value=10**6).map(str),
+    st.decimals(min_value=-1000, max_value=1000, places=2, allow_nan=False).map(str),
+)
+_keys = st.from_regex(r"[a-z_][a-z0-9_]{0,6}", fullmatch=True)
+_values = st.recursive(
+    _scalars,
+    lambda children: st.one_of(
+        st.lists(children, max_size=4).map(lambda items: "[" + ", ".join(items) + "]"),
+        st.dictionaries(_keys, children, max_size=4).map(
+            lambda items: "{\n" + "".join(f"  {key} = {value}\n" for key, value in items.items()) + "}"
+        ),
+    ),
+    max_leaves=12,
+)
+
+
+@given(document=st.dictionaries(_keys, _values, min_size=1, max_size=6))
+@settings(max_examples=75, deadline=None, suppress_health_check=[HealthCheck.differing_executors])
+def test_fast_path_equivalence_property(document: dict[str, str]) -> None:
+    content = "".join(f"{key} = {value}\n" for key, value in document.items())
+    fast = scan_attributes(content)
+    full = load_raw(content, fast_path=False)
+    if fast is not None:
+        assert repr(fast) == repr(full)
+
+
+# 📄⚙️🔚
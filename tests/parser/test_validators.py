@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for compiled schema validators."""
+
+from typing import Any
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtyString,
+    CtyTuple,
+    CtyType,
+)
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.hcl import (
+    HclParsingError,
+    compile_validator,
+    create_resource_cty,
+    create_variable_cty,
+    parse_hcl_to_cty,
+)
+from pyvider.hcl.parser import validators
+from pyvider.hcl.parser.validators import clear_validator_cache
+
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "count": CtyNumber(),
+        "enabled": CtyBool(),
+        "zones": CtyList(element_type=CtyString()),
+        "tags": CtyMap(element_type=CtyString()),
+        "extra": CtyDynamic(),
+        "note": CtyString(),
+    },
+    optional_attributes=frozenset({"note"}),
+)
+
+VALID = {
+    "name": "web",
+    "count": 3,
+    "enabled": True,
+    "zones": ["a", "b"],
+    "tags": {"env": "prod", "é": "x"},
+    "extra": {"nested": [1, 2]},
+}
+
+
+def _outcome(validate: Any, raw: Any) -> Any:
+    try:
+        result = validate(raw)
+    except CtyValidationError as e:
+        return type(e), str(e)
+    return result, result.raw_value
+
+
+def test_compiled_matches_validate() -> None:
+    result = compile_validator(SCHEMA)(VALID)
+    expected = SCHEMA.validate(VALID)
+    assert result == expected
+    assert result.raw_value == expected.raw_value
+    assert result["note"].is_null
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        dict(VALID, count="7"),
+        dict(VALID, enabled="true"),
+        dict(VALID, zones="a"),
+        dict(VALID, unknown=1),
+        {key: value for key, value in VALID.items() if key != "name"},
+        dict(VALID, tags={"e\u0301": "a", "\u00e9": "b"}),
+        dict(VALID, count="${var.count}"),
+        None,
+    ],
+)
+def test_data_the_compiled_form_refuses_gets_validate_results(raw: Any) -> None:
+    assert _outcome(compile_validator(SCHEMA), raw) == _outcome(SCHEMA.validate, raw)
+
+
+def test_types_without_a_compiled_form_are_validated_generically() -> None:
+    schema = CtyObject(attribute_types={"pair": CtyTuple(element_types=(CtyString(), CtyNumber()))})
+    for raw in ({"pair": ["a", 1]}, {"pair": [1]}):
+        assert _outcome(compile_validator(schema), raw) == _outcome(schema.validate, raw)
+
+
+def test_a_schema_reuses_its_compiled_validator() -> None:
+    clear_validator_cache()
+    schema = CtyObject(attribute_types={"a": CtyList(element_type=CtyString())})
+    compile_validator(schema)({"a": ["x"]})
+    compile_validator(schema)({"a": ["y"]})
+    assert (validators._compiled.hits, validators._compiled.misses) == (1, 1)
+
+
+def test_factories_reuse_their_schemas() -> None:
+    clear_validator_cache()
+    for port in (80, 443):
+        create_variable_cty("port", "number", port, description="Listen port")
+        create_resource_cty(
+            "aws_instance", "web", {"ami": "a", "port": port}, {"ami": "string", "port": "number"}
+        )
+        create_resource_cty("aws_instance", "db", {"ami": "a", "port": port})
+    assert (validators._compiled.hits, validators._compiled.misses) == (5, 5)
+
+    reordered = create_resource_cty("aws_instance", "db", {"port": 1, "ami": "a"})
+    body = reordered["resource"][0]["aws_instance"][0]["db"]
+    assert list(body.type.attribute_types) == ["port", "ami"]
+
+
+def test_equal_schemas_give_results_of_their_own_type() -> None:
+    first = CtyObject(attribute_types={"a": CtyString(), "b": CtyString()})
+    second = CtyObject(attribute_types={"b": CtyString(), "a": CtyString()})
+    assert first == second
+    raw = {"a": "x", "b": "y"}
+    compile_validator(first)(raw)
+    result = compile_validator(second)(raw)
+    assert result.type is second
+    assert list(result.type.attribute_types) == ["b", "a"]
+    assert _outcome(compile_validator(second), {}) == _outcome(second.validate, {})
+
+
+def test_parse_hcl_to_cty_uses_compiled_validator() -> None:
+    schema = CtyObject(attribute_types={"name": CtyString(), "count": CtyNumber()})
+    result = parse_hcl_to_cty('name = "web"\ncount = 2\n', schema)
+    assert result == schema.validate({"name": "web", "count": 2})
+    with pytest.raises(HclParsingError, match="Schema validation failed"):
+        parse_hcl_to_cty('name = "web"\n', schema)
+
+
+_types = st.recursive(
+    st.sampled_from([CtyString(), CtyNumber(), CtyBool(), CtyDynamic()]),
+    lambda children: st.one_of(
+        st.builds(lambda element: CtyList(element_type=element), children),
+        st.builds(lambda element: CtyMap(element_type=element), children),
+        st.builds(
+            lambda attributes, optional: CtyObject(
+                attribute_types=attributes, optional_attributes=frozenset(optional & attributes.keys())
+            ),
+            st.dictionaries(st.sampled_from(["a", "b", "é"]), children, max_size=3),
+            st.sets(st.sampled_from(["a", "b", "é"])),
+        ),
+    ),
+    max_leaves=8,
+)
+
+_raw = st.recursive(
+    st.one_of(
+        st.none(),
+        st.booleans(),
+        st.integers(),
+        st.floats(allow_nan=False),
+        st.text(max_size=3),
+        st.sampled_from(["true", "1"]),
+    ),
+    lambda children: st.one_of(
+        st.lists(children, max_size=3),
+        st.dictionaries(st.sampled_from(["a", "b", "é", "é"]), children, max_size=3),
+    ),
+    max_leaves=10,
+)
+
+
+@given(schema=_types, raw=_raw)
+@settings(max_examples=200, deadline=None, suppress_health_check=[HealthCheck.differing_executors])
+def test_compiled_equivalence_property(schema: CtyType[Any], raw: Any) -> None:
+    assert _outcome(compile_validator(schema), raw) == _outcome(schema.validate, raw)
+
+
+# 📄⚙️🔚
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for validation-only schema checks."""
+
+from typing import Any
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+)
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.cty.path import CtyPath, GetAttrStep, IndexStep, KeyStep
+from pyvider.hcl import (
+    HclParsingError,
+    HclSchemaError,
+    SchemaViolation,
+    find_violations,
+    parse_hcl_to_cty,
+    validate_hcl,
+)
+
+RULE = CtyObject(attribute_types={"port": CtyNumber(), "cidrs": CtyList(element_type=CtyString())})
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "enabled": CtyBool(),
+        "tags": CtyMap(element_type=CtyString()),
+        "rules": CtyList(element_type=RULE),
+        "note": CtyString(),
+    },
+    optional_attributes=frozenset({"note"}),
+)
+
+VALID = """
+name    = "web"
+enabled = true
+tags    = { env = "prod" }
+rules   = [{ port = 443, cidrs = ["0.0.0.0/0"] }]
+"""
+
+INVALID = """
+enabled = "maybe"
+tags    = { env = ["prod"] }
+rules   = [{ port = 443, cidrs = "0.0.0.0/0" }, { port = "http", cidrs = [], extra = 1 }]
+"""
+
+
+def _path(*steps: Any) -> CtyPath:
+    return CtyPath(steps=steps)
+
+
+def test_valid_document_has_no_violations() -> None:
+    assert validate_hcl(VALID, SCHEMA) == []
+    parse_hcl_to_cty(VALID, SCHEMA)
+
+
+def test_every_violation_is_reported_with_path_and_types() -> None:
+    violations = validate_hcl(INVALID, SCHEMA)
+    found = {(str(v.path), v.expected, v.actual) for v in violations}
+    assert found == {
+        ("name", "string", "absent"),
+        ("enabled", "bool", "string"),
+        ("tags['env']", "string", "tuple"),
+        ("rules[0].cidrs", "list(string)", "string"),
+        ("rules[1].extra", "absent", "number"),
+        ("rules[1].port", "number", "string"),
+    }
+    assert all(isinstance(v, SchemaViolation) for v in violations)
+    with pytest.raises(HclParsingError):
+        parse_hcl_to_cty(INVALID, SCHEMA)
+
+
+def test_violation_str_names_the_path() -> None:
+    violation = SchemaViolation(
+        path=_path(GetAttrStep("rules"), IndexStep(0)), expected="object", actual="string", message="Bad"
+    )
+    assert str(violation) == "rules[0]: Bad"
+
+
+def test_types_without_a_compiled_check_are_validated() -> None:
+    schema = CtyObject(
+        attribute_types={
+            "pair": CtyTuple(element_types=(CtyString(), CtyNumber())),
+            "ids": CtySet(element_type=CtyNumber()),
+        }
+    )
+    violations = find_violations({"pair": ["a", "b"], "ids": [1, "x"]}, schema)
+    assert [(v.path, v.expected, v.actual) for v in violations] == [
+        (_path(GetAttrStep("pair"), IndexStep(1)), "number", "string"),
+        (_path(GetAttrStep("ids")), "set(number)", "tuple"),
+    ]
+
+
+def test_invalid_keys_are_reported() -> None:
+    schema = CtyMap(element_type=CtyDynamic())
+    violations = find_violations({"é": 1, "é": 2}, schema)
+    assert len(violations) == 1
+    assert "NFC" in violations[0].message
+    assert find_violations({"k": {"n": [1]}}, schema) == []
+    assert find_violations({"k": {"é": 1, "é": 2}}, schema)[0].path == _path(KeyStep("k"))
+
+
+MULTILINE = """
+name    = "web"
+enabled = true
+tags = {
+  env  = "prod"
+  team = 3
+}
+rules = [
+  {
+    port  = 443
+    cidrs = ["0.0.0.0/0"]
+  },
+  {
+    port  = "http"
+    cidrs = []
+  },
+]
+"""
+
+BLOCKS = """
+resource "aws_instance" "web" {
+  ami = "ami-123"
+
+  ingress {
+    port = 22
+  }
+  ingress {
+    port = "ssh"
+  }
+}
+
+resource "aws_instance" "db" {
+  ami = 42
+}
+"""
+
+INSTANCE = CtyObject(
+    attribute_types={"ami": CtyString(), "ingress": CtyList(element_type=CtyObject({"port": CtyNumber()}))},
+    optional_attributes=frozenset({"ingress"}),
+)
+BLOCK_SCHEMA = CtyObject(
+    {"resource": CtyList(element_type=CtyObject({"aws_instance": CtyMap(element_type=INSTANCE)}))}
+)
+
+
+def test_violations_carry_source_lines() -> None:
+    lines = {str(v.path): v.line for v in validate_hcl(MULTILINE, SCHEMA)}
+    assert lines == {"tags['team']": 6, "rules[1].port": 14}
+
+
+def test_violations_in_blocks_carry_source_lines() -> None:
+    lines = {str(v.path): v.line for v in validate_hcl(BLOCKS, BLOCK_SCHEMA)}
+    assert lines == {
+        "resource[0].aws_instance['web'].ingress[1].port": 9,
+        "resource[1].aws_instance['db'].ami": 14,
+    }
+
+
+def test_missing_attribute_points_at_its_object() -> None:
+    violations = validate_hcl("enabled = true\nrules = [{\n  port = 1\n}]\n", SCHEMA)
+    lines = {str(v.path): v.line for v in violations}
+    assert lines["name"] is None
+    assert lines["rules[0].cidrs"] == 2
+
+
+def test_collect_violations_reports_every_violation() -> None:
+    with pytest.raises(HclSchemaError) as excinfo:
+        parse_hcl_to_cty(MULTILINE, SCHEMA, collect_violations=True)
+    error = excinfo.value
+    assert [str(v.path) for v in error.violations] == ["tags['team']", "rules[1].port"]
+    assert error.line == 6
+    assert "2 violation(s)" in error.message
+    assert "line 14: rules[1].port" in error.message
+    assert isinstance(error, HclParsingError)
+
+
+def test_without_collect_violations_only_the_first_is_reported() -> None:
+    with pytest.raises(HclParsingError) as excinfo:
+        parse_hcl_to_cty(MULTILINE, SCHEMA)
+    assert not isinstance(excinfo.value, HclSchemaError)
+    assert parse_hcl_to_cty(VALID, SCHEMA, collect_violations=True) == parse_hcl_to_cty(VALID, SCHEMA)
+
+
+def test_parse_errors_still_raise() -> None:
+    with pytest.raises(HclParsingError):
+        validate_hcl("name = ", SCHEMA)
+
+
+_types = st.recursive(
+    st.sampled_from([CtyString(), CtyNumber(), CtyBool(), CtyDynamic()]),
+    lambda children: st.one_of(
+        st.builds(lambda element: CtyList(element_type=element), children),
+        st.builds(lambda element: CtyMap(element_type=element), children),
+        st.builds(lambda element: CtySet(element_type=element), children),
+        st.builds(
+            lambda attributes, optional: CtyObject(
+                attribute_types=attributes, optional_attributes=frozenset(optional & attributes.keys())
+            ),
+            st.dictionaries(st.sampled_from(["a", "b", "é"]), children, max_size=3),
+            st.sets(st.sampled_from(["a", "b", "é"])),
+        ),
+    ),
+    max_leaves=8,
+)
+
+_raw = st.recursive(
+    st.one_of(
+        st.none(),
+        st.booleans(),
+        st.integers(),
+        st.floats(allow_nan=False),
+        st.text(max_size=3),
+        st.sampled_from(["true", "1", "1e3"]),
+    ),
+    lambda children: st.one_of(
+        st.lists(children, max_size=3),
+        st.dictionaries(st.sampled_from(["a", "b", "é", "é"]), children, max_size=3),
+    ),
+    max_leaves=10,
+)
+
+
+@given(schema=_types, raw=_raw)
+@settings(max_examples=200, deadline=None, suppress_health_check=[HealthCheck.differing_executors])
+def test_violations_agree_with_validate_property(schema: CtyType[Any], raw: Any) -> None:
+    try:
+        schema.validate(raw)
+    except CtyValidationError:
+        assert find_violations(raw, schema)
+    else:
+        assert find_violations(raw, schema) == []
+
+
+# 📄⚙️🔚
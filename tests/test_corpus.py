@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the synthetic Terraform corpus generator."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.corpus import CorpusSpec, generate_corpus, generate_file, generate_tfvars, main
+from pyvider.hcl import ParseStats, parse_files, parse_hcl_to_cty, parse_with_context
+
+
+class TestGenerateCorpus:
+    """Tests for the shape and determinism of generated trees."""
+
+    def test_same_spec_same_files(self) -> None:
+        spec = CorpusSpec(seed=7, heredoc_lines=2)
+        assert generate_corpus(spec) == generate_corpus(CorpusSpec(seed=7, heredoc_lines=2))
+        assert generate_corpus(spec) != generate_corpus(CorpusSpec(seed=8, heredoc_lines=2))
+
+    def test_layout(self) -> None:
+        files = generate_corpus(CorpusSpec(modules=2, files_per_module=9))
+        assert len(files) == 3 + 2 * 9
+        assert "modules/network_0/variables.tf" in files
+        assert "modules/storage_1/extra_8.tf" in files
+
+    def test_files_do_not_depend_on_other_counts(self) -> None:
+        small = generate_corpus(CorpusSpec(modules=1))
+        large = generate_corpus(CorpusSpec(modules=4))
+        assert small["modules/network_0/main.tf"] == large["modules/network_0/main.tf"]
+
+    def test_block_counts_follow_the_file(self) -> None:
+        spec = CorpusSpec(blocks_per_file=6)
+        assert len(parse_with_context(generate_file(spec, "variables.tf"))["variable"]) == 6
+        assert len(parse_with_context(generate_file(spec, "outputs.tf"))["output"]) == 6
+
+    def test_heredocs_and_expression_density(self) -> None:
+        literal = generate_file(CorpusSpec(expression_density=0.0))
+        assert "var." not in literal
+        assert "<<-EOT" not in literal
+        dense = generate_file(
+            CorpusSpec(expression_density=1.0, nesting_depth=0, heredoc_lines=4), "compute.tf"
+        )
+        for block in parse_with_context(dense)["resource"]:
+            ((body,),) = (labels.values() for labels in block.values())
+            assert body["user_data"].count("\n") == 3
+            assert all("${" in value for value in body.values())
+
+    def test_tfvars_take_the_fast_path(self) -> None:
+        spec = CorpusSpec(blocks_per_file=20, nesting_depth=3)
+        assert generate_corpus(spec)["terraform.tfvars"] == generate_tfvars(spec)
+        stats = ParseStats()
+        assert len(parse_hcl_to_cty(generate_tfvars(spec), stats=stats).value) == 21
+        assert stats.fast_path == 1
+
+    def test_rejects_invalid_spec(self) -> None:
+        with pytest.raises(ValueError):
+            CorpusSpec(expression_density=1.5)
+        with pytest.raises(ValueError):
+            CorpusSpec(files_per_module=0)
+
+
+class TestCorpusParses:
+    """Tests that generated trees are valid HCL."""
+
+    def test_fixture_tree_parses(self, terraform_corpus: Path) -> None:
+        paths = sorted(terraform_corpus.rglob("*.tf*"))
+        assert len(paths) == 11
+        assert all(isinstance(raw, dict) for raw in parse_files(paths, workers=1))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_deep_dense_files_parse(self, seed: int) -> None:
+        spec = CorpusSpec(seed=seed, nesting_depth=4, heredoc_lines=5, expression_density=0.8)
+        for content in generate_corpus(spec).values():
+            parse_with_context(content)
+
+    def test_cli_writes_the_tree(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main([str(tmp_path), "--modules", "1", "--files", "2", "--seed", "3"]) == 0
+        assert "wrote 5 files" in capsys.readouterr().out
+        assert (tmp_path / "modules/network_0/variables.tf").read_text() == generate_corpus(
+            CorpusSpec(modules=1, files_per_module=2, seed=3)
+        )["modules/network_0/variables.tf"]
+
+
+# 📄⚙️🔚
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for lazy package imports and the import-time budget."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pyvider.hcl
+from pyvider.hcl import factories, parser
+
+# Seconds `import pyvider.hcl` may take in a fresh interpreter. Importing
+# everything eagerly took several times this.
+IMPORT_BUDGET = 0.05
+
+_CHILD = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import pyvider.hcl
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": sorted(set(sys.modules) - before)}))
+"""
+
+
+def _import_in_fresh_interpreter() -> dict[str, object]:
+    completed = subprocess.run([sys.executable, "-c", _CHILD], check=True, capture_output=True, text=True)
+    result: dict[str, object] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+class TestLazyImports:
+    """Tests for what importing the package costs."""
+
+    def test_import_loads_nothing_but_the_package(self) -> None:
+        loaded = _import_in_fresh_interpreter()["loaded"]
+        assert set(loaded) <= {"pyvider", "pyvider.hcl", "pyvider.hcl._lazy"}  # type: ignore[arg-type]
+
+    def test_import_time_budget(self) -> None:
+        seconds = min(float(_import_in_fresh_interpreter()["seconds"]) for _ in range(3))  # type: ignore[arg-type]
+        assert seconds < IMPORT_BUDGET
+
+    @pytest.mark.parametrize("package", [pyvider.hcl, parser, factories])
+    def test_every_export_resolves(self, package: object) -> None:
+        names = package.__all__  # type: ignore[attr-defined]
+        assert set(names) <= set(dir(package))
+        for name in names:
+            assert getattr(package, name) is not None
+
+    def test_exports_are_the_defining_objects(self) -> None:
+        from pyvider.hcl.parser.base import parse_hcl_to_cty
+
+        assert pyvider.hcl.parse_hcl_to_cty is parse_hcl_to_cty
+        assert parser.parse_hcl_to_cty is parse_hcl_to_cty
+        assert isinstance(pyvider.hcl.__version__, str)
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            pyvider.hcl.missing  # noqa: B018
+
+
+# 📄⚙️🔚
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for tracing spans around parse stages and factory calls."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+from provide.foundation.tracer import Span, with_span
+import pytest
+
+from pyvider.cty import CtyNumber, CtyObject, CtyString
+from pyvider.hcl import (
+    HclFactoryError,
+    HclParsingError,
+    configure_tracing,
+    create_resource_cty,
+    create_variable_cty,
+    parse_file,
+    parse_hcl_to_cty,
+    parse_with_context,
+    validate_hcl,
+)
+from pyvider.hcl.parser import ParseCache
+from pyvider.hcl.tracing import traced, tracing_enabled
+
+CONTENT = 'name = "café"\n'
+
+
+@pytest.fixture
+def spans() -> Iterator[list[Span]]:
+    """Turns tracing on with a list as the exporter, and off afterwards."""
+    exported: list[Span] = []
+    configure_tracing(exporter=exported.append)
+    yield exported
+    configure_tracing(enabled=False)
+
+
+def _names(spans: list[Span]) -> list[str]:
+    return [span.name for span in spans]
+
+
+class TestTracingOff:
+    """Tests for the default, untraced state."""
+
+    def test_off_by_default(self) -> None:
+        assert not tracing_enabled()
+        with traced("parse", source=CONTENT) as span:
+            assert span is None
+
+
+class TestPipelineSpans:
+    """Tests for spans around the parse entry points and their stages."""
+
+    def test_stages_nest_under_the_call(self, spans: list[Span]) -> None:
+        with with_span("provider.apply") as outer:
+            parse_hcl_to_cty(CONTENT, CtyObject({"name": CtyString()}))
+        assert _names(spans) == ["hcl.decode", "hcl.parse", "hcl.validate", "hcl.parse_hcl_to_cty"]
+        root = spans[-1]
+        assert root.parent_id == outer.span_id
+        assert all(span.parent_id == root.span_id for span in spans[:-1])
+        assert root.tags == {"hcl.size": 15, "hcl.schema": "object", "hcl.outcome": "ok"}
+
+    def test_cache_hits(self, spans: list[Span]) -> None:
+        cache = ParseCache()
+        parse_hcl_to_cty(CONTENT, cache=cache)
+        spans.clear()
+        parse_with_context(CONTENT, cache=ParseCache())
+        parse_hcl_to_cty(CONTENT, cache=cache)
+        assert _names(spans)[-2:] == ["hcl.cache", "hcl.parse_hcl_to_cty"]
+        assert spans[-1].tags["hcl.outcome"] == "cache_hit"
+        assert "hcl.parse" in _names(spans)
+
+    def test_errors_are_exported_with_their_outcome(self, spans: list[Span]) -> None:
+        with pytest.raises(HclParsingError):
+            parse_with_context("a = ", source_file=Path("main.tf"))
+        assert _names(spans) == ["hcl.decode", "hcl.parse", "hcl.parse_with_context"]
+        root = spans[-1]
+        assert (root.status, root.tags["hcl.outcome"], root.tags["hcl.file"]) == (
+            "error",
+            "HclParsingError",
+            "main.tf",
+        )
+
+    def test_parse_file_and_validate_hcl(self, spans: list[Span], tmp_path: Path) -> None:
+        path = tmp_path / "main.tf"
+        path.write_text(CONTENT, encoding="utf-8")
+        parse_file(path)
+        assert _names(spans)[0] == "hcl.read"
+        assert spans[-1].tags["hcl.file"] == str(path)
+        assert spans[-2].name == "hcl.parse_hcl_to_cty"
+        spans.clear()
+        validate_hcl(CONTENT, CtyObject({"name": CtyNumber()}))
+        assert _names(spans) == ["hcl.decode", "hcl.parse", "hcl.violations", "hcl.validate_hcl"]
+        assert spans[-1].tags["hcl.schema"] == "object"
+
+
+class TestFactorySpans:
+    """Tests for spans around factory calls."""
+
+    def test_variable_and_resource(self, spans: list[Span]) -> None:
+        create_variable_cty("region", "string", "us-east-1")
+        create_resource_cty("aws_instance", r_name="web", attributes_py={"ami": "ami-1"})
+        assert [span.tags for span in spans] == [
+            {"hcl.schema": "string", "hcl.variable": "region", "hcl.outcome": "ok"},
+            {"hcl.schema": "aws_instance", "hcl.resource": "web", "hcl.outcome": "ok"},
+        ]
+
+    def test_factory_failure(self, spans: list[Span]) -> None:
+        with pytest.raises(HclFactoryError):
+            create_variable_cty("region", "list(", None)
+        assert spans[-1].tags["hcl.outcome"] == "HclFactoryError"
+
+
+# 📄⚙️🔚